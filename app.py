@@ -1,14 +1,33 @@
 """Main application for Frequency Analysis using Dash."""
 
+import functools
+import itertools
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from dash import Output, Input, State, dcc, html
+from urllib.parse import urlencode
+from dash import Output, Input, State, dcc, html, ClientsideFunction, Patch
+from dash.exceptions import PreventUpdate
 import dash_bootstrap_components as dbc
 import dash
+import flask
 import pandas as pd
 import plotly.io as pio
 from pyconfig import appConfig
 from pytemplate import fktemplate
 import pylayout, pyfunc, pylayoutfunc, pyfigure  # pylint: disable=multiple-imports
+from pystore import DATASET_STORE
+from pyapi import api, APIError, parse_options, parse_bootstrap_options
+from pyupload import upload
+import pyjobs
+import pystats
+import pydecimate
+import pyresults
+import pyexport
+import pyupload
+import pycache
+import pystore
 
 pio.templates.default = fktemplate
 
@@ -35,8 +54,11 @@ app = dash.Dash(
     ],
     suppress_callback_exceptions=True,
     prevent_initial_callbacks=True,
+    background_callback_manager=pyjobs.BACKGROUND_CALLBACK_MANAGER,
 )
 server = app.server
+server.register_blueprint(api)
+server.register_blueprint(upload)
 
 # LAYOUT APP
 app.layout = dbc.Container(
@@ -50,6 +72,8 @@ app.layout = dbc.Container(
                         html.Hr(),
                         pylayout.HTML_ROW_NOTE,
                         pylayout.HTML_ROW_BUTTON_UPLOAD,
+                        pylayout.HTML_ROW_UPLOAD_LARGE,
+                        pylayout.HTML_ROW_UPLOAD_OPTIONS,
                         html.Hr(),
                         pylayout.HTML_ROW_BUTTON_EXAMPLE,
                         pylayout.HTML_ROW_BUTTON_DOWNLOAD_TABLE,
@@ -67,6 +91,7 @@ app.layout = dbc.Container(
             ],
         ),
         # pylayout._HTML_TROUBLESHOOTER,
+        pylayout.HTML_STORES,
         pylayout.HTML_FOOTER,
     ],
     fluid=True,
@@ -76,50 +101,429 @@ app.layout = dbc.Container(
 # CALLBACK FUNCTION
 
 
+EXAMPLE_DATA = Path(r"./example_data.csv")
+
+# parsed uploads by content, re-uploading the same file skips parsing and hashing
+UPLOAD_CACHE = pycache.LRUCache(
+    maxsize=appConfig.CACHE.UPLOAD_MAXSIZE,
+    maxbytes=appConfig.CACHE.UPLOAD_MAXBYTES,
+    sizeof=lambda parsed: parsed[1].memory_usage(index=True).sum(),
+)
+
+
+def _parse_upload(content_key, filename, upload_options, parse):
+    """
+    Return the parsed upload (report, dataset key, table), cached by content.
+
+    Args:
+        content_key (str): The hash of the uploaded bytes.
+        filename (str): The name of the uploaded file, its extension is in the key.
+        upload_options (dict): The options of the parser.
+        parse (callable): The parser (without arguments) returning
+            (report, dataframe), as `pyfunc.parse_upload_data`.
+
+    Returns:
+        tuple: (report, dataset key, table layout), the report is None and
+            the table is the prebuilt DataTable if the upload is valid.
+    """
+    cache_key = pycache.make_key(
+        content_key, Path(filename).suffix.lower(), sorted(upload_options.items())
+    )
+    parsed = UPLOAD_CACHE.get(cache_key)
+
+    if parsed is None:
+        report, dataframe = parse()
+        if dataframe is None:
+            return report, None, None
+
+        dataframe = pyfunc.prepare_dataframe(dataframe)
+        dataset_key = DATASET_STORE.put(dataframe)
+        editable = [False] + [True] * dataframe.columns.size
+        table = pylayoutfunc.create_table_layout(
+            dataframe,
+            "output-table",
+            filename=filename,
+            editable=editable,
+            deletable=False,
+        )
+        parsed = (dataset_key, dataframe, table)
+        UPLOAD_CACHE.set(cache_key, parsed)
+    else:
+        dataset_key, dataframe, table = parsed
+        # the stored dataset may be evicted, store it again under the same key
+        DATASET_STORE.put(dataframe, key=dataset_key)
+
+    return None, dataset_key, table
+
+
+def _parse_example():
+    """Return the parsed example dataset (report, dataset key, table)."""
+    return _parse_upload(
+        pycache.hash_file(EXAMPLE_DATA),
+        EXAMPLE_DATA.name,
+        {},
+        lambda: (None, pd.read_csv(EXAMPLE_DATA, index_col=0, parse_dates=True)),
+    )
+
+
+def _load_dataframe(dataset_key, filter_query=None):
+    """Load the stored dataset and apply the table filter."""
+    dataframe = DATASET_STORE.get(dataset_key)
+    if dataframe is None:
+        raise PreventUpdate
+    return pyfunc.filter_dataframe(dataframe, filter_query)
+
+
+def _load_stats(dataset_key, dataframe, filter_query=None):
+    """Return the incremental statistics of the first column (unfiltered only)."""
+    if filter_query:
+        return pystats.IncrementalStats(dataframe.iloc[:, 0])
+    return pystats.get_stats(dataset_key, dataframe.iloc[:, 0])
+
+
+def _load_pyramid(dataset_key, dataframe, filter_query=None):
+    """Return the resolution pyramid of the first column (large-data mode only)."""
+    if not pydecimate.is_large(dataframe):
+        return None
+    return pydecimate.get_pyramid((dataset_key, filter_query), dataframe.iloc[:, 0])
+
+
+def _select_zoom(relayout_data, dataset_key, filter_query=None, axes=None):
+    """Return the points of the zoomed range of the first column."""
+    view = pydecimate.parse_relayout_range(relayout_data, axes)
+    if view is None:
+        raise PreventUpdate
+
+    dataframe = _load_dataframe(dataset_key, filter_query)
+    pyramid = _load_pyramid(dataset_key, dataframe, filter_query)
+    if pyramid is None:
+        raise PreventUpdate
+
+    return pyramid.select(*view)
+
+
+def _lazy_targets(visible, containers):
+    """Return the containers to be rendered: all on a button click, else the visible."""
+    if dash.ctx.triggered_id and str(dash.ctx.triggered_id).startswith("button-"):
+        return list(containers)
+    targets = [container for container in containers if container in (visible or [])]
+    if not targets:
+        raise PreventUpdate
+    return targets
+
+
+def _figure_table(dataset_key, filter_query):
+    """Return the figure of the table data (stored per dataset key)."""
+
+    def compute():
+        dataframe = _load_dataframe(dataset_key, filter_query)
+        return pyfigure.generate_data_viz(
+            dataframe, _load_pyramid(dataset_key, dataframe, filter_query)
+        )
+
+    return pyresults.get_or_compute_figure(
+        "figure-table-viz", compute, dataset_key, filter_query
+    )
+
+
+def _figure_stat(container, dataset_key, filter_query):
+    """Return the figure of a statistics container (stored per dataset key)."""
+
+    def compute():
+        dataframe = _load_dataframe(dataset_key, filter_query)
+        moments = _load_stats(dataset_key, dataframe, filter_query).moments()
+        if container == "row-stat-statistics":
+            return pyfigure.generate_statistic_outlier(
+                dataframe, moments, _load_pyramid(dataset_key, dataframe, filter_query)
+            )
+        return pyfigure.generate_distribution_check(dataframe, moments)
+
+    return pyresults.get_or_compute_figure(
+        f"figure-{container}", compute, dataset_key, filter_query
+    )
+
+
+def _figure_freq(
+    dataset_key,
+    filter_query,
+    return_period,
+    src_normal,
+    src_lognormal,
+    src_gumbel,
+    src_logpearson3,
+    bootstrap,
+    n_replicates,
+    confidence,
+):
+    """Return the frequency analysis figure (stored per dataset key and options)."""
+    return_period = pyfunc.transform_return_period(return_period)
+    sources = (src_normal, src_lognormal, src_gumbel, src_logpearson3)
+    bootstrap = _bootstrap_options(bootstrap, n_replicates, confidence)
+
+    def compute():
+        dataframe = _load_dataframe(dataset_key, filter_query)
+        stats = _load_stats(dataset_key, dataframe, filter_query)
+        return pyfigure.generate_frequency_analysis(
+            dataframe,
+            return_period,
+            *sources,
+            design_values=stats.design_values(return_period, *sources),
+            **bootstrap,
+        )
+
+    return pyresults.get_or_compute_figure(
+        "figure-freq",
+        compute,
+        dataset_key,
+        filter_query,
+        return_period,
+        *sources,
+        bootstrap,
+    )
+
+
+FIT_FIGURES = {
+    "row-fit-viz": pyfigure.generate_goodness_fit_viz,
+    "row-fit-result": pyfigure.generate_goodness_fit_critical,
+}
+
+
+def _figure_fit(container, dataset_key, filter_query, alpha, *sources):
+    """Return the figure of a goodness of fit container (stored per dataset key)."""
+    options = (float(alpha), *sources)
+
+    def compute():
+        dataframe = _load_dataframe(dataset_key, filter_query)
+        return FIT_FIGURES[container](dataframe, *options)
+
+    return pyresults.get_or_compute_figure(
+        f"figure-{container}", compute, dataset_key, filter_query, *options
+    )
+
+
+def _report_statout(dataset_key, filter_query):
+    """Return the statistics report STATOUT.TXT (stored per dataset key)."""
+
+    def compute():
+        dataframe = _load_dataframe(dataset_key, filter_query)
+        moments = _load_stats(dataset_key, dataframe, filter_query).moments()
+        return pyfunc.generate_report_statout(dataframe, moments)
+
+    return pyresults.get_or_compute(
+        "report-statout", compute, dataset_key, filter_query
+    )
+
+
+def _result_freq(
+    dataset_key,
+    filter_query,
+    return_period,
+    src_normal,
+    src_lognormal,
+    src_gumbel,
+    src_logpearson3,
+    bootstrap,
+    n_replicates,
+    confidence,
+):
+    """Return the frequency analysis table (stored per dataset key and options)."""
+    return_period = pyfunc.transform_return_period(return_period)
+    sources = (src_normal, src_lognormal, src_gumbel, src_logpearson3)
+    bootstrap = _bootstrap_options(bootstrap, n_replicates, confidence)
+
+    def compute():
+        dataframe = _load_dataframe(dataset_key, filter_query)
+        stats = _load_stats(dataset_key, dataframe, filter_query)
+        return pyfunc.generate_dataframe_freq(
+            dataframe,
+            return_period,
+            *sources,
+            design_values=stats.design_values(return_period, *sources),
+            **bootstrap,
+        )
+
+    return pyresults.get_or_compute(
+        "result-freq",
+        compute,
+        dataset_key,
+        filter_query,
+        return_period,
+        *sources,
+        bootstrap,
+    )
+
+
+def _report_fit(dataset_key, filter_query, alpha, *sources):
+    """Return KS.csv, CHI.csv and FIT.TXT (stored per dataset key and options)."""
+    options = (float(alpha), *sources)
+
+    def compute():
+        dataframe = _load_dataframe(dataset_key, filter_query)
+        ks_frame, chi_frame, report_fit = pyfunc.generate_report_fit(
+            dataframe, *options
+        )
+        return ks_frame.to_csv(), chi_frame.to_csv(), report_fit
+
+    return pyresults.get_or_compute(
+        "report-fit", compute, dataset_key, filter_query, *options
+    )
+
+
+def _result_batch(
+    dataset_key, filter_query, return_period, alpha, *sources, progress=None
+):
+    """Return the summary of all stations (stored per dataset key and options)."""
+    return_period = pyfunc.transform_return_period(return_period)
+    options = (return_period, float(alpha), *sources)
+
+    def compute():
+        dataframe = _load_dataframe(dataset_key, filter_query)
+        return pyfunc.generate_batch_result(dataframe, *options, progress=progress)
+
+    return pyresults.get_or_compute(
+        "result-batch", compute, dataset_key, filter_query, *options
+    )
+
+
+# prefetch and warm start of this worker, bounded by JOBS.MAX_CONCURRENT
+PREFETCH_EXECUTOR = ThreadPoolExecutor(
+    max_workers=appConfig.JOBS.MAX_CONCURRENT or 1, thread_name_prefix="prefetch"
+)
+_PREFETCH_SLOTS = threading.BoundedSemaphore(appConfig.JOBS.MAX_CONCURRENT or 1)
+
+
+def _compute_all(computes):
+    """Compute results in order, errors are shown when the tab is calculated."""
+    for compute in computes:
+        try:
+            compute()
+        except PreventUpdate:  # the dataset is not available anymore
+            return
+        except (ValueError, ZeroDivisionError, IndexError):
+            app.logger.exception("Prefetching is stopped.")
+            return
+
+
+def _run_prefetch(computes):
+    try:
+        # shares the slots of the background jobs of this worker
+        with pyjobs.job_slot(owner=os.getpid()):
+            _compute_all(computes)
+    finally:
+        _PREFETCH_SLOTS.release()
+
+
+def _prefetch(computes):
+    """
+    Compute results in advance in the prefetch executor.
+
+    Prefetching is skipped if all slots of the executor are in use, so the
+    requests are not queued.
+
+    Args:
+        computes (list): The functions (without arguments) computing the results.
+    """
+    if _PREFETCH_SLOTS.acquire(blocking=False):
+        PREFETCH_EXECUTOR.submit(_run_prefetch, computes)
+
+
+def _bootstrap_options(bootstrap, n_replicates, confidence) -> dict:
+    """Convert the confidence interval options into (validated) keyword arguments."""
+    return parse_bootstrap_options(
+        {"bootstrap": bootstrap, "n_replicates": n_replicates, "confidence": confidence}
+    )
+
+
 @app.callback(
     Output("row-table-data", "children"),
     Output("card-stat", "disabled"),
     Output("card-frequency", "disabled"),
     Output("card-goodness", "disabled"),
+    Output("card-batch", "disabled"),
     Output("button-download-table", "disabled"),
+    Output("store-dataset-key", "data"),
     Input("dcc-upload", "contents"),
     State("dcc-upload", "filename"),
     State("dcc-upload", "last_modified"),
     Input("button-example", "n_clicks"),
+    State("switch-upload-annual-max", "value"),
+    State("select-upload-hydro-month", "value"),
+    State("input-upload-sheet", "value"),
+    State("input-upload-date-column", "value"),
+    State("input-upload-value-columns", "value"),
+    Input("store-upload", "data"),
 )
-def callback_upload(content, filename, filedate, _):
+def callback_upload(
+    content,
+    filename,
+    filedate,
+    _,
+    annual_maximum,
+    hydro_month,
+    sheet,
+    date_column,
+    value_columns,
+    large_file,
+):
     """Callback function for uploading data and generating table."""
 
     ctx = dash.ctx
     _ = filedate
 
-    if content is not None:
-        report, dataframe = pyfunc.parse_upload_data(content, filename)
+    upload_options = dict(
+        annual_maximum=annual_maximum,
+        hydrological_month=int(hydro_month),
+        sheet=sheet,
+        date_column=date_column,
+        value_columns=[
+            name.strip() for name in (value_columns or "").split(",") if name.strip()
+        ],
+    )
 
     if ctx.triggered_id == "button-example":
-        dataframe = pd.read_csv(
-            Path(r"./example_data.csv"), index_col=0, parse_dates=True
+        report, dataset_key, children = _parse_example()
+    elif ctx.triggered_id == "store-upload":
+        filename = large_file["filename"]
+        upload_id = large_file["upload_id"]
+        if large_file["size"] and pyupload.upload_size(upload_id) == large_file["size"]:
+            path = pyupload.upload_path(upload_id)
+            try:
+                report, dataset_key, children = _parse_upload(
+                    pycache.hash_file(path),
+                    filename,
+                    upload_options,
+                    lambda: pyfunc.parse_upload_file(path, filename, **upload_options),
+                )
+            finally:
+                # the parsed dataset is stored, the file is not needed anymore
+                pyupload.remove_upload(upload_id)
+        else:
+            report, dataset_key = (
+                html.Div(["Upload is not complete, upload the file again."]),
+                None,
+            )
+    elif content is not None:
+        decoded = pyfunc.decode_upload_content(content)
+        report, dataset_key, children = _parse_upload(
+            pycache.hash_bytes(decoded),
+            filename,
+            upload_options,
+            lambda: pyfunc.parse_upload_buffer(decoded, filename, **upload_options),
         )
 
     tab_stat_disabled = True
     tab_frequency_disabled = True
     tab_goodness_disabled = True
+    tab_batch_disabled = True
     button_download_disabled = True
 
-    if dataframe is None:
+    if dataset_key is None:
         children = report
     else:
-        editable = [False, True]
-        children = pylayoutfunc.create_table_layout(
-            dataframe,
-            "output-table",
-            filename=filename,
-            editable=editable,
-            deletable=False,
-        )
         tab_stat_disabled = False
         tab_frequency_disabled = False
         tab_goodness_disabled = False
+        tab_batch_disabled = False
         button_download_disabled = False
 
     return (
@@ -127,23 +531,250 @@ def callback_upload(content, filename, filedate, _):
         tab_stat_disabled,
         tab_frequency_disabled,
         tab_goodness_disabled,
+        tab_batch_disabled,
         button_download_disabled,
+        dataset_key,
     )
 
 
+@app.callback(
+    Output("output-table", "data"),
+    Output("output-table", "page_current"),
+    Output("output-table", "page_count"),
+    Input("output-table", "page_current"),
+    Input("output-table", "page_size"),
+    Input("output-table", "sort_by"),
+    Input("output-table", "filter_query"),
+    Input("store-dataset-key", "data"),
+    prevent_initial_call=True,
+)
+def callback_table_page(page_current, page_size, sort_by, filter_query, dataset_key):
+    """Callback function for serving the visible page of the table."""
+
+    dataframe = DATASET_STORE.get(dataset_key)
+    if dataframe is None:
+        raise PreventUpdate
+
+    order = None
+    if sort_by:
+        order = DATASET_STORE.sorted_index(
+            dataset_key, sort_by[0]["column_id"], sort_by[0]["direction"] == "asc"
+        )
+
+    positions, page_current, page_count = pyfunc.calc_table_page(
+        dataframe, page_current, page_size, order, filter_query
+    )
+
+    return (
+        pylayoutfunc.create_table_records(dataframe, positions),
+        page_current,
+        page_count,
+    )
+
+
+app.clientside_callback(
+    ClientsideFunction(namespace="anfrek", function_name="diffTable"),
+    Output("store-table-edit", "data"),
+    Input("output-table", "data_timestamp"),
+    State("output-table", "data"),
+    State("output-table", "data_previous"),
+)
+
+
+app.clientside_callback(
+    ClientsideFunction(namespace="anfrek", function_name="observeVisible"),
+    Input("tabs-cards", "active_tab"),
+    Input("store-dataset-key", "data"),
+)
+
+PREFETCH_NEXT_TAB = {
+    "tabid-card-table": "tabid-card-stat",
+    "tabid-card-stat": "tabid-card-frequency",
+    "tabid-card-frequency": "tabid-card-goodness",
+}
+
+
+@app.callback(
+    Input("tabs-cards", "active_tab"),
+    State("store-dataset-key", "data"),
+    State("output-table", "filter_query"),
+    State("input-freq-return-period", "value"),
+    State("select-freq-normal", "value"),
+    State("select-freq-lognormal", "value"),
+    State("select-freq-gumbel", "value"),
+    State("select-freq-logpearson3", "value"),
+    State("select-freq-bootstrap", "value"),
+    State("input-freq-replicates", "value"),
+    State("input-freq-confidence", "value"),
+    State("input-fit-alpha", "value"),
+    State("select-fit-ks", "value"),
+    State("select-fit-chisquare", "value"),
+)
+def callback_prefetch_tab(
+    active_tab,
+    dataset_key,
+    filter_query,
+    return_period,
+    src_normal,
+    src_lognormal,
+    src_gumbel,
+    src_logpearson3,
+    bootstrap,
+    n_replicates,
+    confidence,
+    alpha,
+    src_ks,
+    src_chisquare,
+):
+    """
+    Callback function for computing the figures of the next tab in advance.
+
+    The frequency analysis with bootstrap (process pool) is not prefetched.
+    """
+
+    sources = (src_normal, src_lognormal, src_gumbel, src_logpearson3)
+    fit_options = (alpha, src_ks, src_chisquare, *sources)
+
+    next_tab = PREFETCH_NEXT_TAB.get(active_tab)
+    if not dataset_key or next_tab is None:
+        return
+
+    compute_figures = {
+        "tabid-card-stat": [
+            lambda: _figure_stat("row-stat-statistics", dataset_key, filter_query),
+            lambda: _figure_stat("row-stat-distribution", dataset_key, filter_query),
+        ],
+        "tabid-card-frequency": [
+            lambda: _figure_freq(
+                dataset_key,
+                filter_query,
+                return_period,
+                *sources,
+                bootstrap,
+                n_replicates,
+                confidence,
+            )
+        ]
+        if bootstrap not in pyfunc.BOOTSTRAP_METHODS
+        else [],
+        "tabid-card-goodness": [
+            lambda: _figure_fit("row-fit-viz", dataset_key, filter_query, *fit_options),
+            lambda: _figure_fit(
+                "row-fit-result", dataset_key, filter_query, *fit_options
+            ),
+        ],
+    }[next_tab]
+
+    _prefetch(compute_figures)
+
+
+@app.callback(
+    Output("store-dataset-key", "data", allow_duplicate=True),
+    Input("store-table-edit", "data"),
+    State("store-dataset-key", "data"),
+)
+def callback_table_edit(edits, dataset_key):
+    """Callback function for applying table edits to the stored dataset."""
+
+    dataframe = DATASET_STORE.get(dataset_key)
+    new_key = DATASET_STORE.apply_edits(dataset_key, edits)
+
+    if new_key is None:
+        raise PreventUpdate
+
+    pystats.apply_edits(dataset_key, new_key, dataframe, edits)
+
+    return new_key
+
+
 @app.callback(
     Output("row-table-viz", "children"),
-    Input("output-table", "derived_virtual_data"),
-    State("output-table", "columns"),
+    Input("store-dataset-key", "data"),
+    Input("output-table", "filter_query"),
 )
-def callback_table_visualize(table_data, table_columns):
+def callback_table_visualize(dataset_key, filter_query):
     """Callback function for visualizing table data."""
 
-    dataframe = pyfunc.transform_to_dataframe(table_data, table_columns)
+    fig = _figure_table(dataset_key, filter_query)
+
+    return dcc.Graph(figure=fig, id="graph-table-viz")
 
-    fig = pyfigure.generate_data_viz(dataframe)
 
-    return dcc.Graph(figure=fig)
+@app.callback(
+    Output("graph-table-viz", "figure"),
+    Input("graph-table-viz", "relayoutData"),
+    State("store-dataset-key", "data"),
+    State("output-table", "filter_query"),
+)
+def callback_table_visualize_zoom(relayout_data, dataset_key, filter_query):
+    """Callback function for loading the zoomed range of a large-data figure."""
+
+    series = _select_zoom(relayout_data, dataset_key, filter_query)
+
+    patched_figure = Patch()
+    patched_figure["data"][0]["x"] = series.index
+    patched_figure["data"][0]["y"] = series.to_numpy()
+    patched_figure["data"][1]["x"] = series.index
+    patched_figure["data"][1]["y"] = [series.name] * series.size
+    patched_figure["data"][1]["marker"]["size"] = series.to_numpy()
+
+    return patched_figure
+
+
+@app.callback(
+    Output("row-table-summary", "children"),
+    Input("store-dataset-key", "data"),
+    Input("output-table", "filter_query"),
+    State("store-table-edit", "data"),
+    State("input-freq-return-period", "value"),
+    State("input-fit-alpha", "value"),
+    State("select-fit-ks", "value"),
+    State("select-freq-normal", "value"),
+    State("select-freq-lognormal", "value"),
+    State("select-freq-gumbel", "value"),
+    State("select-freq-logpearson3", "value"),
+)
+def callback_table_summary(
+    dataset_key,
+    filter_query,
+    edits,
+    return_period,
+    alpha,
+    src_ks,
+    src_normal,
+    src_lognormal,
+    src_gumbel,
+    src_logpearson3,
+):
+    """Callback function for the summary of the table (incremental on edits)."""
+    dataframe = _load_dataframe(dataset_key, filter_query)
+    stats = _load_stats(dataset_key, dataframe, filter_query)
+
+    try:
+        summary = stats.summary(
+            pyfunc.transform_return_period(return_period),
+            float(alpha),
+            src_ks,
+            src_normal,
+            src_lognormal,
+            src_gumbel,
+            src_logpearson3,
+        )
+    except (ValueError, ZeroDivisionError, IndexError) as e:
+        return dbc.Alert(f"Summary is not available: {e}", color="warning")
+
+    # rank of the last edited value, if it belongs to this dataset
+    column = dataframe.columns[0]
+    for edit in [] if filter_query else pystore.valid_edits(dataframe, edits):
+        value = float(pd.to_numeric(edit["value"], errors="coerce"))
+        if edit["column"] == column and value == dataframe[column].iat[edit["row"]]:
+            summary[("EDIT", "VALUE")] = value
+            summary[("EDIT", "RANK")] = stats.rank(value)
+            summary[("EDIT", "PROBABILITY")] = stats.empirical_probability(value)
+
+    return pylayoutfunc.create_summary_table_layout(
+        summary.to_frame(column).T.rename_axis("STATION"), "output-table-summary"
+    )
 
 
 @app.callback(
@@ -152,104 +783,200 @@ def callback_table_visualize(table_data, table_columns):
     Output("button-stat-download", "outline"),
     Output("button-stat-download", "disabled"),
     Input("button-stat-calc", "n_clicks"),
-    State("output-table", "derived_virtual_data"),
-    State("output-table", "columns"),
+    Input("store-visible-stat", "data"),
+    State("store-dataset-key", "data"),
+    State("output-table", "filter_query"),
 )
-def callback_calc_statout(_, table_data, table_columns):
+def callback_calc_statout(_, visible, dataset_key, filter_query):
     """Callback function for calculating statistics and distribution."""
 
-    dataframe = pyfunc.transform_to_dataframe(table_data, table_columns)
+    targets = _lazy_targets(visible, ["row-stat-statistics", "row-stat-distribution"])
 
-    fig_statout = pyfigure.generate_statistic_outlier(dataframe)
+    statistics = distribution = dash.no_update
+    if "row-stat-statistics" in targets:
+        fig_statout = _figure_stat("row-stat-statistics", dataset_key, filter_query)
+        statistics = dcc.Graph(figure=fig_statout, id="graph-stat-outlier")
+    if "row-stat-distribution" in targets:
+        fig_dist = _figure_stat("row-stat-distribution", dataset_key, filter_query)
+        distribution = dcc.Graph(figure=fig_dist, mathjax=True)
 
-    fig_dist = pyfigure.generate_distribution_check(dataframe)
+    _report_statout(dataset_key, filter_query)
 
-    return (
-        dcc.Graph(figure=fig_statout),
-        dcc.Graph(figure=fig_dist, mathjax=True),
-        False,
-        False,
-    )
+    return statistics, distribution, False, False
+
+
+@app.callback(
+    Output("graph-stat-outlier", "figure"),
+    Input("graph-stat-outlier", "relayoutData"),
+    State("store-dataset-key", "data"),
+    State("output-table", "filter_query"),
+)
+def callback_stat_outlier_zoom(relayout_data, dataset_key, filter_query):
+    """Callback function for loading the zoomed range of a large-data figure."""
+
+    # xaxis2 is the categorical axis of the box plot
+    series = _select_zoom(relayout_data, dataset_key, filter_query, axes=("xaxis",))
+
+    patched_figure = Patch()
+    patched_figure["data"][0]["x"] = series.index
+    patched_figure["data"][0]["y"] = series.to_numpy()
+
+    return patched_figure
 
 
 @app.callback(
     Output("download-stat", "data"),
     Input("button-stat-download", "n_clicks"),
-    State("output-table", "derived_virtual_data"),
-    State("output-table", "columns"),
+    State("store-dataset-key", "data"),
+    State("output-table", "filter_query"),
 )
-def callback_download_stat(_, table_data, table_columns):
+def callback_download_stat(_, dataset_key, filter_query):
     """Callback function for downloading statistics and distribution."""
-    dataframe = pyfunc.transform_to_dataframe(table_data, table_columns)
-    text_file = pyfunc.generate_report_statout(dataframe)
-    return {"content": text_file, "filename": "STATOUT.TXT"}
+    text_file = _report_statout(dataset_key, filter_query)
+    return dcc.send_string(text_file, "STATOUT.TXT")
+
+
+def _changed_sources(previous, options):
+    """
+    Return the distributions (positions) with a changed source.
+
+    Args:
+        previous (list): The options of the displayed figure (store-freq-options).
+        options (list): The requested options (dataset key, filter query and
+            options of the frequency analysis).
+
+    Returns:
+        list or None: The positions in `pyfunc.DIST_NAME`, empty if nothing is
+            changed, or None if another option is changed (or nothing is displayed).
+    """
+    if previous is None or len(previous) != len(options):
+        return None
+    if previous[:3] + previous[7:] != options[:3] + options[7:]:
+        return None
+    return [
+        i_dist
+        for i_dist, (old, new) in enumerate(zip(previous[3:7], options[3:7]))
+        if old != new
+    ]
+
+
+def _patch_freq(result, changed) -> Patch:
+    """
+    Patch the design values of the changed distributions in the figure and table.
+
+    The traces of the frequency analysis figure are the lines (0-3), the bars
+    (4-7) and the upper and lower bounds of the confidence interval (8-15).
+
+    Args:
+        result (pd.DataFrame): The frequency analysis table (`_result_freq`).
+        changed (list): The positions of the changed distributions.
+
+    Returns:
+        Patch: The patch of the children of row-freq-viz (graph and table).
+    """
+    patched_children = Patch()
+    figure = patched_children[0]["props"]["figure"]
+    table = patched_children[1]["props"]["data"]
+
+    for i_dist in changed:
+        dist = pyfunc.DIST_NAME[i_dist]
+        values = result[dist].to_numpy()
+        figure["data"][i_dist]["y"] = values
+        figure["data"][i_dist + 4]["y"] = values
+        if f"{dist} Upper" in result.columns:
+            figure["data"][8 + 2 * i_dist]["y"] = result[f"{dist} Upper"].to_numpy()
+            figure["data"][9 + 2 * i_dist]["y"] = result[f"{dist} Lower"].to_numpy()
+        table[i_dist] = pylayoutfunc.create_freq_table_record(result[dist])
+
+    return patched_children
 
 
 @app.callback(
     Output("row-freq-viz", "children"),
     Output("button-freq-download", "outline"),
     Output("button-freq-download", "disabled"),
+    Output("store-freq-options", "data"),
     Input("button-freq-calc", "n_clicks"),
-    State("output-table", "derived_virtual_data"),
-    State("output-table", "columns"),
+    Input("store-visible-freq", "data"),
+    State("store-freq-options", "data"),
+    State("store-dataset-key", "data"),
+    State("output-table", "filter_query"),
     State("input-freq-return-period", "value"),
     State("select-freq-normal", "value"),
     State("select-freq-lognormal", "value"),
     State("select-freq-gumbel", "value"),
     State("select-freq-logpearson3", "value"),
+    State("select-freq-bootstrap", "value"),
+    State("input-freq-replicates", "value"),
+    State("input-freq-confidence", "value"),
 )
 def callback_calc_freq(
-    _,
-    table_data,
-    table_columns,
-    return_period,
-    src_normal,
-    src_lognormal,
-    src_gumbel,
-    src_logpearson3,
+    _, visible, previous, dataset_key, filter_query, *freq_options
 ):
-    """Callback function for calculating frequency analysis."""
-    dataframe = pyfunc.transform_to_dataframe(table_data, table_columns)
+    """
+    Callback function for calculating frequency analysis.
 
-    return_period = pyfunc.transform_return_period(return_period)
+    If only sources of distributions are changed, the displayed figure and
+    table are patched with the new design values of these distributions.
+    """
+
+    _lazy_targets(visible, ["row-freq-viz"])
+
+    options = [dataset_key, filter_query, *freq_options]
+    changed = _changed_sources(previous, options)
+    if changed == []:
+        raise PreventUpdate
+
+    result = _result_freq(dataset_key, filter_query, *freq_options)
+    if changed:
+        return _patch_freq(result, changed), False, False, options
 
-    fig = pyfigure.generate_frequency_analysis(
-        dataframe, return_period, src_normal, src_lognormal, src_gumbel, src_logpearson3
+    fig = _figure_freq(dataset_key, filter_query, *freq_options)
+    table = pylayoutfunc.create_freq_table_layout(
+        result[pyfunc.DIST_NAME], "output-freq-table"
     )
-    return dcc.Graph(figure=fig), False, False
+
+    return [dcc.Graph(figure=fig), table], False, False, options
 
 
 @app.callback(
     Output("download-freq", "data"),
     Input("button-freq-download", "n_clicks"),
-    State("output-table", "derived_virtual_data"),
-    State("output-table", "columns"),
+    State("store-dataset-key", "data"),
+    State("output-table", "filter_query"),
     State("input-freq-return-period", "value"),
     State("select-freq-normal", "value"),
     State("select-freq-lognormal", "value"),
     State("select-freq-gumbel", "value"),
     State("select-freq-logpearson3", "value"),
+    State("select-freq-bootstrap", "value"),
+    State("input-freq-replicates", "value"),
+    State("input-freq-confidence", "value"),
 )
-def callback_down_freq(
-    _,
-    table_data,
-    table_columns,
-    return_period,
-    src_normal,
-    src_lognormal,
-    src_gumbel,
-    src_logpearson3,
-):
+def callback_down_freq(_, dataset_key, filter_query, *freq_options):
     """Callback function for downloading frequency analysis."""
-    dataframe = pyfunc.transform_to_dataframe(table_data, table_columns)
-
-    return_period = pyfunc.transform_return_period(return_period)
+    result = _result_freq(dataset_key, filter_query, *freq_options)
+    return dcc.send_data_frame(result.to_csv, "FREQUENCY.csv")
 
-    result = pyfunc.generate_dataframe_freq(
-        dataframe, return_period, src_normal, src_lognormal, src_gumbel, src_logpearson3
-    )
 
-    return dcc.send_data_frame(result.to_csv, "FREQUENCY.csv")
+@app.callback(
+    Output("download-freq-parquet", "data"),
+    Input("button-freq-download-parquet", "n_clicks"),
+    State("store-dataset-key", "data"),
+    State("output-table", "filter_query"),
+    State("input-freq-return-period", "value"),
+    State("select-freq-normal", "value"),
+    State("select-freq-lognormal", "value"),
+    State("select-freq-gumbel", "value"),
+    State("select-freq-logpearson3", "value"),
+    State("select-freq-bootstrap", "value"),
+    State("input-freq-replicates", "value"),
+    State("input-freq-confidence", "value"),
+)
+def callback_down_freq_parquet(_, dataset_key, filter_query, *freq_options):
+    """Callback function for downloading frequency analysis as Parquet."""
+    result = _result_freq(dataset_key, filter_query, *freq_options)
+    return dcc.send_bytes(result.to_parquet, "FREQUENCY.parquet")
 
 
 @app.callback(
@@ -258,8 +985,9 @@ def callback_down_freq(
     Output("button-fit-download", "outline"),
     Output("button-fit-download", "disabled"),
     Input("button-fit-calc", "n_clicks"),
-    State("output-table", "derived_virtual_data"),
-    State("output-table", "columns"),
+    Input("store-visible-fit", "data"),
+    State("store-dataset-key", "data"),
+    State("output-table", "filter_query"),
     State("input-fit-alpha", "value"),
     State("select-fit-ks", "value"),
     State("select-fit-chisquare", "value"),
@@ -267,48 +995,36 @@ def callback_down_freq(
     State("select-freq-lognormal", "value"),
     State("select-freq-gumbel", "value"),
     State("select-freq-logpearson3", "value"),
+    background=True,
+    running=[
+        (Output("button-fit-calc", "disabled"), True, False),
+        (Output("button-fit-cancel", "disabled"), False, True),
+    ],
+    cancel=[Input("button-fit-cancel", "n_clicks")],
+    progress=[Output("progress-fit", "value"), Output("progress-fit", "label")],
 )
 def callback_calc_fit(
-    _,
-    table_data,
-    table_columns,
-    alpha,
-    src_ks,
-    src_chisquare,
-    src_normal,
-    src_lognormal,
-    src_gumbel,
-    src_logpearson3,
+    set_progress, _, visible, dataset_key, filter_query, *fit_options
 ):
     """Callback function for calculating goodness of fit."""
-    dataframe = pyfunc.transform_to_dataframe(table_data, table_columns)
-
-    alpha = float(alpha)
-
-    fig_fit_viz = pyfigure.generate_goodness_fit_viz(
-        dataframe,
-        alpha,
-        src_ks,
-        src_chisquare,
-        src_normal,
-        src_lognormal,
-        src_gumbel,
-        src_logpearson3,
-    )
 
-    fig_fit_result = pyfigure.generate_goodness_fit_critical(
-        dataframe,
-        alpha,
-        src_ks,
-        src_chisquare,
-        src_normal,
-        src_lognormal,
-        src_gumbel,
-        src_logpearson3,
-    )
+    targets = _lazy_targets(visible, FIT_FIGURES)
+
+    figures = {container: dash.no_update for container in FIT_FIGURES}
+
+    with pyjobs.job_slot(set_progress):
+        for step, container in enumerate(targets):
+            set_progress((100 * step / len(targets), "PLOTTING..."))
+            figures[container] = dcc.Graph(
+                figure=_figure_fit(container, dataset_key, filter_query, *fit_options),
+                mathjax=True,
+            )
+        _report_fit(dataset_key, filter_query, *fit_options)
+
+    set_progress((100, "DONE"))
     return (
-        dcc.Graph(figure=fig_fit_viz, mathjax=True),
-        dcc.Graph(figure=fig_fit_result, mathjax=True),
+        figures["row-fit-viz"],
+        figures["row-fit-result"],
         False,
         False,
     )
@@ -319,8 +1035,8 @@ def callback_calc_fit(
     Output("download-fit-chisquare", "data"),
     Output("download-fit", "data"),
     Input("button-fit-download", "n_clicks"),
-    State("output-table", "derived_virtual_data"),
-    State("output-table", "columns"),
+    State("store-dataset-key", "data"),
+    State("output-table", "filter_query"),
     State("input-fit-alpha", "value"),
     State("select-fit-ks", "value"),
     State("select-fit-chisquare", "value"),
@@ -328,11 +1044,292 @@ def callback_calc_fit(
     State("select-freq-lognormal", "value"),
     State("select-freq-gumbel", "value"),
     State("select-freq-logpearson3", "value"),
+    background=True,
+    running=[
+        (Output("button-fit-download", "disabled"), True, False),
+        (Output("button-fit-cancel", "disabled"), False, True),
+    ],
+    cancel=[Input("button-fit-cancel", "n_clicks")],
+    progress=[Output("progress-fit", "value"), Output("progress-fit", "label")],
 )
-def callback_download_fit(
-    _,
-    table_data,
-    table_columns,
+def callback_download_fit(set_progress, _, dataset_key, filter_query, *fit_options):
+    """Callback function for downloading goodness of fit."""
+
+    with pyjobs.job_slot(set_progress):
+        set_progress((10, "TESTING..."))
+        ks_csv, chi_csv, report_fit = _report_fit(
+            dataset_key, filter_query, *fit_options
+        )
+
+    set_progress((100, "DONE"))
+
+    return (
+        dcc.send_string(ks_csv, "KS.csv"),
+        dcc.send_string(chi_csv, "CHI.csv"),
+        dcc.send_string(report_fit, "FIT.TXT"),
+    )
+
+
+@app.callback(
+    Output("row-batch-result", "children"),
+    Output("button-batch-download", "outline"),
+    Output("button-batch-download", "disabled"),
+    Input("button-batch-calc", "n_clicks"),
+    State("store-dataset-key", "data"),
+    State("output-table", "filter_query"),
+    State("input-freq-return-period", "value"),
+    State("input-fit-alpha", "value"),
+    State("select-fit-ks", "value"),
+    State("select-fit-chisquare", "value"),
+    State("select-freq-normal", "value"),
+    State("select-freq-lognormal", "value"),
+    State("select-freq-gumbel", "value"),
+    State("select-freq-logpearson3", "value"),
+    background=True,
+    running=[
+        (Output("button-batch-calc", "disabled"), True, False),
+        (Output("button-batch-cancel", "disabled"), False, True),
+    ],
+    cancel=[Input("button-batch-cancel", "n_clicks")],
+    progress=[Output("progress-batch", "value"), Output("progress-batch", "label")],
+)
+def callback_calc_batch(set_progress, _, dataset_key, filter_query, *batch_options):
+    """Callback function for calculating all stations (batch)."""
+
+    with pyjobs.job_slot(set_progress):
+        result = _result_batch(
+            dataset_key,
+            filter_query,
+            *batch_options,
+            progress=lambda done, total: set_progress(
+                (100 * done / total, f"{done}/{total}")
+            ),
+        )
+
+    table = pylayoutfunc.create_summary_table_layout(result, "output-table-batch")
+
+    return table, False, False
+
+
+@app.callback(
+    Output("download-batch", "data"),
+    Input("button-batch-download", "n_clicks"),
+    State("store-dataset-key", "data"),
+    State("output-table", "filter_query"),
+    State("input-freq-return-period", "value"),
+    State("input-fit-alpha", "value"),
+    State("select-fit-ks", "value"),
+    State("select-fit-chisquare", "value"),
+    State("select-freq-normal", "value"),
+    State("select-freq-lognormal", "value"),
+    State("select-freq-gumbel", "value"),
+    State("select-freq-logpearson3", "value"),
+    background=True,
+    running=[
+        (Output("button-batch-download", "disabled"), True, False),
+        (Output("button-batch-cancel", "disabled"), False, True),
+    ],
+    cancel=[Input("button-batch-cancel", "n_clicks")],
+    progress=[Output("progress-batch", "value"), Output("progress-batch", "label")],
+)
+def callback_download_batch(
+    set_progress, _, dataset_key, filter_query, *batch_options
+):
+    """Callback function for downloading the summary of all stations (batch)."""
+
+    with pyjobs.job_slot(set_progress):
+        result = _result_batch(
+            dataset_key,
+            filter_query,
+            *batch_options,
+            progress=lambda done, total: set_progress(
+                (100 * done / total, f"{done}/{total}")
+            ),
+        )
+
+    return dcc.send_data_frame(result.to_csv, "BATCH.csv")
+
+
+@app.callback(
+    Output("download-table", "data"),
+    Input("button-download-table", "n_clicks"),
+    State("store-dataset-key", "data"),
+    State("output-table", "filter_query"),
+)
+def callback_download_table(_, dataset_key, filter_query):
+    """Callback function for downloading table data."""
+    dataframe = _load_dataframe(dataset_key, filter_query)
+
+    return dcc.send_data_frame(dataframe.to_csv, "TABLE.csv")
+
+
+@app.callback(
+    Output("download-table-parquet", "data"),
+    Input("button-download-table-parquet", "n_clicks"),
+    State("store-dataset-key", "data"),
+    State("output-table", "filter_query"),
+)
+def callback_download_table_parquet(_, dataset_key, filter_query):
+    """Callback function for downloading table data as Parquet."""
+    dataframe = _load_dataframe(dataset_key, filter_query)
+
+    return dcc.send_bytes(dataframe.to_parquet, "TABLE.parquet")
+
+
+@app.callback(
+    Output("button-download-table-parquet", "disabled"),
+    Output("button-freq-download-parquet", "disabled"),
+    Input("store-dataset-key", "data"),
+)
+def callback_parquet_available(dataset_key):
+    """Callback function for enabling the Parquet downloads (requires pyarrow)."""
+    disabled = not dataset_key or pyfunc.pa is None
+    return disabled, disabled
+
+
+# DOWNLOAD ALL (ZIP)
+
+
+@server.route("/download/<dataset_key>.zip")
+def download_all(dataset_key):
+    """
+    Stream a ZIP archive of all reports of a stored dataset.
+
+    The options are given in the query string (as the JSON API) together with
+    `filter_query`, `bootstrap`, `n_replicates`, `confidence` and `mode`
+    (`single` for the first column, `batch` for every station).
+    """
+    args = flask.request.args
+    dataframe = DATASET_STORE.get(dataset_key)
+    if dataframe is None:
+        flask.abort(404, "Dataset is not available, upload the data again.")
+
+    filter_query = args.get("filter_query") or None
+    dataframe = pyfunc.filter_dataframe(dataframe, filter_query)
+    mode = "batch" if args.get("mode") == "batch" else "single"
+
+    try:
+        options = parse_options(args.to_dict())
+        bootstrap_options = parse_bootstrap_options(args.to_dict())
+    except APIError as e:
+        flask.abort(400, str(e))
+    return_period = " ".join(map(str, options["return_periods"]))
+    sources = [options[f"src_{dist}"] for dist in pyfunc.DIST_NAME_LOWER]
+    fit_options = (options["alpha"], options["src_ks"], options["src_chisquare"])
+
+    if mode == "batch":
+        entries = _archive_batch_entries(
+            dataset_key, dataframe, filter_query, return_period, fit_options, sources
+        )
+    else:
+        bootstrap = [
+            bootstrap_options.get(key)
+            for key in ("bootstrap", "n_replicates", "confidence")
+        ]
+        options.update(bootstrap_options)
+        entries = _archive_entries(
+            dataset_key, filter_query, return_period, fit_options, sources, bootstrap
+        )
+
+    manifest = pyexport.generate_manifest(
+        mode, dataset_key, dataframe, filter_query, options
+    )
+    entries = itertools.chain([("manifest.json", manifest)], entries)
+
+    return flask.Response(
+        flask.stream_with_context(pyexport.stream_zip(_in_job_slot(entries))),
+        mimetype="application/zip",
+        headers={
+            "Content-Disposition": f'attachment; filename="ANFREK-{mode.upper()}.zip"'
+        },
+    )
+
+
+def _in_job_slot(entries):
+    """
+    Yield the entries with their reports calculated within a job slot.
+
+    The slot is released after each report, not held while the client downloads.
+    """
+
+    def compute(content):
+        with pyjobs.job_slot(owner=os.getpid()):
+            return content()
+
+    for name, content in entries:
+        if callable(content):
+            yield name, functools.partial(compute, content)
+        else:
+            yield name, content
+
+
+def _archive_entries(
+    dataset_key, filter_query, return_period, fit_options, sources, bootstrap
+):
+    """Generate the entries of the first column from the stored results."""
+    yield "TABLE.csv", lambda: _load_dataframe(dataset_key, filter_query).to_csv()
+    yield "STATOUT.TXT", lambda: _report_statout(dataset_key, filter_query)
+    yield "FREQUENCY.csv", lambda: _result_freq(
+        dataset_key, filter_query, return_period, *sources, *bootstrap
+    ).to_csv()
+
+    def report_fit():
+        return _report_fit(dataset_key, filter_query, *fit_options, *sources)
+
+    yield "KS.csv", lambda: report_fit()[0]
+    yield "CHI.csv", lambda: report_fit()[1]
+    yield "FIT.TXT", lambda: report_fit()[2]
+
+
+def _archive_batch_entries(
+    dataset_key, dataframe, filter_query, return_period, fit_options, sources
+):
+    """Generate the entries of every station, one station at a time."""
+    return_periods = pyfunc.transform_return_period(return_period)
+    alpha, src_ks, src_chisquare = fit_options
+
+    yield "TABLE.csv", dataframe.to_csv
+    directories = pyexport.station_directories(
+        dataframe.columns, reserved=("manifest.json", "TABLE.csv", "BATCH.csv")
+    )
+    for column, directory in zip(dataframe.columns, directories):
+        yield from pyexport.generate_station_entries(
+            dataframe[column],
+            return_periods,
+            alpha,
+            src_ks,
+            src_chisquare,
+            *sources,
+            directory=directory,
+        )
+    yield "BATCH.csv", lambda: _result_batch(
+        dataset_key, filter_query, return_period, *fit_options, *sources
+    ).to_csv()
+
+
+@app.callback(
+    Output("button-download-all", "href"),
+    Output("button-download-all", "disabled"),
+    Output("button-batch-download-all", "href"),
+    Output("button-batch-download-all", "disabled"),
+    Input("store-dataset-key", "data"),
+    Input("output-table", "filter_query"),
+    Input("input-freq-return-period", "value"),
+    Input("input-fit-alpha", "value"),
+    Input("select-fit-ks", "value"),
+    Input("select-fit-chisquare", "value"),
+    Input("select-freq-normal", "value"),
+    Input("select-freq-lognormal", "value"),
+    Input("select-freq-gumbel", "value"),
+    Input("select-freq-logpearson3", "value"),
+    Input("select-freq-bootstrap", "value"),
+    Input("input-freq-replicates", "value"),
+    Input("input-freq-confidence", "value"),
+)
+def callback_download_all_link(
+    dataset_key,
+    filter_query,
+    return_period,
     alpha,
     src_ks,
     src_chisquare,
@@ -340,41 +1337,95 @@ def callback_download_fit(
     src_lognormal,
     src_gumbel,
     src_logpearson3,
+    bootstrap,
+    n_replicates,
+    confidence,
 ):
-    """Callback function for downloading goodness of fit."""
-    dataframe = pyfunc.transform_to_dataframe(table_data, table_columns)
-
-    alpha = float(alpha)
-
-    ks_frame, chi_frame, report_fit = pyfunc.generate_report_fit(
-        dataframe,
-        alpha,
-        src_ks,
-        src_chisquare,
-        src_normal,
-        src_lognormal,
-        src_gumbel,
-        src_logpearson3,
-    )
+    """Callback function for updating the links of the ZIP archives."""
+    if not dataset_key:
+        return None, True, None, True
+
+    query = {
+        "filter_query": filter_query or "",
+        "return_periods": return_period or "",
+        "alpha": alpha,
+        "src_ks": src_ks,
+        "src_chisquare": src_chisquare,
+        "src_normal": src_normal,
+        "src_lognormal": src_lognormal,
+        "src_gumbel": src_gumbel,
+        "src_logpearson3": src_logpearson3,
+    }
+    bootstrap = {
+        "bootstrap": bootstrap,
+        "n_replicates": n_replicates,
+        "confidence": confidence,
+    }
+    url = f"/download/{dataset_key}.zip?"
 
     return (
-        dcc.send_data_frame(ks_frame.to_csv, "KS.csv"),
-        dcc.send_data_frame(chi_frame.to_csv, "CHI.csv"),
-        {"content": report_fit, "filename": "FIT.TXT"},
+        url + urlencode({**query, **bootstrap}),
+        False,
+        url + urlencode({**query, "mode": "batch"}),
+        False,
     )
 
 
-@app.callback(
-    Output("download-table", "data"),
-    Input("button-download-table", "n_clicks"),
-    State("output-table", "derived_virtual_data"),
-    State("output-table", "columns"),
-)
-def callback_download_table(_, table_data, table_columns):
-    """Callback function for downloading table data."""
-    dataframe = pyfunc.transform_to_dataframe(table_data, table_columns)
+# WARM START
 
-    return dcc.send_data_frame(dataframe.to_csv, "TABLE.csv")
+FREQ_OPTION_IDS = [
+    "input-freq-return-period",
+    "select-freq-normal",
+    "select-freq-lognormal",
+    "select-freq-gumbel",
+    "select-freq-logpearson3",
+    "select-freq-bootstrap",
+    "input-freq-replicates",
+    "input-freq-confidence",
+]
+FIT_OPTION_IDS = ["input-fit-alpha", "select-fit-ks", "select-fit-chisquare"]
+
+
+def warm_example():
+    """
+    Compute the figures and reports of the example dataset with the default options.
+
+    The results are stored on disk (pyresults) and shared by all workers, so
+    the example dataset is served without calculation. Every worker prepares
+    the example table, only the first worker claiming the task calculates.
+    """
+    _, dataset_key, _ = _parse_example()
+    if not pyresults.claim("warm-example", dataset_key, appConfig.VERSION):
+        return
+
+    freq_options = [app.layout[component].value for component in FREQ_OPTION_IDS]
+    fit_options = [app.layout[component].value for component in FIT_OPTION_IDS]
+    fit_options += freq_options[1:5]
+
+    computes = [
+        lambda: _figure_stat("row-stat-statistics", dataset_key, None),
+        lambda: _figure_stat("row-stat-distribution", dataset_key, None),
+        lambda: _report_statout(dataset_key, None),
+    ]
+    # the bootstrap (process pool) is calculated when requested
+    if freq_options[5] not in pyfunc.BOOTSTRAP_METHODS:
+        computes += [
+            lambda: _figure_freq(dataset_key, None, *freq_options),
+            lambda: _result_freq(dataset_key, None, *freq_options),
+        ]
+    computes += [
+        lambda container=container: _figure_fit(
+            container, dataset_key, None, *fit_options
+        )
+        for container in FIT_FIGURES
+    ]
+    computes.append(lambda: _report_fit(dataset_key, None, *fit_options))
+
+    _compute_all(computes)
+
+
+if appConfig.RESULTS.WARM_START:
+    _prefetch([warm_example])
 
 
 if __name__ == "__main__":
@@ -0,0 +1,189 @@
+// containers computed when they first become visible, with the store notified
+const LAZY_CONTAINERS = {
+    "row-stat-statistics": "store-visible-stat",
+    "row-stat-distribution": "store-visible-stat",
+    "row-freq-viz": "store-visible-freq",
+    "row-fit-viz": "store-visible-fit",
+    "row-fit-result": "store-visible-fit",
+};
+
+const lazyState = {observer: null, observed: new WeakSet(), seen: new Set(), datasetKey: null};
+
+// chunked (resumable) upload of large files, see pyupload.py
+const UPLOAD_URL = "/upload/";
+const UPLOAD_RETRIES = 5;
+const UPLOAD_ACCEPT = ".csv,.parquet,.arrow,.feather,.ipc,.xlsx,.xlsm,.xls";
+
+// random token of the browser, so the same file is resumed after a reload
+function uploadToken() {
+    let token = window.localStorage.getItem("anfrek-upload-token");
+    if (!token) {
+        const bytes = window.crypto.getRandomValues(new Uint8Array(8));
+        token = Array.from(bytes, function (byte) {
+            return byte.toString(16).padStart(2, "0");
+        }).join("");
+        window.localStorage.setItem("anfrek-upload-token", token);
+    }
+    return token;
+}
+
+// FNV-1a hash of the name, size and date of the file
+function uploadId(file) {
+    const text = [file.name, file.size, file.lastModified].join("|");
+    let hash = 0x811c9dc5;
+    for (let i = 0; i < text.length; i++) {
+        hash ^= text.charCodeAt(i);
+        hash = Math.imul(hash, 0x01000193) >>> 0;
+    }
+    return uploadToken() + "-" + hash.toString(16).padStart(8, "0");
+}
+
+function uploadProgress(value, label, color) {
+    window.dash_clientside.set_props("progress-upload", {
+        value: value,
+        label: label,
+        color: color || "primary",
+    });
+}
+
+function sleep(milliseconds) {
+    return new Promise(function (resolve) {
+        setTimeout(resolve, milliseconds);
+    });
+}
+
+// send the file in chunks from the offset already received by the server,
+// a failed chunk is retried after asking the server for its offset again
+async function uploadFile(file) {
+    const id = uploadId(file);
+    const url = UPLOAD_URL + id;
+    let status = null;
+    let failures = 0;
+
+    while (true) {
+        try {
+            if (!status) {
+                status = await (await fetch(url)).json();
+                if (file.size > status.max_size) {
+                    uploadProgress(0, "File is too large", "danger");
+                    return;
+                }
+                status.offset = status.offset > file.size ? 0 : status.offset;
+            }
+            if (status.offset >= file.size) {
+                break;
+            }
+            const end = Math.min(status.offset + status.chunk_size, file.size);
+            const response = await fetch(url + "?offset=" + status.offset, {
+                method: "PUT",
+                body: file.slice(status.offset, end),
+            });
+            const result = await response.json();
+            if (!response.ok && response.status !== 409) {
+                uploadProgress(0, result.error, "danger");
+                return;
+            }
+            status.offset = result.offset;
+            failures = 0;
+            const percent = Math.floor((100 * status.offset) / file.size);
+            uploadProgress(percent, percent + "%");
+        } catch (error) {
+            failures += 1;
+            if (failures > UPLOAD_RETRIES) {
+                uploadProgress(0, "Upload failed, select the file again to resume", "danger");
+                return;
+            }
+            status = null;
+            await sleep(1000 * failures);
+        }
+    }
+
+    uploadProgress(100, "Reading " + file.name, "success");
+    window.dash_clientside.set_props("store-upload", {
+        data: {upload_id: id, filename: file.name, size: file.size, timestamp: Date.now()},
+    });
+}
+
+document.addEventListener("click", function (event) {
+    if (!event.target.closest || !event.target.closest("#button-upload-large")) {
+        return;
+    }
+    const input = document.createElement("input");
+    input.type = "file";
+    input.accept = UPLOAD_ACCEPT;
+    input.addEventListener("change", function () {
+        if (input.files.length) {
+            uploadFile(input.files[0]);
+        }
+    });
+    input.click();
+});
+
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    anfrek: {
+        // send only the edited cells of the visible page to the server,
+        // the row id is the position of the row in the stored dataset
+        diffTable: function (_timestamp, data, dataPrevious) {
+            if (!data || !dataPrevious) {
+                return window.dash_clientside.no_update;
+            }
+            const previousById = {};
+            dataPrevious.forEach(function (row) {
+                previousById[row.id] = row;
+            });
+            const edits = [];
+            data.forEach(function (row) {
+                const previous = previousById[row.id] || {};
+                Object.keys(row).forEach(function (column) {
+                    if (column !== "id" && row[column] !== previous[column]) {
+                        edits.push({row: row.id, column: column, value: row[column]});
+                    }
+                });
+            });
+            return edits.length ? edits : window.dash_clientside.no_update;
+        },
+
+        // notify the server once per dataset when a lazy container becomes visible
+        observeVisible: function (_activeTab, datasetKey) {
+            if (!window.IntersectionObserver) {
+                return;
+            }
+            if (!lazyState.observer) {
+                lazyState.observer = new IntersectionObserver(function (entries) {
+                    const visible = {};
+                    entries.forEach(function (entry) {
+                        const id = entry.target.id;
+                        if (entry.isIntersecting && !lazyState.seen.has(id)) {
+                            lazyState.seen.add(id);
+                            const store = LAZY_CONTAINERS[id];
+                            visible[store] = (visible[store] || []).concat([id]);
+                        }
+                    });
+                    Object.keys(visible).forEach(function (store) {
+                        window.dash_clientside.set_props(store, {data: visible[store]});
+                    });
+                });
+            }
+            if (datasetKey !== lazyState.datasetKey) {
+                // observe again, the visible containers are reported for the new dataset
+                lazyState.observer.disconnect();
+                lazyState.observed = new WeakSet();
+                lazyState.seen = new Set();
+                lazyState.datasetKey = datasetKey;
+            }
+            if (!datasetKey) {
+                return;
+            }
+            // the content of the active tab is rendered after this callback
+            setTimeout(function () {
+                Object.keys(LAZY_CONTAINERS).forEach(function (id) {
+                    const element = document.getElementById(id);
+                    if (element && !lazyState.observed.has(element)) {
+                        lazyState.observed.add(element);
+                        lazyState.observer.observe(element);
+                    }
+                });
+            }, 0);
+        },
+    },
+});
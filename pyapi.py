@@ -0,0 +1,276 @@
+"""JSON API (Flask blueprint) for programmatic frequency analysis without Dash."""
+
+import io
+import numpy as np
+import pandas as pd
+from flask import Blueprint, jsonify, request
+from pyconfig import appConfig
+import pyfunc
+
+api = Blueprint("api", __name__, url_prefix="/api/v1")
+
+SOURCE_CHOICES = {
+    "src_normal": ["scipy", "soewarno"],
+    "src_lognormal": ["scipy", "soewarno"],
+    "src_gumbel": ["gumbel", "soewarno", "soetopo", "scipy", "powell"],
+    "src_logpearson3": ["scipy", "soewarno", "soetopo", "limantara"],
+    "src_ks": ["scipy", "soewarno", "soetopo"],
+    "src_chisquare": ["scipy", "limantara"],
+}
+
+DEFAULT_OPTIONS = {
+    "return_periods": "2 5 10 25 50 100",
+    "alpha": 0.05,
+    "src_normal": "scipy",
+    "src_lognormal": "scipy",
+    "src_gumbel": "gumbel",
+    "src_logpearson3": "scipy",
+    "src_ks": "scipy",
+    "src_chisquare": "scipy",
+}
+
+# errors of a single series, reported in its result instead of failing the request
+SERIES_ERRORS = (ValueError, ZeroDivisionError, IndexError, KeyError)
+
+
+class APIError(ValueError):
+    """Invalid request, returned as JSON with status 400."""
+
+
+@api.errorhandler(APIError)
+def handle_api_error(error):
+    """Return the error message as JSON."""
+    return jsonify({"error": str(error)}), 400
+
+
+def read_request_data() -> tuple[list[pd.Series], dict]:
+    """
+    Read the series and options of the current request.
+
+    JSON body: `{"series": {name: values}, "dates": [...], ...options}`, where
+    values is a list of numbers (null for missing) or `{"values": [...],
+    "dates": [...]}`. The optional `dates` apply to every series without dates.
+
+    CSV body (`text/csv`): the first column is the date, every other column is
+    a series. The options are taken from the query string.
+
+    Returns:
+        tuple: (list of series, dictionary of raw options).
+    """
+    if request.mimetype in ("text/csv", "text/plain"):
+        try:
+            dataframe = pd.read_csv(
+                io.BytesIO(request.get_data()), index_col=0, parse_dates=True
+            )
+        except (ValueError, pd.errors.ParserError) as e:
+            raise APIError(f"Invalid CSV body: {e}") from e
+        series_list = [dataframe[column] for column in dataframe.columns]
+        options = request.args.to_dict()
+    else:
+        payload = request.get_json(silent=True)
+        if not isinstance(payload, dict):
+            raise APIError("Request body must be a JSON object or CSV (text/csv).")
+        series_list = _read_json_series(payload.get("series"), payload.get("dates"))
+        options = {**request.args.to_dict(), **payload}
+
+    if not series_list:
+        raise APIError("No series in request.")
+    if len(series_list) > appConfig.API.MAX_SERIES:
+        raise APIError(
+            f"Too many series ({len(series_list)}), "
+            f"maximum is {appConfig.API.MAX_SERIES}."
+        )
+
+    series_list = [
+        pd.to_numeric(series, errors="coerce").dropna().rename(str(series.name))
+        for series in series_list
+    ]
+
+    return series_list, options
+
+
+def _is_scalar_list(items) -> bool:
+    return isinstance(items, list) and all(
+        item is None or isinstance(item, (str, int, float)) for item in items
+    )
+
+
+def _read_json_series(series_data, dates=None) -> list[pd.Series]:
+    if not isinstance(series_data, dict):
+        raise APIError('"series" must be an object of {name: values}.')
+
+    series_list = []
+    for name, values in series_data.items():
+        index = dates
+        if isinstance(values, dict):
+            index = values.get("dates", dates)
+            values = values.get("values")
+        if not _is_scalar_list(values):
+            raise APIError(f'Values of series "{name}" must be a list of numbers.')
+        if index is not None and not _is_scalar_list(index):
+            raise APIError(f'Dates of series "{name}" must be a list of dates.')
+        if index is not None and len(index) != len(values):
+            raise APIError(
+                f"Length of dates ({len(index)}) and values ({len(values)}) "
+                f'of series "{name}" do not match.'
+            )
+        try:
+            if index is not None:
+                index = pd.DatetimeIndex(pd.to_datetime(index), name="DATE")
+            series = pd.Series(np.array(values, dtype=object), index=index, name=name)
+        except (ValueError, TypeError) as e:
+            raise APIError(f'Invalid series "{name}": {e}') from e
+        series_list.append(series)
+
+    return series_list
+
+
+def parse_options(options: dict) -> dict:
+    """Validate the raw options and complete them with the defaults."""
+
+    result = {key: options.get(key, default) for key, default in DEFAULT_OPTIONS.items()}
+
+    for key, choices in SOURCE_CHOICES.items():
+        if result[key] not in choices:
+            raise APIError(f'"{key}" must be one of {choices}.')
+
+    try:
+        result["alpha"] = float(result["alpha"])
+    except (TypeError, ValueError) as e:
+        raise APIError('"alpha" must be a number.') from e
+    if not 0 < result["alpha"] < 1:
+        raise APIError('"alpha" must be between 0 and 1.')
+
+    return_periods = result["return_periods"]
+    if isinstance(return_periods, list):
+        return_periods = " ".join(map(str, return_periods))
+    result["return_periods"] = pyfunc.transform_return_period(str(return_periods))
+    if not result["return_periods"]:
+        raise APIError('"return_periods" must contain positive integers.')
+
+    return result
+
+
+def parse_bootstrap_options(options: dict) -> dict:
+    """
+    Validate the confidence interval options and complete them with the defaults.
+
+    Args:
+        options (dict): The raw options `bootstrap` ("none", "nonparametric" or
+            "parametric"), `n_replicates` and `confidence`.
+
+    Returns:
+        dict: The keyword arguments of `pyfunc.calc_freq_bootstrap`,
+            empty without bootstrap.
+    """
+    bootstrap = options.get("bootstrap") or "none"
+    if bootstrap == "none":
+        return {}
+    if bootstrap not in pyfunc.BOOTSTRAP_METHODS:
+        raise APIError(
+            f'"bootstrap" must be one of {["none"] + pyfunc.BOOTSTRAP_METHODS}.'
+        )
+
+    max_replicates = appConfig.BOOTSTRAP.MAX_REPLICATES
+    try:
+        n_replicates = float(
+            options.get("n_replicates") or appConfig.BOOTSTRAP.REPLICATES
+        )
+    except (TypeError, ValueError) as e:
+        raise APIError('"n_replicates" must be an integer.') from e
+    if not n_replicates.is_integer() or not 1 <= n_replicates <= max_replicates:
+        raise APIError(f'"n_replicates" must be an integer from 1 to {max_replicates}.')
+
+    try:
+        confidence = float(options.get("confidence") or appConfig.BOOTSTRAP.CONFIDENCE)
+    except (TypeError, ValueError) as e:
+        raise APIError('"confidence" must be a number.') from e
+    if not 0 < confidence < 1:
+        raise APIError('"confidence" must be between 0 and 1.')
+
+    return {
+        "bootstrap": bootstrap,
+        "n_replicates": int(n_replicates),
+        "confidence": confidence,
+    }
+
+
+def to_json_value(value):
+    """Convert numpy values to JSON values (NaN and infinity as null)."""
+    if isinstance(value, dict):
+        return {key: to_json_value(val) for key, val in value.items()}
+    if isinstance(value, (list, tuple, np.ndarray)):
+        return [to_json_value(val) for val in value]
+    if isinstance(value, (np.integer, int)):
+        return int(value)
+    if isinstance(value, (np.floating, float)):
+        return float(value) if np.isfinite(value) else None
+    return value
+
+
+def analyze_series(series_list: list[pd.Series], func) -> dict:
+    """Apply `func` to every series, errors are reported per series."""
+    results = {}
+    for series in series_list:
+        try:
+            results[series.name] = to_json_value(func(series))
+        except SERIES_ERRORS as e:
+            results[series.name] = {"error": str(e)}
+    return results
+
+
+@api.route("/statistics", methods=["POST"])
+def statistics():
+    """Descriptive, distribution and outlier statistics of each series."""
+    series_list, _ = read_request_data()
+
+    results = analyze_series(
+        series_list, lambda series: pyfunc.calc_statout(series.to_frame())
+    )
+
+    return jsonify({"results": results})
+
+
+@api.route("/frequency", methods=["POST"])
+def frequency():
+    """Design values of each distribution and return period of each series."""
+    series_list, options = read_request_data()
+    options = parse_options(options)
+
+    def calc_frequency(series):
+        freq = pyfunc.generate_dataframe_freq(
+            series.to_frame(),
+            options["return_periods"],
+            options["src_normal"],
+            options["src_lognormal"],
+            options["src_gumbel"],
+            options["src_logpearson3"],
+        )
+        return {dist: freq[dist].to_numpy() for dist in freq.columns}
+
+    results = analyze_series(series_list, calc_frequency)
+
+    return jsonify({"return_periods": options["return_periods"], "results": results})
+
+
+@api.route("/goodness-of-fit", methods=["POST"])
+def goodness_of_fit():
+    """Kolmogorov-Smirnov and Chi-Square test of each series."""
+    series_list, options = read_request_data()
+    options = parse_options(options)
+
+    results = analyze_series(
+        series_list,
+        lambda series: pyfunc.calc_fit_summary(
+            series.to_frame(),
+            options["alpha"],
+            options["src_ks"],
+            options["src_chisquare"],
+            options["src_normal"],
+            options["src_lognormal"],
+            options["src_gumbel"],
+            options["src_logpearson3"],
+        ),
+    )
+
+    return jsonify({"alpha": options["alpha"], "results": results})
@@ -0,0 +1,144 @@
+"""This module contains caching utilities for sharing results between callbacks."""
+
+import hashlib
+import threading
+from collections import OrderedDict
+import pandas as pd
+
+
+class LRUCache:
+    """
+    Thread-safe cache with least-recently-used eviction.
+
+    Args:
+        maxsize (int, optional): The maximum number of entries kept in the cache.
+            Defaults to 32.
+        maxbytes (int, optional): The maximum total size (bytes) of the entries,
+            measured by `sizeof`. Defaults to None (unbounded).
+        sizeof (callable, optional): The size (bytes) of a value.
+            Defaults to None (required with `maxbytes`).
+    """
+
+    def __init__(self, maxsize: int = 32, maxbytes: int = None, sizeof=None):
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.sizeof = sizeof
+        self.nbytes = 0
+        self._data = OrderedDict()
+        self._sizes = {}
+        self._lock = threading.Lock()
+
+    def __contains__(self, key) -> bool:
+        with self._lock:
+            return key in self._data
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+    def get(self, key, default=None):
+        """Return the cached value for `key` and mark it as recently used."""
+        with self._lock:
+            if key not in self._data:
+                return default
+            self._data.move_to_end(key)
+            return self._data[key]
+
+    def set(self, key, value):
+        """
+        Store `value` under `key`, evicting the least recently used entries.
+
+        A value larger than `maxbytes` is not stored.
+        """
+        size = 0 if self.maxbytes is None else int(self.sizeof(value))
+        with self._lock:
+            self._remove(key)
+            if self.maxbytes is not None and size > self.maxbytes:
+                return
+            self._data[key] = value
+            self._sizes[key] = size
+            self.nbytes += size
+            while len(self._data) > self.maxsize or (
+                self.maxbytes is not None and self.nbytes > self.maxbytes
+            ):
+                self._remove(next(iter(self._data)))
+
+    def pop(self, key, default=None):
+        """Remove `key` from the cache and return its value."""
+        with self._lock:
+            return self._remove(key, default)
+
+    def clear(self):
+        """Remove all entries from the cache."""
+        with self._lock:
+            self._data.clear()
+            self._sizes.clear()
+            self.nbytes = 0
+
+    def _remove(self, key, default=None):
+        self.nbytes -= self._sizes.pop(key, 0)
+        return self._data.pop(key, default)
+
+
+def hash_series(series: pd.Series) -> str:
+    """
+    Generate a content hash of a series, including its index and name.
+
+    Args:
+        series (pd.Series): The series to be hashed.
+
+    Returns:
+        str: The hexadecimal digest of the series.
+    """
+    digest = hashlib.sha1(str(series.name).encode("utf-8"))
+    digest.update(pd.util.hash_pandas_object(series, index=True).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def hash_dataframe(dataframe: pd.DataFrame) -> str:
+    """
+    Generate a content hash of a dataframe, including its index and columns.
+
+    Args:
+        dataframe (pd.DataFrame): The dataframe to be hashed.
+
+    Returns:
+        str: The hexadecimal digest of the dataframe.
+    """
+    digest = hashlib.sha1(repr(list(dataframe.columns)).encode("utf-8"))
+    digest.update(
+        pd.util.hash_pandas_object(dataframe, index=True).to_numpy().tobytes()
+    )
+    return digest.hexdigest()
+
+
+def hash_bytes(data) -> str:
+    """
+    Generate a content hash of bytes (or any bytes-like object, e.g. a memory map).
+
+    Args:
+        data (bytes-like): The content to be hashed.
+
+    Returns:
+        str: The hexadecimal digest of the content.
+    """
+    return hashlib.sha1(data).hexdigest()
+
+
+def hash_file(path) -> str:
+    """
+    Generate a content hash of a file, read in blocks.
+
+    Args:
+        path (str or Path): The path of the file.
+
+    Returns:
+        str: The hexadecimal digest of the file, equal to `hash_bytes` of its content.
+    """
+    with open(path, "rb") as file:
+        return hashlib.file_digest(file, "sha1").hexdigest()
+
+
+def make_key(*parts) -> str:
+    """Generate a deterministic cache key from the given parts."""
+    return hashlib.sha1(repr(parts).encode("utf-8")).hexdigest()
@@ -0,0 +1,225 @@
+"""Command-line interface for batch frequency analysis of CSV files (without Dash)."""
+
+import argparse
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+import pandas as pd
+from pyconfig import appConfig
+import pyfunc
+
+
+def find_input_files(paths: list[str], pattern: str = "*.csv", recursive=False):
+    """
+    Find the input files from the given files and directories.
+
+    Args:
+        paths (list): The files or directories.
+        pattern (str, optional): The glob pattern for directories. Defaults to "*.csv".
+        recursive (bool, optional): Whether to search the directories recursively.
+            Defaults to False.
+
+    Returns:
+        list: The sorted list of (base directory, file path).
+    """
+    files = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            found = path.rglob(pattern) if recursive else path.glob(pattern)
+            files.extend((path, file) for file in found if file.is_file())
+        elif path.is_file():
+            files.append((path.parent, path))
+        else:
+            print(f"{path}: not found", file=sys.stderr)
+    return sorted(set(files))
+
+
+def read_station_file(
+    path: Path, annual_maximum: bool = False, hydrological_month: int = 1
+) -> pd.DataFrame:
+    """Read a station file (CSV) as prepared dataframe."""
+    if annual_maximum:
+        dataframe = pyfunc.read_annual_maximum(path, start_month=hydrological_month)
+    else:
+        dataframe = pd.read_csv(path, index_col=0, parse_dates=True)
+    return pyfunc.prepare_dataframe(dataframe)
+
+
+def process_station_file(task: tuple) -> tuple[str, str | None]:
+    """
+    Calculate and write all reports (same as the web downloads) of a station file.
+
+    Args:
+        task (tuple): (file path, output directory, options dictionary).
+
+    Returns:
+        tuple: (file path, error message or None).
+    """
+    path, output_dir, options = task
+
+    try:
+        dataframe = read_station_file(
+            path, options["annual_maximum"], options["hydrological_month"]
+        )
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        sources = (
+            options["src_normal"],
+            options["src_lognormal"],
+            options["src_gumbel"],
+            options["src_logpearson3"],
+        )
+
+        if "statout" in options["reports"]:
+            (output_dir / "STATOUT.TXT").write_text(
+                pyfunc.generate_report_statout(dataframe)
+            )
+
+        if "frequency" in options["reports"]:
+            pyfunc.generate_dataframe_freq(
+                dataframe, options["return_periods"], *sources
+            ).to_csv(output_dir / "FREQUENCY.csv")
+
+        if "fit" in options["reports"]:
+            ks_frame, chi_frame, report_fit = pyfunc.generate_report_fit(
+                dataframe,
+                options["alpha"],
+                options["src_ks"],
+                options["src_chisquare"],
+                *sources,
+            )
+            ks_frame.to_csv(output_dir / "KS.csv")
+            chi_frame.to_csv(output_dir / "CHI.csv")
+            (output_dir / "FIT.TXT").write_text(report_fit)
+    except (OSError, ValueError, ZeroDivisionError, IndexError, KeyError) as e:
+        return str(path), str(e)
+
+    return str(path), None
+
+
+def create_parser() -> argparse.ArgumentParser:
+    """Create the argument parser of the command-line interface."""
+
+    parser = argparse.ArgumentParser(
+        description=(
+            f"{appConfig.DASH_APP.APP_TITLE} ({appConfig.VERSION}). "
+            "Calculate STATOUT/FREQUENCY/KS/CHI/FIT reports of station files."
+        ),
+    )
+    parser.add_argument("inputs", nargs="+", help="station files or directories")
+    parser.add_argument(
+        "-o", "--output", default="output", help="output directory (default: output)"
+    )
+    parser.add_argument(
+        "--pattern", default="*.csv", help="file pattern in directories (default: *.csv)"
+    )
+    parser.add_argument(
+        "-r", "--recursive", action="store_true", help="search directories recursively"
+    )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=appConfig.BATCH.MAX_WORKERS,
+        help="number of worker processes (default: number of CPUs)",
+    )
+    parser.add_argument(
+        "--reports",
+        nargs="+",
+        choices=["statout", "frequency", "fit"],
+        default=["statout", "frequency", "fit"],
+        help="reports to be written (default: all)",
+    )
+    parser.add_argument(
+        "--return-period",
+        default="2 5 10 25 50 100",
+        help='return periods, use space as separator (default: "2 5 10 25 50 100")',
+    )
+    parser.add_argument("--alpha", type=float, default=0.05, help="significance level")
+    parser.add_argument(
+        "--src-normal", default="scipy", choices=["scipy", "soewarno"]
+    )
+    parser.add_argument(
+        "--src-lognormal", default="scipy", choices=["scipy", "soewarno"]
+    )
+    parser.add_argument(
+        "--src-gumbel",
+        default="gumbel",
+        choices=["gumbel", "soewarno", "soetopo", "scipy", "powell"],
+    )
+    parser.add_argument(
+        "--src-logpearson3",
+        default="scipy",
+        choices=["scipy", "soewarno", "soetopo", "limantara"],
+    )
+    parser.add_argument(
+        "--src-ks", default="scipy", choices=["scipy", "soewarno", "soetopo"]
+    )
+    parser.add_argument(
+        "--src-chisquare", default="scipy", choices=["scipy", "limantara"]
+    )
+    parser.add_argument(
+        "--annual-maximum",
+        action="store_true",
+        help="read raw (daily/hourly) series and use the annual maximum series",
+    )
+    parser.add_argument(
+        "--hydrological-month",
+        type=int,
+        default=1,
+        choices=range(1, 13),
+        metavar="MONTH",
+        help="first month of the hydrological year (default: 1)",
+    )
+    return parser
+
+
+def main(argv: list[str] = None) -> int:
+    """Run the command-line interface, returns the exit code."""
+
+    args = create_parser().parse_args(argv)
+
+    files = find_input_files(args.inputs, args.pattern, args.recursive)
+    if not files:
+        print("No input files found.", file=sys.stderr)
+        return 1
+
+    options = {
+        "reports": args.reports,
+        "return_periods": pyfunc.transform_return_period(args.return_period),
+        "alpha": args.alpha,
+        "src_ks": args.src_ks,
+        "src_chisquare": args.src_chisquare,
+        "src_normal": args.src_normal,
+        "src_lognormal": args.src_lognormal,
+        "src_gumbel": args.src_gumbel,
+        "src_logpearson3": args.src_logpearson3,
+        "annual_maximum": args.annual_maximum,
+        "hydrological_month": args.hydrological_month,
+    }
+
+    output = Path(args.output)
+    tasks = [
+        (path, output / path.relative_to(base).with_suffix(""), options)
+        for base, path in files
+    ]
+
+    chunksize = max(1, len(tasks) // ((args.workers or 1) * 4))
+    failed = 0
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        for path, error in executor.map(
+            process_station_file, tasks, chunksize=chunksize
+        ):
+            if error is None:
+                print(f"{path}: OK")
+            else:
+                failed += 1
+                print(f"{path}: {error}", file=sys.stderr)
+
+    print(f"{len(tasks) - failed}/{len(tasks)} files processed, output in {output}")
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,7 @@
 """Configuration file for the application."""
 
+from pathlib import Path
 from box import Box
 
-_CONFIG_PATH = "app_config.yml"
+_CONFIG_PATH = Path(__file__).with_name("app_config.yml")
 appConfig = Box.from_yaml(filename=_CONFIG_PATH)
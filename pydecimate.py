@@ -0,0 +1,204 @@
+"""This module contains the decimation of long series for large-data figures."""
+
+import numpy as np
+import pandas as pd
+from pyconfig import appConfig
+import pycache
+
+
+def decimate_minmax(values: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Select the minimum and maximum of equal-size buckets (min-max decimation).
+
+    The extremes (floods and droughts) are always kept, which is preferred for
+    hydrological series.
+
+    Args:
+        values (np.ndarray): The values without missing values.
+        n_out (int): The target number of points.
+
+    Returns:
+        np.ndarray: The sorted positions of the selected points.
+    """
+    count = values.size
+    if count <= n_out:
+        return np.arange(count)
+
+    n_buckets = max(1, n_out // 2)
+    bucket_size = -(-count // n_buckets)
+    n_buckets = -(-count // bucket_size)
+    padding = n_buckets * bucket_size - count
+
+    lower = np.append(values, np.full(padding, np.inf)).reshape(n_buckets, -1)
+    upper = np.append(values, np.full(padding, -np.inf)).reshape(n_buckets, -1)
+    offset = np.arange(n_buckets) * bucket_size
+
+    positions = np.concatenate(
+        [offset + lower.argmin(axis=1), offset + upper.argmax(axis=1)]
+    )
+    return np.unique(positions)
+
+
+def decimate_lttb(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Select points with the Largest-Triangle-Three-Buckets algorithm.
+
+    Args:
+        x (np.ndarray): The numeric x values (ascending).
+        y (np.ndarray): The values without missing values.
+        n_out (int): The target number of points.
+
+    Returns:
+        np.ndarray: The sorted positions of the selected points,
+            the first and last point are always selected.
+    """
+    count = y.size
+    if count <= n_out or n_out < 3:
+        return np.arange(count)
+
+    x = np.asarray(x, dtype=float)
+    edges = np.linspace(1, count - 1, n_out - 1).astype(int)
+    positions = np.empty(n_out, dtype=int)
+    positions[0], positions[-1] = 0, count - 1
+
+    selected = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        if i == n_out - 3:
+            next_x, next_y = x[-1], y[-1]
+        else:
+            next_end = edges[i + 2]
+            next_x, next_y = x[end:next_end].mean(), y[end:next_end].mean()
+
+        area = np.abs(
+            (x[selected] - next_x) * (y[start:end] - y[selected])
+            - (x[selected] - x[start:end]) * (next_y - y[selected])
+        )
+        selected = start + int(area.argmax())
+        positions[i + 1] = selected
+
+    return positions
+
+
+class ResolutionPyramid:
+    """
+    Precomputed levels of a series with decreasing resolution.
+
+    Level 0 is the full series, every next level is reduced by `factor` with
+    min-max decimation until it fits the point budget. A view (zoom range) uses
+    the finest level with at most `factor` times the budget points in the range,
+    reduced to the budget with LTTB.
+
+    Args:
+        series (pd.Series): The series with DATE as index, missing values are ignored.
+        budget (int, optional): The number of points of a view.
+            Defaults to VIZ.POINT_BUDGET of app config.
+        factor (int, optional): The reduction between levels.
+            Defaults to VIZ.PYRAMID_FACTOR of app config.
+    """
+
+    def __init__(self, series: pd.Series, budget: int = None, factor: int = None):
+        series = series.dropna().sort_index()
+        self.series = series
+        self.budget = budget or appConfig.VIZ.POINT_BUDGET
+        self.factor = max(2, factor or appConfig.VIZ.PYRAMID_FACTOR)
+
+        self._x = series.index.to_numpy()
+        self._y = series.to_numpy(dtype=float)
+
+        levels = [np.arange(series.size)]
+        while levels[-1].size > self.budget:
+            level = levels[-1]
+            reduced = decimate_minmax(self._y[level], level.size // self.factor)
+            levels.append(level[reduced])
+        self.levels = levels
+
+    def select(self, start=None, end=None) -> pd.Series:
+        """
+        Return the points of a view within the point budget.
+
+        Args:
+            start (optional): The start of the view (date). Defaults to None (first).
+            end (optional): The end of the view (date). Defaults to None (last).
+
+        Returns:
+            pd.Series: The selected points, including one point outside each
+                end of the view so the line continues to the edges.
+        """
+        start = None if start is None else np.datetime64(pd.Timestamp(start), "ns")
+        end = None if end is None else np.datetime64(pd.Timestamp(end), "ns")
+
+        for level in self.levels:
+            x_level = self._x[level]
+            lower = 0 if start is None else np.searchsorted(x_level, start)
+            upper = (
+                level.size
+                if end is None
+                else np.searchsorted(x_level, end, side="right")
+            )
+            if upper - lower <= self.budget * self.factor:
+                break
+
+        view = level[max(lower - 1, 0) : min(upper + 1, level.size)]
+        reduced = decimate_lttb(
+            self._x[view].astype("int64"), self._y[view], self.budget
+        )
+
+        return self.series.iloc[view[reduced]]
+
+
+def is_large(dataframe: pd.DataFrame) -> bool:
+    """Return True if the dataframe is plotted in large-data mode."""
+    return dataframe.index.size > appConfig.VIZ.LARGE_DATA_THRESHOLD
+
+
+def parse_relayout_range(relayout_data: dict, axes: tuple = None) -> tuple | None:
+    """
+    Return the x range of a relayout event of a graph with shared x axes.
+
+    Args:
+        relayout_data (dict): The `relayoutData` of dcc.Graph.
+        axes (tuple, optional): The names of the x axes of the series (date axes),
+            e.g. ("xaxis",). Defaults to None (every x axis).
+
+    Returns:
+        tuple or None: (start, end) of the zoom, (None, None) for autorange,
+            or None if the x range is not changed.
+    """
+    if not relayout_data:
+        return None
+
+    for key, value in relayout_data.items():
+        axis, _, prop = key.partition(".")
+        if not axis.startswith("xaxis") or (axes is not None and axis not in axes):
+            continue
+        if prop == "autorange" and value:
+            return None, None
+        if prop == "range" and isinstance(value, list):
+            return value[0], value[1]
+        if prop == "range[0]":
+            return value, relayout_data.get(f"{axis}.range[1]")
+
+    return None
+
+
+_PYRAMIDS = pycache.LRUCache(maxsize=appConfig.CACHE.PYRAMID_MAXSIZE)
+
+
+def get_pyramid(key, series: pd.Series) -> ResolutionPyramid:
+    """
+    Return the resolution pyramid of a series, created if not available.
+
+    Args:
+        key (hashable): The key of the series (dataset key and filter).
+        series (pd.Series): The series.
+
+    Returns:
+        ResolutionPyramid: The pyramid of the series.
+    """
+    key = (key, series.name)
+    pyramid = _PYRAMIDS.get(key)
+    if pyramid is None:
+        pyramid = ResolutionPyramid(series)
+        _PYRAMIDS.set(key, pyramid)
+    return pyramid
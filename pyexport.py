@@ -0,0 +1,178 @@
+"""This module contains the streaming ZIP export of the analysis reports."""
+
+import functools
+import json
+import zipfile
+from datetime import datetime, timezone
+import pandas as pd
+from pyconfig import appConfig
+import pyfunc
+
+# errors of a single report, written as an error file instead of stopping the archive
+ENTRY_ERRORS = (ValueError, ZeroDivisionError, IndexError, KeyError)
+
+
+class _ZipStream:
+    """Write-only file object that keeps the bytes written by ZipFile until popped."""
+
+    def __init__(self):
+        self._buffer = bytearray()
+
+    def write(self, data) -> int:
+        """Append the data to the buffer."""
+        self._buffer += data
+        return len(data)
+
+    def flush(self):
+        """Nothing to flush, the data is popped by the generator."""
+
+    def pop(self) -> bytes:
+        """Return and clear the buffered bytes."""
+        data = bytes(self._buffer)
+        self._buffer.clear()
+        return data
+
+
+def stream_zip(entries):
+    """
+    Generate a ZIP archive chunk by chunk.
+
+    Only one entry is held in memory at a time, the archive is never built
+    completely. An entry that fails with a calculation error is written as
+    `<name>.ERROR.TXT` with the error message.
+
+    Args:
+        entries (iterable): The (name, content) pairs, content is a string,
+            bytes or a callable (without arguments) returning one of them.
+
+    Yields:
+        bytes: The next chunk of the archive.
+    """
+    stream = _ZipStream()
+    with zipfile.ZipFile(stream, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for name, content in entries:
+            if callable(content):
+                try:
+                    content = content()
+                except ENTRY_ERRORS as e:
+                    name, content = f"{name}.ERROR.TXT", f"{type(e).__name__}: {e}"
+            archive.writestr(name, content)
+            yield stream.pop()
+    yield stream.pop()
+
+
+def generate_manifest(
+    mode: str, dataset_key: str, dataframe: pd.DataFrame, filter_query, options: dict
+) -> str:
+    """
+    Generate the JSON manifest of an archive.
+
+    Args:
+        mode (str): "single" (first column) or "batch" (every station).
+        dataset_key (str): The key of the stored dataset.
+        dataframe (pd.DataFrame): The (filtered) dataset.
+        filter_query (str): The filter query of the table.
+        options (dict): The parameters of the analysis.
+
+    Returns:
+        str: The manifest as JSON.
+    """
+    manifest = {
+        "application": appConfig.DASH_APP.ALIAS,
+        "version": appConfig.VERSION,
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "mode": mode,
+        "dataset_key": dataset_key,
+        "filter_query": filter_query,
+        "rows": int(dataframe.index.size),
+        "stations": [str(column) for column in dataframe.columns],
+        "options": options,
+    }
+    return json.dumps(manifest, indent=2)
+
+
+def station_directory(name) -> str:
+    """Return a directory name for a station that is safe in a ZIP archive."""
+    return str(name).replace("/", "_").replace("\\", "_").strip(". ") or "_"
+
+
+def station_directories(names, reserved=()) -> list[str]:
+    """
+    Return the directory names of the stations, unique in a ZIP archive.
+
+    Names that are the same after `station_directory` (ignoring the case, as
+    on Windows) get a counter suffix, e.g. "a_b", "a_b_2".
+
+    Args:
+        names (iterable): The names of the stations.
+        reserved (iterable, optional): The names already used in the archive.
+            Defaults to ().
+
+    Returns:
+        list: The directory names in the order of `names`.
+    """
+    used = {name.casefold() for name in reserved}
+    directories = []
+    for name in names:
+        base = directory = station_directory(name)
+        counter = 1
+        while directory.casefold() in used:
+            counter += 1
+            directory = f"{base}_{counter}"
+        used.add(directory.casefold())
+        directories.append(directory)
+    return directories
+
+
+def generate_station_entries(
+    series: pd.Series,
+    return_periods: list[int],
+    alpha: float,
+    src_ks: str,
+    src_chisquare: str,
+    src_normal: str,
+    src_lognormal: str,
+    src_gumbel: str,
+    src_logpearson3: str,
+    directory: str = None,
+):
+    """
+    Generate the archive entries (reports) of a station.
+
+    The reports are calculated from the series as the single-station reports,
+    missing values are noted in STATOUT.TXT.
+
+    Args:
+        series (pd.Series): The series of the station.
+        return_periods (list): The return periods.
+        alpha (float): The significance level.
+        src_ks (str): The source of the Kolmogorov-Smirnov critical value.
+        src_chisquare (str): The source of the Chi-Square critical value.
+        src_normal (str): The source of the normal distribution.
+        src_lognormal (str): The source of the log normal distribution.
+        src_gumbel (str): The source of the gumbel distribution.
+        src_logpearson3 (str): The source of the log pearson III distribution.
+        directory (str, optional): The directory of the station in the archive.
+            Defaults to None (`station_directory` of the series name).
+
+    Yields:
+        tuple: (name, callable) of STATOUT.TXT, FREQUENCY.csv, KS.csv, CHI.csv
+            and FIT.TXT in the directory of the station.
+    """
+    directory = directory or station_directory(series.name)
+    dataframe = series.to_frame()
+    sources = (src_normal, src_lognormal, src_gumbel, src_logpearson3)
+
+    @functools.cache
+    def report_fit():
+        return pyfunc.generate_report_fit(
+            dataframe, alpha, src_ks, src_chisquare, *sources
+        )
+
+    yield f"{directory}/STATOUT.TXT", lambda: pyfunc.generate_report_statout(dataframe)
+    yield f"{directory}/FREQUENCY.csv", lambda: pyfunc.generate_dataframe_freq(
+        dataframe, return_periods, *sources
+    ).to_csv()
+    yield f"{directory}/KS.csv", lambda: report_fit()[0].to_csv()
+    yield f"{directory}/CHI.csv", lambda: report_fit()[1].to_csv()
+    yield f"{directory}/FIT.TXT", lambda: report_fit()[2]
@@ -3,16 +3,16 @@
 """MODULE FOR GENERATE FIGURE RELATED"""
 
 from itertools import cycle, islice
+from plotly import colors as plotly_colors
 from plotly.subplots import make_subplots
 import plotly.graph_objects as go
 import numpy as np
 import pandas as pd
-from hidrokit.contrib.taruma import outlier_hydrology
-from hidrokit.contrib.taruma import statistical_coefficients
 from hidrokit.contrib.taruma import kolmogorov_smirnov, chi_square
-from hidrokit.contrib.taruma import normal, gumbel, lognormal, logpearson3
 from pyconfig import appConfig
 import pytemplate
+import pyfunc
+import pydecimate
 
 
 def generate_watermark(subplot_number: int = 1) -> dict:
@@ -76,8 +76,14 @@ def generate_empty_figure(
     return go.Figure(data, layout)
 
 
-def generate_data_viz(dataframe):
+def generate_data_viz(
+    dataframe: pd.DataFrame, pyramid: pydecimate.ResolutionPyramid = None
+) -> go.Figure:
     """GENERATE DATA VISUALIZATION"""
+
+    if pydecimate.is_large(dataframe):
+        return generate_data_viz_large(dataframe, pyramid)
+
     rows = 2
 
     fig = make_subplots(
@@ -157,15 +163,94 @@ def generate_data_viz(dataframe):
     return fig
 
 
-def generate_statistic_outlier(dataframe: pd.DataFrame) -> go.Figure:
+def generate_data_viz_large(
+    dataframe: pd.DataFrame, pyramid: pydecimate.ResolutionPyramid = None
+) -> go.Figure:
+    """
+    Generate the data visualization of a long series (large-data mode).
+
+    The series is decimated to the point budget and plotted with WebGL traces
+    on a date axis. A zoom is served from the pyramid by patching the traces.
+
+    Args:
+        dataframe (pd.DataFrame): The dataframe with DATE as index.
+        pyramid (pydecimate.ResolutionPyramid, optional): The pyramid of the
+            first column. Defaults to None (created).
+
+    Returns:
+        go.Figure: The figure with the line (trace 0) and size strip (trace 1).
+    """
+    rows = 2
+
+    if pyramid is None:
+        pyramid = pydecimate.ResolutionPyramid(dataframe.iloc[:, 0])
+    series = pyramid.select()
+
+    fig = make_subplots(
+        rows=rows,
+        cols=1,
+        shared_xaxes=True,
+        vertical_spacing=0.05,
+        row_heights=[0.8, 0.2],
+    )
+
+    fig.layout.images = [generate_watermark(n) for n in range(2, rows + 1)]
+
+    data_line = go.Scattergl(
+        x=series.index,
+        y=series.to_numpy(),
+        name=dataframe.columns[0],
+        mode="lines",
+        showlegend=False,
+        line_width=1,
+        hovertemplate="%{x|%Y-%m-%d}: %{y:.2f}<extra></extra>",
+    )
+
+    data_strip = go.Scattergl(
+        x=series.index,
+        y=[dataframe.columns[0]] * series.size,
+        marker_size=series.to_numpy(),
+        marker_sizeref=2.0 * dataframe.max().max() / (12**2),
+        marker_sizemode="area",
+        marker_line_width=0,
+        name=dataframe.columns[0],
+        mode="markers",
+        showlegend=False,
+        hoverinfo="skip",
+    )
+
+    fig.add_traces(data_line, rows=1, cols=1)
+    fig.add_traces(data_strip, rows=2, cols=1)
+    fig.update_layout(hovermode="x", margin={"t": 0}, dragmode="zoom")
+    fig.update_xaxes(
+        gridcolor=pytemplate.FONT_COLOR_RGB_ALPHA.replace("0.4", "0.1"), gridwidth=1
+    )
+    fig.update_yaxes(
+        gridcolor=pytemplate.FONT_COLOR_RGB_ALPHA.replace("0.4", "0.1"),
+        gridwidth=1,
+        fixedrange=True,
+    )
+
+    return fig
+
+
+def generate_statistic_outlier(
+    dataframe: pd.DataFrame,
+    moments: pyfunc.Moments = None,
+    pyramid: pydecimate.ResolutionPyramid = None,
+) -> go.Figure:
     """Generate Statistic Outlier Figure"""
 
     columns = 2
     rows = 1
 
-    new_x = dataframe.index.strftime("%Y")
+    large = pydecimate.is_large(dataframe)
+
     new_y = dataframe.iloc[:, 0]
 
+    if moments is None:
+        moments = pyfunc.calc_moments(new_y)
+
     fig = make_subplots(
         rows=rows,
         cols=columns,
@@ -176,38 +261,66 @@ def generate_statistic_outlier(dataframe: pd.DataFrame) -> go.Figure:
 
     fig.layout.images = [generate_watermark(n) for n in range(2, columns + 1)]
 
-    data_scatter = go.Scatter(
-        x=new_x,
-        y=new_y,
-        mode="markers+lines",
-        showlegend=False,
-        line_width=1,
-        line_dash="dashdot",
-        marker_size=8,
-        hovertemplate="%{y}<extra></extra>",
-    )
+    if large:
+        # decimated WebGL line and box of the precomputed statistics
+        if pyramid is None:
+            pyramid = pydecimate.ResolutionPyramid(new_y)
+        series = pyramid.select()
+
+        data_scatter = go.Scattergl(
+            x=series.index,
+            y=series.to_numpy(),
+            mode="lines",
+            showlegend=False,
+            line_width=1,
+            hovertemplate="%{x|%Y-%m-%d}: %{y}<extra></extra>",
+        )
 
-    data_boxplot = go.Box(
-        y=new_y,
-        boxpoints="all",
-        jitter=0.3,
-        pointpos=-1.5,
-        showlegend=False,
-        boxmean="sd",
-        name=dataframe.columns[0],
-    )
+        data_boxplot = go.Box(
+            x=[dataframe.columns[0]],
+            q1=[moments.p25],
+            median=[moments.p50],
+            q3=[moments.p75],
+            lowerfence=[moments.min],
+            upperfence=[moments.max],
+            mean=[moments.mean],
+            sd=[moments.std],
+            boxmean="sd",
+            boxpoints=False,
+            showlegend=False,
+            name=dataframe.columns[0],
+        )
+    else:
+        data_scatter = go.Scatter(
+            x=dataframe.index.strftime("%Y"),
+            y=new_y,
+            mode="markers+lines",
+            showlegend=False,
+            line_width=1,
+            line_dash="dashdot",
+            marker_size=8,
+            hovertemplate="%{y}<extra></extra>",
+        )
+
+        data_boxplot = go.Box(
+            y=new_y,
+            boxpoints="all",
+            jitter=0.3,
+            pointpos=-1.5,
+            showlegend=False,
+            boxmean="sd",
+            name=dataframe.columns[0],
+        )
 
     fig.add_trace(data_scatter, row=1, col=1)
     fig.add_trace(data_boxplot, row=1, col=2)
 
-    mean = new_y.mean()
-    std = new_y.std()
+    mean = moments.mean
+    std = moments.std
     meanplus = mean + std
     meanminus = mean - std
 
-    lower_bound, upper_bound = outlier_hydrology.calc_boundary(
-        new_y.replace(0, np.nan).dropna().to_frame()
-    )
+    lower_bound, upper_bound = pyfunc.calc_outlier_boundary(moments)
 
     fig.add_hline(y=mean, row=1, col=1, line_width=2, line_dash="dashdot")
     fig.add_hline(y=meanplus, row=1, col=1, line_width=1, line_dash="longdash")
@@ -287,12 +400,15 @@ def generate_statistic_outlier(dataframe: pd.DataFrame) -> go.Figure:
     return fig
 
 
-def generate_distribution_check(dataframe: pd.DataFrame) -> go.Figure:
+def generate_distribution_check(
+    dataframe: pd.DataFrame, moments: pyfunc.Moments = None
+) -> go.Figure:
     """Generate figure of distribution check"""
     rows = 1
     columns = 5
 
-    series = dataframe.iloc[:, 0]
+    if moments is None:
+        moments = pyfunc.calc_moments(dataframe.iloc[:, 0])
 
     fig = make_subplots(
         rows=rows,
@@ -313,7 +429,7 @@ def generate_distribution_check(dataframe: pd.DataFrame) -> go.Figure:
 
     fig.layout.images = [generate_watermark(n) for n in range(2, columns + 1)]
 
-    coef_cv, coef_cs, coef_ck = statistical_coefficients.calc_coef(series)
+    coef_cv, coef_cs, coef_ck = moments.cv, moments.cs, moments.ck
 
     data_bar = go.Bar(
         x="$C_v$ $C_s$ $C_k$".split(),
@@ -576,13 +692,17 @@ def generate_frequency_analysis(
     src_lognormal: str,
     src_gumbel: str,
     src_logpearson3: str,
+    bootstrap: str = None,
+    n_replicates: int = None,
+    confidence: float = None,
+    design_values: np.ndarray = None,
 ) -> go.Figure:
     """Generate Frequency Analysis Visualization"""
 
     rows = 2
     columns = 1
 
-    dataframe = dataframe.iloc[:, 0].replace(0, np.nan).dropna().to_frame()
+    series = dataframe.iloc[:, 0].replace(0, np.nan).dropna()
 
     fig = make_subplots(
         rows=rows,
@@ -595,32 +715,18 @@ def generate_frequency_analysis(
 
     x_all = np.arange(1, len(return_period) + 1)
 
-    y_normal = (
-        normal.freq_normal(dataframe, return_periods=return_period, source=src_normal)
-        .to_numpy()
-        .flatten()
-    )
-    y_lognormal = (
-        lognormal.freq_lognormal(
-            dataframe, return_periods=return_period, source=src_lognormal
+    if design_values is None:
+        design_values = pyfunc.calc_freq_matrix(
+            series,
+            return_period,
+            src_normal,
+            src_lognormal,
+            src_gumbel,
+            src_logpearson3,
         )
-        .to_numpy()
-        .flatten()
-    )
-    y_gumbel = (
-        gumbel.freq_gumbel(dataframe, return_periods=return_period, source=src_gumbel)
-        .to_numpy()
-        .flatten()
-    )
-    y_logpearson3 = (
-        logpearson3.freq_logpearson3(
-            dataframe, return_periods=return_period, source=src_logpearson3
-        )
-        .to_numpy()
-        .flatten()
-    )
+    y_all = design_values
 
-    col_y = [y_normal, y_lognormal, y_gumbel, y_logpearson3]
+    col_y = list(y_all.T)
     col_title = "Normal,Log Normal,Gumbel,Log Pearson III".split(",")
     col_symbol = "circle-dot square-dot diamond-dot cross-dot".split()
 
@@ -688,9 +794,61 @@ def generate_frequency_analysis(
     for data, color in zip(fig.data, colors * 2):
         data.marker.color = color
 
+    if bootstrap:
+        bounds = pyfunc.calc_freq_bootstrap(
+            series,
+            return_period,
+            src_normal,
+            src_lognormal,
+            src_gumbel,
+            src_logpearson3,
+            method=bootstrap,
+            n_replicates=n_replicates,
+            confidence=confidence,
+        )
+
+        # confidence bands are added after the lines and bars
+        for lower, upper, title, color in zip(
+            bounds[0].T, bounds[1].T, col_title, colors
+        ):
+            red, green, blue = plotly_colors.hex_to_rgb(color)
+            for y, name, fill in zip(
+                [upper, lower], ["Upper", "Lower"], ["none", "tonexty"]
+            ):
+                fig.add_trace(
+                    go.Scatter(
+                        x=x_all,
+                        y=y,
+                        name=f"{title} {name}",
+                        mode="lines",
+                        line_width=0,
+                        line_color=color,
+                        fill=fill,
+                        fillcolor=f"rgba({red},{green},{blue},0.15)",
+                        legendgroup=title,
+                        showlegend=False,
+                    ),
+                    row=1,
+                    col=1,
+                )
+
     return fig
 
 
+def _thin_ks(ksdf: pd.DataFrame) -> pd.DataFrame:
+    """Return the rows of a KS table within the point budget (extremes of delta)."""
+    return ksdf.iloc[
+        pydecimate.decimate_minmax(ksdf.d.to_numpy(), appConfig.VIZ.POINT_BUDGET)
+    ]
+
+
+def _thin_strip(series: pd.Series) -> pd.Series | np.ndarray:
+    """Return the points of a strip within the point budget (evenly spaced quantiles)."""
+    if series.size <= appConfig.VIZ.POINT_BUDGET:
+        return series
+    return np.quantile(series, np.linspace(0, 1, appConfig.VIZ.POINT_BUDGET))
+
+
 def generate_goodness_fit_viz(
     dataframe: pd.DataFrame,
     alpha: float,
@@ -726,22 +884,50 @@ def generate_goodness_fit_viz(
 
     # RANK (1,1)
 
-    bar_x = series.sort_values(ascending=False)
-    bar_y = [f"$R_{{{rank}}}$" for rank in range(1, series.size + 1)][::-1]
-
-    bar_rank = go.Bar(
-        x=bar_x,
-        y=bar_y,
-        orientation="h",
-        showlegend=False,
-        hovertemplate="<b>R<sub>%{customdata}</sub></b>: <i>%{x}</i><extra></extra>",
-        customdata=np.arange(1, series.size + 1)[::-1],
-    )
+    if series.size > appConfig.VIZ.RANK_LABEL_THRESHOLD:
+        # numeric axis with thinned tick labels, a LaTeX label per rank is too slow
+        tickvals = np.unique(
+            np.linspace(1, series.size, appConfig.VIZ.RANK_TICKS).round().astype(int)
+        )
+        rank_axis = {
+            "autorange": "reversed",
+            "tickvals": tickvals,
+            "ticktext": [f"R<sub>{rank}</sub>" for rank in tickvals],
+        }
+        # a bar (the largest value) per group of ranks within the point budget
+        group = -(-series.size // appConfig.VIZ.POINT_BUDGET)
+        first = np.arange(1, series.size + 1, group)
+        last = np.minimum(first + group - 1, series.size)
+        bar_rank = go.Bar(
+            x=np.sort(series.to_numpy())[last - 1],
+            y=(first + last) / 2,
+            width=0.8 * (last - first + 1),
+            orientation="h",
+            showlegend=False,
+            hovertemplate=(
+                "<b>R<sub>%{customdata[0]}</sub></b>: <i>%{x}</i><extra></extra>"
+                if group == 1
+                else "<b>R<sub>%{customdata[0]}</sub>-R<sub>%{customdata[1]}</sub></b>"
+                ": <i>%{x}</i> (max)<extra></extra>"
+            ),
+            customdata=np.column_stack([first, last]),
+        )
+    else:
+        rank_axis = {}
+        bar_rank = go.Bar(
+            x=series.sort_values(ascending=False),
+            y=[f"$R_{{{rank}}}$" for rank in range(1, series.size + 1)][::-1],
+            orientation="h",
+            showlegend=False,
+            hovertemplate="<b>R<sub>%{customdata}</sub></b>: <i>%{x}</i><extra></extra>",
+            customdata=np.arange(1, series.size + 1)[::-1],
+        )
 
     fig.add_trace(bar_rank, row=1, col=1)
 
     fig.update_layout(
         yaxis={
+            **rank_axis,
             "spikethickness": 1,
             "showspikes": True,
             "spikemode": "across",
@@ -759,40 +945,23 @@ def generate_goodness_fit_viz(
 
     # KOLMOGOROV-SMIRNOV (CDF)
 
-    ks_normal = kolmogorov_smirnov.kolmogorov_smirnov_test(
-        dataframe,
-        distribution="normal",
-        distribution_source=src_normal,
-        significance_level=alpha,
-        critical_value_source=src_ks,
-        display_stat=False,
-    )
-    ks_lognormal = kolmogorov_smirnov.kolmogorov_smirnov_test(
+    ks_result, _ = pyfunc.calc_goodness_fit(
         dataframe,
-        distribution="lognormal",
-        distribution_source=src_lognormal,
-        significance_level=alpha,
-        critical_value_source=src_ks,
-        display_stat=False,
-    )
-    ks_gumbel = kolmogorov_smirnov.kolmogorov_smirnov_test(
-        dataframe,
-        distribution="gumbel",
-        distribution_source=src_gumbel,
-        significance_level=alpha,
-        critical_value_source=src_ks,
-        display_stat=False,
-    )
-    ks_logpearson3 = kolmogorov_smirnov.kolmogorov_smirnov_test(
-        dataframe,
-        distribution="logpearson3",
-        distribution_source=src_logpearson3,
-        significance_level=alpha,
-        critical_value_source=src_ks,
-        display_stat=False,
-    )
+        alpha,
+        src_ks,
+        src_chisquare,
+        src_normal,
+        src_lognormal,
+        src_gumbel,
+        src_logpearson3,
+    )
+    ks_normal = ks_result["normal"]
+    ks_lognormal = ks_result["lognormal"]
+    ks_gumbel = ks_result["gumbel"]
+    ks_logpearson3 = ks_result["logpearson3"]
 
     def ks_cdf(ksdf: pd.DataFrame, dist: str) -> list[go.Scatter]:
+        ksdf = _thin_ks(ksdf)
 
         x = ksdf.x
         p_w = ksdf.p_w
@@ -857,7 +1026,7 @@ def generate_goodness_fit_viz(
     # ADD STRIP
 
     strip = go.Box(
-        y=series,
+        y=_thin_strip(series),
         showlegend=False,
         # alignmentgroup=True,
         boxpoints="all",
@@ -876,23 +1045,21 @@ def generate_goodness_fit_viz(
 
     n_class = chi_square._calc_k(series.size)  # pylint: disable=protected-access
 
-    # NORMAL
-
-    def create_class_sep(n_class, func_freq, series, func_source):
+    def create_class_sep(n_class, series):
         # SOURCE: hidrokit.contrib.taruma.chi_square (v0.4.0)
         prob_list = np.linspace(0, 1, n_class + 1)[::-1]
         prob_seq = prob_list[1:-1]
 
         periods = 1 / prob_seq
-        val_x = (
-            func_freq(series.to_frame(), return_periods=periods, source=func_source)
-            .to_numpy()
-            .flatten()
+        val_x = pyfunc.calc_freq_matrix(
+            series, periods, src_normal, src_lognormal, src_gumbel, src_logpearson3
         )
 
         # Chi Square Table
-        seq_x = np.concatenate([[series.min()], val_x, [series.max()]])
-        return seq_x
+        seq_min = np.full((1, val_x.shape[1]), series.min())
+        seq_max = np.full((1, val_x.shape[1]), series.max())
+        seq_x = np.concatenate([seq_min, val_x, seq_max])
+        return seq_x.T
 
     def shape_class_sep(seperator: np.ndarray, n: int, series: pd.Series):
         # COLOR
@@ -903,17 +1070,19 @@ def generate_goodness_fit_viz(
         counter = []
         sep_classes = []
         for i, fillcolor in zip(range(1, seperator.size), color):
-            fig.add_shape(
-                type="rect",
-                x0=0,
-                y0=seperator[i - 1],
-                x1=1,
-                y1=seperator[i],
-                xref=f"x{n} domain",
-                yref=f"y{n}",
-                fillcolor=fillcolor,
-                opacity=0.2,
-                line_width=1,
+            class_shapes.append(
+                go.layout.Shape(
+                    type="rect",
+                    x0=0,
+                    y0=seperator[i - 1],
+                    x1=1,
+                    y1=seperator[i],
+                    xref=f"x{n} domain",
+                    yref=f"y{n}",
+                    fillcolor=fillcolor,
+                    opacity=0.2,
+                    line_width=1,
+                )
             )
             left = -np.inf if i == 1 else seperator[i - 1]
             right = np.inf if i == seperator.size - 1 else seperator[i]
@@ -956,18 +1125,12 @@ def generate_goodness_fit_viz(
             hovertext=counter_classes,
         )
 
-    sep_normal = create_class_sep(n_class, normal.freq_normal, series, src_normal)
-    shape_class_sep(sep_normal, 6, series)
-    sep_lognormal = create_class_sep(
-        n_class, lognormal.freq_lognormal, series, src_lognormal
-    )
-    shape_class_sep(sep_lognormal, 7, series)
-    sep_gumbel = create_class_sep(n_class, gumbel.freq_gumbel, series, src_gumbel)
-    shape_class_sep(sep_gumbel, 8, series)
-    sep_logpearson3 = create_class_sep(
-        n_class, logpearson3.freq_logpearson3, series, src_logpearson3
-    )
-    shape_class_sep(sep_logpearson3, 9, series)
+    # added at once, fig.add_shape validates all shapes of the figure every time
+    class_shapes = []
+    seperators = create_class_sep(n_class, series)
+    for n, seperator in zip(range(6, 10), seperators):
+        shape_class_sep(seperator, n, series)
+    fig.update_layout(shapes=class_shapes)
 
     fig.add_annotation(
         text=f"$\\text{{Rank}}(n={{{series.size}}})$",
@@ -1061,8 +1224,6 @@ def generate_goodness_fit_viz(
             yshift=-4,
         )
 
-    _ = src_chisquare
-
     return fig
 
 
@@ -1126,42 +1287,25 @@ def generate_goodness_fit_critical(
 
     # DELTA DISTRIB
 
-    ks_normal = kolmogorov_smirnov.kolmogorov_smirnov_test(
-        dataframe,
-        distribution="normal",
-        distribution_source=src_normal,
-        significance_level=alpha,
-        critical_value_source=src_ks,
-        display_stat=False,
-    )
-    ks_lognormal = kolmogorov_smirnov.kolmogorov_smirnov_test(
+    ks_result, chi_result = pyfunc.calc_goodness_fit(
         dataframe,
-        distribution="lognormal",
-        distribution_source=src_lognormal,
-        significance_level=alpha,
-        critical_value_source=src_ks,
-        display_stat=False,
-    )
-    ks_gumbel = kolmogorov_smirnov.kolmogorov_smirnov_test(
-        dataframe,
-        distribution="gumbel",
-        distribution_source=src_gumbel,
-        significance_level=alpha,
-        critical_value_source=src_ks,
-        display_stat=False,
-    )
-    ks_logpearson3 = kolmogorov_smirnov.kolmogorov_smirnov_test(
-        dataframe,
-        distribution="logpearson3",
-        distribution_source=src_logpearson3,
-        significance_level=alpha,
-        critical_value_source=src_ks,
-        display_stat=False,
-    )
+        alpha,
+        src_ks,
+        src_chisquare,
+        src_normal,
+        src_lognormal,
+        src_gumbel,
+        src_logpearson3,
+    )
+    ks_normal = ks_result["normal"]
+    ks_lognormal = ks_result["lognormal"]
+    ks_gumbel = ks_result["gumbel"]
+    ks_logpearson3 = ks_result["logpearson3"]
 
     # PLOT
 
     def delta_ks(ksdf: pd.DataFrame):
+        ksdf = _thin_ks(ksdf)
 
         d = ksdf.d
         no = ksdf.no
@@ -1251,38 +1395,10 @@ def generate_goodness_fit_critical(
 
     # X DISTRIB
 
-    chi_normal = chi_square.chi_square_test(
-        dataframe,
-        distribution="normal",
-        distribution_source=src_normal,
-        significance_level=alpha,
-        critical_value_source=src_chisquare,
-        display_stat=False,
-    )
-    chi_lognormal = chi_square.chi_square_test(
-        dataframe,
-        distribution="lognormal",
-        distribution_source=src_lognormal,
-        significance_level=alpha,
-        critical_value_source=src_chisquare,
-        display_stat=False,
-    )
-    chi_gumbel = chi_square.chi_square_test(
-        dataframe,
-        distribution="gumbel",
-        distribution_source=src_gumbel,
-        significance_level=alpha,
-        critical_value_source=src_chisquare,
-        display_stat=False,
-    )
-    chi_logpearson3 = chi_square.chi_square_test(
-        dataframe,
-        distribution="logpearson3",
-        distribution_source=src_logpearson3,
-        significance_level=alpha,
-        critical_value_source=src_chisquare,
-        display_stat=False,
-    )
+    chi_normal = chi_result["normal"]
+    chi_lognormal = chi_result["lognormal"]
+    chi_gumbel = chi_result["gumbel"]
+    chi_logpearson3 = chi_result["logpearson3"]
 
     # PLOT
 
@@ -2,23 +2,76 @@
 
 import base64
 import io
+import itertools
+import mmap
+import os
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple
 import pandas as pd
 import numpy as np
-from dash import html
-from hidrokit.contrib.taruma import outlier_hydrology, statistical_coefficients
+from scipy import stats
+from hidrokit.contrib.taruma import outlier_hydrology
 from hidrokit.contrib.taruma import gumbel, lognormal, normal, logpearson3
 from hidrokit.contrib.taruma import kolmogorov_smirnov, chi_square
+from pyconfig import appConfig
+import pycache
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # optional, Parquet and Arrow IPC files are not available
+    pa = pq = None
+
+try:
+    import openpyxl
+except ImportError:  # optional, .xlsx files are not available
+    openpyxl = None
+
+try:
+    import xlrd
+except ImportError:  # optional, .xls files are not available
+    xlrd = None
 
 # pylint: disable=too-many-arguments, too-many-locals, too-many-branches, too-many-statements
 
+DIST_NAME = "Normal,Log Normal,Gumbel,Log Pearson III".split(",")
+DIST_NAME_LOWER = "normal,lognormal,gumbel,logpearson3".split(",")
+
+BOOTSTRAP_METHODS = ["nonparametric", "parametric"]
 
-def parse_upload_data(content: str, filename: str):
+COLUMNAR_EXTENSIONS = (".parquet", ".arrow", ".feather", ".ipc")
+EXCEL_EXTENSIONS = (".xlsx", ".xlsm", ".xls")
+
+_FIT_CACHE = pycache.LRUCache(maxsize=appConfig.CACHE.FIT_MAXSIZE)
+_BOOTSTRAP_CACHE = pycache.LRUCache(maxsize=appConfig.CACHE.BOOTSTRAP_MAXSIZE)
+
+
+def parse_upload_data(
+    content: str,
+    filename: str,
+    annual_maximum: bool = False,
+    hydrological_month: int = 1,
+    sheet: str = None,
+    date_column: str = None,
+    value_columns: list[str] = None,
+):
     """
     Parse and process uploaded data based on the file format.
 
     Args:
         content (str): The content of the uploaded file.
         filename (str): The name of the uploaded file.
+        annual_maximum (bool, optional): Whether the file is a raw (daily/hourly)
+            series to be reduced to annual maximum series. Defaults to False.
+        hydrological_month (int, optional): The first month of the hydrological
+            year for the annual maximum series. Defaults to 1 (January).
+        sheet (str, optional): The worksheet of an Excel file.
+            Defaults to None (first worksheet).
+        date_column (str, optional): The header of the date column of an Excel file.
+            Defaults to None (first column).
+        value_columns (list, optional): The headers of the value columns of an
+            Excel file. Defaults to None (all other columns).
 
     Returns:
         tuple or None: A tuple containing an HTML div element and a DataFrame object
@@ -31,30 +84,128 @@ def parse_upload_data(content: str, filename: str):
         pd.errors.ParserError: If the CSV file is not well-formed.
         ValueError: If the content string is not valid base64.
     """
+    return parse_upload_buffer(
+        decode_upload_content(content),
+        filename,
+        annual_maximum=annual_maximum,
+        hydrological_month=hydrological_month,
+        sheet=sheet,
+        date_column=date_column,
+        value_columns=value_columns,
+    )
+
+
+def decode_upload_content(content: str) -> bytes:
+    """Return the decoded bytes of the base64 data URL of `dcc.Upload`."""
     _, content_string = content.split(",")
+    return base64.b64decode(content_string)
+
+
+def parse_upload_file(path, filename: str, **kwargs):
+    """
+    Parse and process an uploaded file stored on disk (chunked upload).
+
+    The file is memory-mapped and read by the parsers from the mapping, it is
+    never loaded as a whole into memory (nor base64-encoded).
+
+    Args:
+        path (str or Path): The path of the uploaded file.
+        filename (str): The name of the uploaded file.
+        **kwargs: The options of `parse_upload_data`.
+
+    Returns:
+        tuple: (HTML div element or None, DataFrame or None), as `parse_upload_data`.
+    """
+    if filename.lower().endswith(COLUMNAR_EXTENSIONS) and pa is not None:
+        # the arrays may refer to the mapped file, pyarrow keeps the mapping alive
+        with pa.memory_map(str(path)) as source:
+            return parse_upload_buffer(source.read_buffer(), filename, **kwargs)
+
+    with open(path, "rb") as file, _FileMap(
+        file.fileno(), 0, access=mmap.ACCESS_READ
+    ) as buffer:
+        return parse_upload_buffer(buffer, filename, **kwargs)
+
+
+class _FileMap(mmap.mmap):
+    """Memory map that is also a seekable binary file object (e.g. for zipfile)."""
+
+    def readable(self) -> bool:
+        """The map is read-only."""
+        return True
+
+    def seekable(self) -> bool:
+        """The map is seekable."""
+        return True
+
+
+def parse_upload_buffer(
+    decoded,
+    filename: str,
+    annual_maximum: bool = False,
+    hydrological_month: int = 1,
+    sheet: str = None,
+    date_column: str = None,
+    value_columns: list[str] = None,
+):
+    """
+    Parse and process the content (bytes) of an uploaded file.
+
+    Args:
+        decoded (bytes-like): The content of the file (bytes or memory map).
+        filename (str): The name of the uploaded file.
+        annual_maximum (bool, optional): Defaults to False.
+        hydrological_month (int, optional): Defaults to 1 (January).
+        sheet (str, optional): Defaults to None (first worksheet).
+        date_column (str, optional): Defaults to None (first column).
+        value_columns (list, optional): Defaults to None (all other columns).
 
-    decoded = base64.b64decode(content_string)
+    Returns:
+        tuple: (HTML div element or None, DataFrame or None), as `parse_upload_data`.
+    """
+    from dash import html  # pylint: disable=import-outside-toplevel
 
     try:
-        if filename.lower().endswith(".csv"):
-            dataframe = pd.read_csv(
-                io.StringIO(decoded.decode("utf-8")), index_col=0, parse_dates=True
+        if filename.lower().endswith(".csv") and annual_maximum:
+            dataframe = read_annual_maximum(
+                _open_buffer(decoded), start_month=hydrological_month
             )
-        elif filename.lower().endswith(".xlsx") or filename.lower().endswith(".xls"):
-            return (
-                html.Div(
-                    [
-                        "Fitur pembacaan berkas excel masih dalam tahap pengembangan.",
-                    ],
-                    className="text-center bg-danger text-white fs-4",
-                ),
-                None,
+        elif filename.lower().endswith(".csv"):
+            dataframe = pd.read_csv(
+                _open_buffer(decoded),
+                encoding="utf-8",
+                index_col=0,
+                parse_dates=True,
             )
-
+        elif filename.lower().endswith(COLUMNAR_EXTENSIONS):
+            try:
+                dataframe = read_columnar(
+                    decoded,
+                    filename,
+                    annual_maximum=annual_maximum,
+                    hydrological_month=hydrological_month,
+                )
+            except (ImportError, ValueError) as e:
+                print(e)
+                return html.Div([f"File is not a valid Parquet/Arrow file. {e}"]), None
+        elif filename.lower().endswith(EXCEL_EXTENSIONS):
+            try:
+                dataframe = read_excel(
+                    decoded,
+                    filename,
+                    sheet=sheet,
+                    date_column=date_column,
+                    value_columns=value_columns,
+                    annual_maximum=annual_maximum,
+                    hydrological_month=hydrological_month,
+                )
+            except (ImportError, ValueError) as e:
+                print(e)
+                return html.Div([f"File is not a valid Excel file. {e}"]), None
         else:
             return (
                 html.Div(
-                    ["Hanya dapat membaca format .csv"],
+                    ["Hanya dapat membaca format .csv, .parquet, .arrow, dan .xlsx"],
                     className="text-center bg-danger text-white fs-4",
                 ),
                 None,
@@ -72,6 +223,352 @@ def parse_upload_data(content: str, filename: str):
     return None, dataframe
 
 
+def _open_buffer(decoded):
+    if isinstance(decoded, mmap.mmap):
+        decoded.seek(0)
+        return decoded
+    return io.BytesIO(decoded)
+
+
+def calc_block_maxima(
+    years: np.ndarray, values: np.ndarray, dates: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Calculate the maximum values (and their dates) of each block (year).
+
+    Args:
+        years (np.ndarray): The block (year) of each row with shape (n,).
+        values (np.ndarray): The values with shape (n, columns).
+            Missing values (NaN) are ignored.
+        dates (np.ndarray): The date of each row with shape (n, columns).
+
+    Returns:
+        tuple: (blocks, maxima, dates of maxima). Blocks are sorted ascending,
+            maxima and dates of maxima have shape (blocks, columns).
+    """
+
+    order = np.argsort(years, kind="stable")
+    years, values, dates = years[order], values[order], dates[order]
+
+    blocks, starts, counts = np.unique(years, return_index=True, return_counts=True)
+
+    maxima = np.fmax.reduceat(values, starts, axis=0)
+
+    # first position of the maximum value in each block
+    is_max = values == np.repeat(maxima, counts, axis=0)
+    positions = np.where(is_max, np.arange(years.size)[:, None], years.size)
+    first = np.minimum.reduceat(positions, starts, axis=0)
+
+    dates = np.append(dates, np.full((1, dates.shape[1]), np.datetime64("NaT")), axis=0)
+    max_dates = np.take_along_axis(dates, first, axis=0)
+
+    return blocks, maxima, max_dates
+
+
+def read_annual_maximum(
+    buffer, start_month: int = 1, chunksize: int = None
+) -> pd.DataFrame:
+    """
+    Read a raw (daily/hourly) series and extract the annual maximum series.
+
+    The file is read in chunks, so only the maximum of each hydrological year
+    is kept in memory.
+
+    Args:
+        buffer (file-like or str): The CSV file with dates as the first column.
+        start_month (int, optional): The first month of the hydrological year.
+            Defaults to 1 (calendar year).
+        chunksize (int, optional): The number of rows of each chunk.
+            Defaults to INGEST.CHUNKSIZE of app config.
+
+    Returns:
+        pd.DataFrame: The annual maximum series. With a single column, the index
+            is the date of each maximum. With multiple columns, the index is
+            the start of each hydrological year.
+    """
+
+    chunksize = appConfig.INGEST.CHUNKSIZE if chunksize is None else chunksize
+
+    with pd.read_csv(
+        buffer, index_col=0, parse_dates=True, chunksize=chunksize
+    ) as reader:
+        return calc_annual_maximum(reader, start_month=start_month)
+
+
+def calc_annual_maximum(chunks, start_month: int = 1) -> pd.DataFrame:
+    """
+    Extract the annual maximum series from chunks of a raw (daily/hourly) series.
+
+    Args:
+        chunks (iterable): The chunks (pd.DataFrame) with dates as index.
+        start_month (int, optional): The first month of the hydrological year.
+            Defaults to 1 (calendar year).
+
+    Returns:
+        pd.DataFrame: The annual maximum series (see `read_annual_maximum`).
+    """
+
+    columns = None
+    block_list, maxima_list, dates_list = [], [], []
+
+    for chunk in chunks:
+        columns = chunk.columns
+        index = pd.DatetimeIndex(pd.to_datetime(chunk.index, errors="coerce"))
+        valid = ~index.isna()
+
+        index = index[valid]
+        values = chunk[valid].apply(pd.to_numeric, errors="coerce").to_numpy(float)
+        years = index.year.to_numpy() - (index.month.to_numpy() < start_month)
+        dates = np.repeat(index.to_numpy()[:, None], columns.size, axis=1)
+
+        if years.size == 0:
+            continue
+
+        blocks, maxima, max_dates = calc_block_maxima(years, values, dates)
+        block_list.append(blocks)
+        maxima_list.append(maxima)
+        dates_list.append(max_dates)
+
+    if not block_list:
+        raise pd.errors.ParserError("No valid dates found in the first column.")
+
+    # a year can be split between chunks
+    blocks, maxima, max_dates = calc_block_maxima(
+        np.concatenate(block_list),
+        np.concatenate(maxima_list),
+        np.concatenate(dates_list),
+    )
+
+    valid = ~np.isnan(maxima).all(axis=1)
+    blocks, maxima, max_dates = blocks[valid], maxima[valid], max_dates[valid]
+
+    if columns.size == 1:
+        index = pd.DatetimeIndex(max_dates[:, 0], name="DATE")
+    else:
+        index = pd.DatetimeIndex(
+            [pd.Timestamp(year=year, month=start_month, day=1) for year in blocks],
+            name="DATE",
+        )
+
+    return pd.DataFrame(maxima, index=index, columns=columns)
+
+
+def read_columnar(
+    decoded: bytes,
+    filename: str,
+    annual_maximum: bool = False,
+    hydrological_month: int = 1,
+) -> pd.DataFrame:
+    """
+    Read a Parquet or Arrow IPC (Feather v2) file from the uploaded bytes.
+
+    The bytes are wrapped as an Arrow buffer without a copy or text decoding,
+    the columns are converted to NumPy without consolidating them into blocks.
+    The date is the stored pandas index, otherwise the first column.
+
+    Args:
+        decoded (bytes): The content of the file.
+        filename (str): The name of the file (.parquet, .arrow, .feather, .ipc).
+        annual_maximum (bool, optional): Whether the file is a raw (daily/hourly)
+            series to be reduced to annual maximum series (per record batch).
+            Defaults to False.
+        hydrological_month (int, optional): The first month of the hydrological
+            year for the annual maximum series. Defaults to 1 (January).
+
+    Returns:
+        pd.DataFrame: The dataframe with dates as index.
+
+    Raises:
+        ImportError: If pyarrow is not installed.
+        pyarrow.ArrowInvalid: If the file is not a valid Parquet/Arrow file.
+    """
+    if pa is None:
+        raise ImportError("Reading Parquet/Arrow files requires pyarrow.")
+
+    buffer = pa.py_buffer(decoded)
+    if filename.lower().endswith(".parquet"):
+        table = pq.read_table(pa.BufferReader(buffer))
+    else:
+        try:
+            table = pa.ipc.open_file(buffer).read_all()
+        except pa.ArrowInvalid:
+            table = pa.ipc.open_stream(buffer).read_all()
+
+    if annual_maximum:
+        chunks = (
+            _arrow_to_dataframe(batch)
+            for batch in table.to_batches(max_chunksize=appConfig.INGEST.CHUNKSIZE)
+        )
+        return calc_annual_maximum(chunks, start_month=hydrological_month)
+
+    return _arrow_to_dataframe(table)
+
+
+def _arrow_to_dataframe(table) -> pd.DataFrame:
+    dataframe = table.to_pandas(split_blocks=True)
+    if isinstance(dataframe.index, pd.RangeIndex):
+        dataframe = dataframe.set_index(dataframe.columns[0])
+    dataframe.index = pd.DatetimeIndex(pd.to_datetime(dataframe.index, errors="coerce"))
+    return dataframe
+
+
+def read_excel(
+    decoded: bytes,
+    filename: str,
+    sheet: str = None,
+    date_column: str = None,
+    value_columns: list[str] = None,
+    annual_maximum: bool = False,
+    hydrological_month: int = 1,
+    chunksize: int = None,
+) -> pd.DataFrame:
+    """
+    Read a worksheet of an Excel file (.xlsx/.xlsm with openpyxl, .xls with xlrd).
+
+    The rows are streamed in read-only mode as plain values (no cell objects),
+    only the selected columns are kept and converted to NumPy arrays per chunk.
+    The first row of the worksheet is the header.
+
+    Args:
+        decoded (bytes): The content of the file.
+        filename (str): The name of the file.
+        sheet (str, optional): The name of the worksheet.
+            Defaults to None (first worksheet).
+        date_column (str, optional): The header of the date column.
+            Defaults to None (first column).
+        value_columns (list, optional): The headers of the value columns.
+            Defaults to None (all other columns with a header).
+        annual_maximum (bool, optional): Whether the worksheet is a raw
+            (daily/hourly) series to be reduced to annual maximum series (per chunk).
+            Defaults to False.
+        hydrological_month (int, optional): The first month of the hydrological
+            year for the annual maximum series. Defaults to 1 (January).
+        chunksize (int, optional): The number of rows of each chunk.
+            Defaults to INGEST.EXCEL_CHUNKSIZE of app config.
+
+    Returns:
+        pd.DataFrame: The dataframe with dates as index.
+
+    Raises:
+        ImportError: If openpyxl (.xlsx) or xlrd (.xls) is not installed.
+        ValueError: If the file, worksheet or columns are not valid.
+    """
+    chunksize = appConfig.INGEST.EXCEL_CHUNKSIZE if chunksize is None else chunksize
+
+    rows = _iter_excel_rows(decoded, filename, sheet)
+    try:
+        header = [
+            "" if name is None else str(name).strip() for name in next(rows, ())
+        ]
+        positions = _excel_column_positions(header, date_column, value_columns)
+        names = [header[i] for i in positions]
+
+        selected = (
+            tuple(row[i] if i < len(row) else None for i in positions) for row in rows
+        )
+        chunks = (
+            _excel_chunk(chunk, names)
+            for chunk in iter(lambda: list(itertools.islice(selected, chunksize)), [])
+        )
+
+        if annual_maximum:
+            return calc_annual_maximum(chunks, start_month=hydrological_month)
+
+        chunks = [chunk for chunk in chunks if not chunk.empty]
+        if not chunks:
+            raise ValueError("The worksheet has no data.")
+        return pd.concat(chunks)
+    finally:
+        rows.close()
+
+
+def _iter_excel_rows(decoded: bytes, filename: str, sheet: str = None):
+    if filename.lower().endswith(".xls"):
+        if xlrd is None:
+            raise ImportError("Reading .xls files requires xlrd.")
+        try:
+            workbook = xlrd.open_workbook(file_contents=decoded, on_demand=True)
+        except xlrd.XLRDError as e:
+            raise ValueError(e) from e
+        try:
+            worksheet = workbook.sheet_by_name(
+                _excel_sheet_name(workbook.sheet_names(), sheet)
+            )
+            for position in range(worksheet.nrows):
+                yield tuple(
+                    _xls_cell_value(cell, workbook.datemode)
+                    for cell in worksheet.row(position)
+                )
+        finally:
+            workbook.release_resources()
+        return
+
+    if openpyxl is None:
+        raise ImportError("Reading .xlsx files requires openpyxl.")
+    try:
+        workbook = openpyxl.load_workbook(
+            _open_buffer(decoded), read_only=True, data_only=True
+        )
+    except (zipfile.BadZipFile, KeyError, OSError) as e:
+        raise ValueError(e) from e
+    try:
+        worksheet = workbook[_excel_sheet_name(workbook.sheetnames, sheet)]
+        yield from worksheet.iter_rows(values_only=True)
+    finally:
+        workbook.close()
+
+
+def _xls_cell_value(cell, datemode: int):
+    # empty cells are read as None, as openpyxl does
+    if cell.ctype in (xlrd.XL_CELL_EMPTY, xlrd.XL_CELL_BLANK):
+        return None
+    if cell.ctype == xlrd.XL_CELL_DATE:
+        return xlrd.xldate_as_datetime(cell.value, datemode)
+    return cell.value
+
+
+def _excel_sheet_name(sheet_names: list[str], sheet: str = None) -> str:
+    if not sheet:
+        return sheet_names[0]
+    if sheet not in sheet_names:
+        raise ValueError(f"Sheet '{sheet}' not found, available: {sheet_names}.")
+    return sheet
+
+
+def _excel_column_positions(
+    header: list[str], date_column: str = None, value_columns: list[str] = None
+) -> list[int]:
+    def position(name):
+        if name not in header:
+            raise ValueError(f"Column '{name}' not found, available: {header}.")
+        return header.index(name)
+
+    date_position = position(date_column) if date_column else 0
+    if value_columns:
+        value_positions = [position(name) for name in value_columns]
+    else:
+        value_positions = [
+            i for i, name in enumerate(header) if name and i != date_position
+        ]
+    if not value_positions:
+        raise ValueError("The worksheet has no value columns.")
+    return [date_position] + value_positions
+
+
+def _excel_chunk(rows: list[tuple], names: list[str]) -> pd.DataFrame:
+    values = np.array(rows, dtype=object).reshape(-1, len(names))
+    values = values[~pd.isna(values).all(axis=1)]
+
+    index = pd.DatetimeIndex(
+        pd.to_datetime(values[:, 0], errors="coerce"), name=names[0]
+    )
+    data = np.empty((values.shape[0], len(names) - 1))
+    for position, column in enumerate(values[:, 1:].T):
+        data[:, position] = pd.to_numeric(column, errors="coerce")
+
+    return pd.DataFrame(data, index=index, columns=names[1:])
+
+
 def transform_to_dataframe(
     table_data,
     table_columns,
@@ -138,51 +635,333 @@ def transform_to_dataframe(
     return dataframe
 
 
-def generate_report_statout(dataframe: pd.DataFrame) -> str:
+def prepare_dataframe(dataframe: pd.DataFrame) -> pd.DataFrame:
+    """
+    Prepare an uploaded dataframe for storage and analysis.
+
+    The index is renamed to DATE and sorted, and the values are converted to
+    numeric, the same as the table data in `transform_to_dataframe`.
+
+    Args:
+        dataframe (pd.DataFrame): The uploaded dataframe with dates as index.
+
+    Returns:
+        pd.DataFrame: The prepared dataframe.
+    """
+    dataframe = dataframe.rename_axis("DATE").sort_index()
+    return dataframe.apply(pd.to_numeric, errors="coerce")
+
+
+FILTER_OPERATORS = [
+    ["ge ", ">="],
+    ["le ", "<="],
+    ["lt ", "<"],
+    ["gt ", ">"],
+    ["ne ", "!="],
+    ["eq ", "="],
+    ["contains "],
+    ["datestartswith "],
+]
+
+
+def split_filter_part(filter_part: str) -> tuple:
+    """
+    Split a part of DataTable filter query into column name, operator and value.
+
+    Args:
+        filter_part (str): The part of filter query, e.g. "{R24} > 100".
+
+    Returns:
+        tuple: (column name, operator, value). All None if not recognized.
+    """
+    for operator_type in FILTER_OPERATORS:
+        for operator in operator_type:
+            if operator not in filter_part:
+                continue
+            name_part, value_part = filter_part.split(operator, 1)
+            name = name_part[name_part.find("{") + 1 : name_part.rfind("}")]
+
+            value_part = value_part.strip()
+            if value_part and value_part[0] == value_part[-1] in ("'", '"', "`"):
+                value = value_part[1:-1].replace("\\" + value_part[0], value_part[0])
+            else:
+                value = value_part
+
+            # word operators need spaces after them in the filter string,
+            # but we don't want these later
+            return name, operator_type[0].strip(), value
+
+    return None, None, None
+
+
+def calc_filter_mask(dataframe: pd.DataFrame, filter_query: str = None) -> np.ndarray:
+    """
+    Calculate the rows of a dataframe selected by a DataTable filter query.
+
+    Args:
+        dataframe (pd.DataFrame): The dataframe with DATE as index.
+        filter_query (str, optional): The filter query of DataTable.
+            Defaults to None (no filter).
+
+    Returns:
+        np.ndarray: The boolean mask of the selected rows.
+    """
+    mask = np.ones(dataframe.index.size, dtype=bool)
+
+    if not filter_query:
+        return mask
+
+    for filter_part in filter_query.split(" && "):
+        col_name, operator, filter_value = split_filter_part(filter_part)
+
+        if col_name == "DATE":
+            column = pd.Series(dataframe.index.strftime("%Y-%m-%d"), dtype=str)
+        elif col_name in dataframe.columns:
+            column = dataframe[col_name].reset_index(drop=True)
+        else:
+            continue
+
+        if operator in ("eq", "ne", "lt", "le", "gt", "ge"):
+            if col_name != "DATE":
+                filter_value = pd.to_numeric(filter_value, errors="coerce")
+            mask &= getattr(column, operator)(filter_value).to_numpy()
+        elif operator == "contains":
+            mask &= (
+                column.astype(str).str.contains(str(filter_value), regex=False)
+            ).to_numpy()
+        elif operator == "datestartswith":
+            mask &= column.astype(str).str.startswith(str(filter_value)).to_numpy()
+
+    return mask
+
+
+def filter_dataframe(dataframe: pd.DataFrame, filter_query: str = None) -> pd.DataFrame:
+    """
+    Filter a dataframe using DataTable filter query.
+
+    Args:
+        dataframe (pd.DataFrame): The dataframe with DATE as index.
+        filter_query (str, optional): The filter query of DataTable.
+            Defaults to None (no filter).
+
+    Returns:
+        pd.DataFrame: The filtered dataframe.
+    """
+    if not filter_query:
+        return dataframe
+
+    return dataframe[calc_filter_mask(dataframe, filter_query)]
+
+
+def calc_table_page(
+    dataframe: pd.DataFrame,
+    page_current: int,
+    page_size: int,
+    order: np.ndarray = None,
+    filter_query: str = None,
+) -> tuple[np.ndarray, int, int]:
+    """
+    Select the rows of a table page with server-side sorting and filtering.
+
+    Args:
+        dataframe (pd.DataFrame): The dataframe with DATE as index.
+        page_current (int): The requested page (0-based).
+        page_size (int): The number of rows of a page.
+        order (np.ndarray, optional): The row positions in sorted order.
+            Defaults to None (stored order).
+        filter_query (str, optional): The filter query of DataTable.
+            Defaults to None (no filter).
+
+    Returns:
+        tuple: (row positions of the page, page, page count), the page is
+            limited to the last page.
+    """
+    positions = np.arange(dataframe.index.size) if order is None else order
+
+    if filter_query:
+        mask = calc_filter_mask(dataframe, filter_query)
+        positions = positions[mask[positions]]
+
+    page_count = max(1, -(-positions.size // page_size))
+    page_current = min(max(int(page_current or 0), 0), page_count - 1)
+    start = page_current * page_size
+
+    return positions[start : start + page_size], page_current, page_count
+
+
+class Moments(NamedTuple):
+    """
+    The statistics of a series calculated by `calc_moments`.
+
+    The log statistics only use the positive values, `count_log` is their number.
+    """
+
+    count: int
+    mean: float
+    std: float
+    std0: float
+    cv: float
+    cs: float
+    ck: float
+    min: float
+    p25: float
+    p50: float
+    p75: float
+    max: float
+    count_log: int
+    mean_log: float
+    std_log: float
+
+
+def calc_moments(series: pd.Series) -> Moments:
+    """
+    Calculate the descriptive statistics and coefficients in a single pass.
+
+    The results are equal to `series.describe()`, `series.std(ddof=0)` and
+    `statistical_coefficients.calc_coef` from hidrokit for a series without
+    missing values and zeros. Otherwise the results differ from hidrokit:
+    missing values are ignored (hidrokit counts them in n of Cv, Cs and Ck),
+    and the log statistics are calculated from the positive values (hidrokit
+    gives -inf and nan with zeros), as the outlier boundaries.
+
+    Args:
+        series (pd.Series): The input series.
+
+    Returns:
+        Moments: The statistics of the series.
+    """
+    values = np.asarray(series, dtype=float)
+    values = values[~np.isnan(values)]
+    count = values.size
+
+    mean = values.mean()
+    deviation = values - mean
+    sum_square = np.sum(deviation**2)
+    std = np.sqrt(sum_square / (count - 1))
+    std0 = np.sqrt(sum_square / count)
+    # same expressions as statistical_coefficients.calc_coef
+    coef_cs = (
+        count**2 / ((count - 1) * (count - 2)) * (1 / count * np.sum(deviation**3))
+    ) / std**3
+    coef_ck = (
+        count**3
+        / ((count - 1) * (count - 2) * (count - 3))
+        * (1 / count * np.sum(deviation**4))
+        / std**4
+    )
+
+    smin, p25, p50, p75, smax = np.quantile(values, [0, 0.25, 0.5, 0.75, 1])
+
+    values_log = np.log10(values[values > 0])
+
+    return Moments(
+        count=count,
+        mean=mean,
+        std=std,
+        std0=std0,
+        cv=std / mean,
+        cs=coef_cs,
+        ck=coef_ck,
+        min=smin,
+        p25=p25,
+        p50=p50,
+        p75=p75,
+        max=smax,
+        count_log=values_log.size,
+        mean_log=values_log.mean(),
+        std_log=values_log.std(ddof=1),
+    )
+
+
+def calc_outlier_boundary(moments: Moments) -> tuple[float, float]:
+    """
+    Calculate the outlier boundaries, same as `outlier_hydrology.calc_boundary`.
+
+    Args:
+        moments (Moments): The statistics of the series.
+
+    Returns:
+        tuple: (lower boundary, upper boundary).
+    """
+    kn_value = outlier_hydrology.find_Kn(moments.count_log)
+    return (
+        10 ** (moments.mean_log - kn_value * moments.std_log),
+        10 ** (moments.mean_log + kn_value * moments.std_log),
+    )
+
+
+def calc_statout(dataframe: pd.DataFrame, moments: Moments = None) -> dict:
+    """
+    Calculate the descriptive, distribution and outlier statistics.
+
+    Args:
+        dataframe (pd.DataFrame): The input dataframe, only the first column is used.
+        moments (Moments, optional): The statistics of the first column,
+            calculated if not given. Defaults to None.
+
+    Returns:
+        dict: The statistics grouped by section (`DESCRIPTIVE`, `DISTRIBUTION`
+            and `OUTLIER`). If the series has missing values or values that are
+            not positive, a `NOTE` section counts the missing values (ignored)
+            and the values excluded from the log statistics (see `calc_moments`).
+    """
+    if moments is None:
+        moments = calc_moments(dataframe.iloc[:, 0])
+
+    lower_bound, upper_bound = calc_outlier_boundary(moments)
+
+    statout = {
+        "DESCRIPTIVE": {
+            "COUNT": float(moments.count),
+            "MEAN": moments.mean,
+            "STD": moments.std,
+            "STD0": moments.std0,
+            "MIN": moments.min,
+            "25P": moments.p25,
+            "50P": moments.p50,
+            "75P": moments.p75,
+            "MAX": moments.max,
+        },
+        "DISTRIBUTION": {"Cv": moments.cv, "Cs": moments.cs, "Ck": moments.ck},
+        "OUTLIER": {
+            "N": float(moments.count),
+            "Kn": outlier_hydrology.find_Kn(moments.count),
+            "MEAN_LOG": moments.mean_log,
+            "STD_LOG": moments.std_log,
+            "LOWER_BOUND": lower_bound,
+            "UPPER_BOUND": upper_bound,
+        },
+    }
+
+    missing = int(dataframe.iloc[:, 0].isna().sum())
+    not_positive = moments.count - moments.count_log
+    if missing or not_positive:
+        statout["NOTE"] = {
+            "MISSING_IGNORED": missing,
+            "NOT_POSITIVE_EXCLUDED_FROM_LOG": not_positive,
+        }
+
+    return statout
+
+
+def generate_report_statout(dataframe: pd.DataFrame, moments: Moments = None) -> str:
     """
     Generate a statistical report based on the given dataframe.
 
     Args:
         dataframe (pd.DataFrame): The input dataframe.
+        moments (Moments, optional): The statistics of the first column,
+            calculated if not given. Defaults to None.
 
     Returns:
         str: The generated statistical report.
 
     """
-    series = dataframe.iloc[:, 0]
-    describe = series.describe()
-    count, mean, std, smin, p25, p50, p75, smax = describe.to_list()
-    coef_cv, coef_cs, coef_ck = statistical_coefficients.calc_coef(series)
-    std0 = series.std(ddof=0)
-    kn_value = outlier_hydrology.find_Kn(count)
-    mean_log = series.apply(np.log10).mean()
-    std_log = series.apply(np.log10).std()
-    lower_bound, upper_bound = outlier_hydrology.calc_boundary(
-        series.replace(0, np.nan).dropna().to_frame()
-    )
+    statout = calc_statout(dataframe, moments)
 
-    report = (
-        "[DESCRIPTIVE]\n"
-        f"COUNT = {count}\n"
-        f"MEAN = {mean}\n"
-        f"STD = {std}\n"
-        f"STD0 = {std0}\n"
-        f"MIN = {smin}\n"
-        f"25P = {p25}\n"
-        f"50P = {p50}\n"
-        f"75P = {p75}\n"
-        f"MAX = {smax}\n\n"
-        "[DISTRIBUTION]\n"
-        f"Cv = {coef_cv}\n"
-        f"Cs = {coef_cs}\n"
-        f"Ck = {coef_ck}\n\n"
-        "[OUTLIER]\n"
-        f"N = {count}\n"
-        f"Kn = {kn_value}\n"
-        f"MEAN_LOG = {mean_log}\n"
-        f"STD_LOG = {std_log}\n"
-        f"LOWER_BOUND = {lower_bound}\n"
-        f"UPPER_BOUND = {upper_bound}\n"
+    report = "\n".join(
+        f"[{section}]\n" + "".join(f"{key} = {val}\n" for key, val in items.items())
+        for section, items in statout.items()
     )
 
     return report
@@ -203,6 +982,364 @@ def transform_return_period(return_period):
     return result
 
 
+def calc_frequency_factor(
+    return_periods,
+    data_count: int,
+    skewness_log: float,
+    src_normal: str,
+    src_lognormal: str,
+    src_gumbel: str,
+    src_logpearson3: str,
+) -> np.ndarray:
+    """
+    Calculate the frequency factors (K) of all distributions.
+
+    Args:
+        return_periods (array-like): The 1-D array of return periods.
+        data_count (int): The number of data (used by the gumbel tables).
+        skewness_log (float or array-like): The skewness of the log data
+            (used by log pearson III). A 1-D array gives the factors of
+            every skewness (e.g. bootstrap replicates).
+        src_normal (str): The source of the normal distribution.
+        src_lognormal (str): The source of the log normal distribution.
+        src_gumbel (str): The source of the gumbel distribution.
+        src_logpearson3 (str): The source of the log pearson III distribution.
+
+    Returns:
+        np.ndarray: The frequency factors with shape (return periods, 4), or
+            (skewness, return periods, 4) for an array of skewness, in the
+            order of normal, log normal, gumbel and log pearson III.
+    """
+
+    return_periods = np.asarray(return_periods, dtype=float)
+    skewness_log = np.asarray(skewness_log, dtype=float)
+
+    # only log pearson III depends on the skewness, other factors are broadcasted
+    probabilities, skewness = np.broadcast_arrays(
+        1 / return_periods, skewness_log[..., np.newaxis]
+    )
+
+    k_factor = np.empty(probabilities.shape + (4,))
+    k_factor[..., 0] = normal.find_K(return_periods, source=src_normal)
+    k_factor[..., 1] = lognormal.find_K(return_periods, source=src_lognormal)
+    k_factor[..., 2] = gumbel.calc_K(data_count, return_periods, source=src_gumbel)
+    k_factor[..., 3] = np.reshape(
+        logpearson3.find_K(
+            probabilities.ravel(), skewness.ravel(), source=src_logpearson3
+        ),
+        probabilities.shape,
+    )
+
+    return k_factor
+
+
+def calc_design_values(
+    data_count: int,
+    mean,
+    std,
+    mean_log,
+    std_log,
+    skew_log,
+    return_periods,
+    src_normal: str,
+    src_lognormal: str,
+    src_gumbel: str,
+    src_logpearson3: str,
+) -> np.ndarray:
+    """
+    Calculate the design values of all distributions from their parameters.
+
+    The parameters are scalars, or 1-D arrays for several samples of the same size.
+
+    Args:
+        data_count (int): The number of data.
+        mean (float or array-like): The mean.
+        std (float or array-like): The standard deviation (ddof=1).
+        mean_log (float or array-like): The mean of the log data.
+        std_log (float or array-like): The standard deviation of the log data.
+        skew_log (float or array-like): The skewness of the log data.
+        return_periods (array-like): The 1-D array of return periods.
+        src_normal (str): The source of the normal distribution.
+        src_lognormal (str): The source of the log normal distribution.
+        src_gumbel (str): The source of the gumbel distribution.
+        src_logpearson3 (str): The source of the log pearson III distribution.
+
+    Returns:
+        np.ndarray: The design values with shape (return periods, 4), or
+            (samples, return periods, 4) for arrays, in the order of normal,
+            log normal, gumbel and log pearson III.
+    """
+    k_factor = calc_frequency_factor(
+        return_periods,
+        data_count,
+        skew_log,
+        src_normal,
+        src_lognormal,
+        src_gumbel,
+        src_logpearson3,
+    )
+
+    loc = np.stack([mean, mean_log, mean, mean_log], axis=-1)[..., np.newaxis, :]
+    scale = np.stack([std, std_log, std, std_log], axis=-1)[..., np.newaxis, :]
+
+    result = loc + k_factor * scale
+    result[..., [1, 3]] = np.power(10, result[..., [1, 3]])
+
+    return result
+
+
+def calc_freq_matrices(
+    samples: np.ndarray,
+    return_periods,
+    src_normal: str,
+    src_lognormal: str,
+    src_gumbel: str,
+    src_logpearson3: str,
+) -> np.ndarray:
+    """
+    Calculate the design values of all distributions for every row of samples.
+
+    The moments are calculated along axis 1, so a (B, n) matrix of resamples
+    is evaluated in a single pass.
+
+    Args:
+        samples (np.ndarray): The 2-D array of samples with shape (B, n),
+            without zero or missing values.
+        return_periods (array-like): The 1-D array of return periods.
+        src_normal (str): The source of the normal distribution.
+        src_lognormal (str): The source of the log normal distribution.
+        src_gumbel (str): The source of the gumbel distribution.
+        src_logpearson3 (str): The source of the log pearson III distribution.
+
+    Returns:
+        np.ndarray: The design values with shape (B, return periods, 4) in the
+            order of normal, log normal, gumbel and log pearson III.
+    """
+
+    samples = np.asarray(samples, dtype=float)
+    samples_log = np.log10(samples)
+
+    mean = samples.mean(axis=1)
+    std = samples.std(axis=1, ddof=1)
+    mean_log = samples_log.mean(axis=1)
+    std_log = samples_log.std(axis=1, ddof=1)
+    # stats.skew evaluates row by row if any row has NaN (log of negative values)
+    finite = np.isfinite(samples_log).all(axis=1)
+    skew_log = stats.skew(
+        np.where(finite[:, np.newaxis], samples_log, 0), axis=1, bias=False
+    )
+    skew_log[~finite] = np.nan
+
+    return calc_design_values(
+        samples.shape[1],
+        mean,
+        std,
+        mean_log,
+        std_log,
+        skew_log,
+        return_periods,
+        src_normal,
+        src_lognormal,
+        src_gumbel,
+        src_logpearson3,
+    )
+
+
+def calc_freq_matrix(
+    series: pd.Series,
+    return_periods,
+    src_normal: str,
+    src_lognormal: str,
+    src_gumbel: str,
+    src_logpearson3: str,
+) -> np.ndarray:
+    """
+    Calculate the design values of all distributions in a single pass.
+
+    The results are equal to `freq_normal`, `freq_lognormal`, `freq_gumbel` and
+    `freq_logpearson3` from hidrokit, without building intermediate DataFrames.
+
+    Args:
+        series (pd.Series): The cleaned series (no zero or missing values).
+        return_periods (array-like): The 1-D array of return periods.
+        src_normal (str): The source of the normal distribution.
+        src_lognormal (str): The source of the log normal distribution.
+        src_gumbel (str): The source of the gumbel distribution.
+        src_logpearson3 (str): The source of the log pearson III distribution.
+
+    Returns:
+        np.ndarray: The design values with shape (return periods, 4) in the
+            order of normal, log normal, gumbel and log pearson III.
+    """
+
+    values = np.asarray(series, dtype=float)
+
+    return calc_freq_matrices(
+        values[np.newaxis, :],
+        return_periods,
+        src_normal,
+        src_lognormal,
+        src_gumbel,
+        src_logpearson3,
+    )[0]
+
+
+def generate_bootstrap_samples(
+    rng: np.random.Generator, values: np.ndarray, n_replicates: int, method: str
+) -> list[np.ndarray]:
+    """
+    Generate bootstrap resamples as (B, n) matrices.
+
+    Args:
+        rng (np.random.Generator): The random generator.
+        values (np.ndarray): The cleaned data.
+        n_replicates (int): The number of resamples (B).
+        method (str): `nonparametric` resamples the data with replacement,
+            `parametric` samples every distribution fitted by moments.
+
+    Returns:
+        list: One matrix for `nonparametric`, or four matrices (normal,
+            log normal, gumbel, log pearson III) for `parametric`.
+    """
+    size = (n_replicates, values.size)
+
+    if method == "nonparametric":
+        return [values[rng.integers(0, values.size, size=size)]]
+
+    if method == "parametric":
+        values_log = np.log10(values)
+        mean, std = values.mean(), values.std(ddof=1)
+        mean_log, std_log = values_log.mean(), values_log.std(ddof=1)
+        skew_log = stats.skew(values_log, bias=False)
+        gumbel_scale = std * np.sqrt(6) / np.pi
+        gumbel_loc = mean - np.euler_gamma * gumbel_scale
+        return [
+            rng.normal(mean, std, size=size),
+            np.power(10, rng.normal(mean_log, std_log, size=size)),
+            rng.gumbel(gumbel_loc, gumbel_scale, size=size),
+            np.power(
+                10,
+                stats.pearson3.rvs(
+                    skew_log, loc=mean_log, scale=std_log, size=size, random_state=rng
+                ),
+            ),
+        ]
+
+    raise ValueError(f"method '{method}' not found")
+
+
+def _calc_bootstrap_chunk(args: tuple) -> np.ndarray:
+    values, n_replicates, seed_sequence, method, return_periods, sources = args
+
+    rng = np.random.default_rng(seed_sequence)
+    samples = generate_bootstrap_samples(rng, values, n_replicates, method)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if len(samples) == 1:
+            return calc_freq_matrices(samples[0], return_periods, *sources)
+
+        # parametric, every distribution is evaluated on its own samples
+        return np.stack(
+            [
+                calc_freq_matrices(_samples, return_periods, *sources)[..., i_dist]
+                for i_dist, _samples in enumerate(samples)
+            ],
+            axis=-1,
+        )
+
+
+def calc_freq_bootstrap(
+    series: pd.Series,
+    return_periods,
+    src_normal: str,
+    src_lognormal: str,
+    src_gumbel: str,
+    src_logpearson3: str,
+    method: str = "nonparametric",
+    n_replicates: int = None,
+    confidence: float = None,
+    seed: int = None,
+    max_workers: int = None,
+) -> np.ndarray:
+    """
+    Calculate the bootstrap confidence interval of the design values.
+
+    The replicates are split into chunks of BOOTSTRAP.CHUNK_SIZE and calculated
+    in a process pool. Every chunk has its own seed spawned from `seed`, so the
+    result does not depend on the number of workers. The results are cached
+    by the content of the series and the options.
+
+    Args:
+        series (pd.Series): The cleaned series (no zero or missing values).
+        return_periods (array-like): The 1-D array of return periods.
+        src_normal (str): The source of the normal distribution.
+        src_lognormal (str): The source of the log normal distribution.
+        src_gumbel (str): The source of the gumbel distribution.
+        src_logpearson3 (str): The source of the log pearson III distribution.
+        method (str, optional): `nonparametric` or `parametric`.
+            Defaults to "nonparametric".
+        n_replicates (int, optional): The number of replicates.
+            Defaults to BOOTSTRAP.REPLICATES of app config.
+        confidence (float, optional): The confidence level.
+            Defaults to BOOTSTRAP.CONFIDENCE of app config.
+        seed (int, optional): The random seed. Defaults to BOOTSTRAP.SEED of app config.
+        max_workers (int, optional): The number of worker processes.
+            Defaults to BOOTSTRAP.MAX_WORKERS of app config (or the number of CPUs).
+
+    Returns:
+        np.ndarray: The lower and upper bounds with shape (2, return periods, 4)
+            in the order of normal, log normal, gumbel and log pearson III.
+    """
+    n_replicates = int(n_replicates or appConfig.BOOTSTRAP.REPLICATES)
+    confidence = float(confidence or appConfig.BOOTSTRAP.CONFIDENCE)
+    seed = appConfig.BOOTSTRAP.SEED if seed is None else seed
+    sources = (src_normal, src_lognormal, src_gumbel, src_logpearson3)
+    return_periods = list(return_periods)
+
+    if method not in BOOTSTRAP_METHODS:
+        raise ValueError(f"method '{method}' not found")
+
+    key = pycache.make_key(
+        pycache.hash_series(series),
+        return_periods,
+        sources,
+        method,
+        n_replicates,
+        confidence,
+        seed,
+    )
+    cached = _BOOTSTRAP_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    values = np.asarray(series, dtype=float)
+    chunk_size = appConfig.BOOTSTRAP.CHUNK_SIZE
+    chunks = [
+        min(chunk_size, n_replicates - start)
+        for start in range(0, n_replicates, chunk_size)
+    ]
+    seed_sequences = np.random.SeedSequence(seed).spawn(len(chunks))
+    tasks = [
+        (values, size, seed_sequence, method, return_periods, sources)
+        for size, seed_sequence in zip(chunks, seed_sequences)
+    ]
+
+    max_workers = max_workers or appConfig.BOOTSTRAP.MAX_WORKERS or os.cpu_count()
+    if max_workers == 1 or len(tasks) == 1:
+        replicates = list(map(_calc_bootstrap_chunk, tasks))
+    else:
+        with ProcessPoolExecutor(max_workers=min(max_workers, len(tasks))) as executor:
+            replicates = list(executor.map(_calc_bootstrap_chunk, tasks))
+
+    tail = (1 - confidence) / 2 * 100
+    result = np.nanpercentile(
+        np.concatenate(replicates), [tail, 100 - tail], axis=0
+    )
+    _BOOTSTRAP_CACHE.set(key, result)
+
+    return result
+
+
 def generate_dataframe_freq(
     dataframe: pd.DataFrame,
     return_periods: list[int],
@@ -210,42 +1347,193 @@ def generate_dataframe_freq(
     src_lognormal: str,
     src_gumbel: str,
     src_logpearson3: str,
+    bootstrap: str = None,
+    n_replicates: int = None,
+    confidence: float = None,
+    design_values: np.ndarray = None,
 ) -> pd.DataFrame:
-    """Generate a frequency analysis dataframe based on the given dataframe."""
+    """
+    Generate a frequency analysis dataframe based on the given dataframe.
 
-    dataframe = dataframe.iloc[:, 0].replace(0, np.nan).dropna().to_frame()
+    With `bootstrap` (`nonparametric` or `parametric`), the lower and upper
+    bounds of the confidence interval (`calc_freq_bootstrap`) are added as
+    `<distribution> Lower` and `<distribution> Upper` columns. Precalculated
+    `design_values` (e.g. incremental statistics) are used if given.
+    """
 
-    df_normal = normal.freq_normal(
-        dataframe,
-        return_periods=return_periods,
-        source=src_normal,
-        out_index_name="Return Period",
-    )
+    series = dataframe.iloc[:, 0].replace(0, np.nan).dropna()
 
-    df_lognormal = lognormal.freq_lognormal(
-        dataframe,
-        return_periods=return_periods,
-        source=src_lognormal,
-        out_index_name="Return Period",
+    result = design_values
+    if result is None:
+        result = calc_freq_matrix(
+            series,
+            return_periods,
+            src_normal,
+            src_lognormal,
+            src_gumbel,
+            src_logpearson3,
+        )
+
+    freq = pd.DataFrame(
+        result,
+        index=pd.Index(return_periods, name="Return Period"),
+        columns=DIST_NAME,
     )
 
-    df_gumbel = gumbel.freq_gumbel(
-        dataframe,
-        return_periods=return_periods,
-        source=src_gumbel,
-        out_index_name="Return Period",
+    if bootstrap:
+        lower, upper = calc_freq_bootstrap(
+            series,
+            return_periods,
+            src_normal,
+            src_lognormal,
+            src_gumbel,
+            src_logpearson3,
+            method=bootstrap,
+            n_replicates=n_replicates,
+            confidence=confidence,
+        )
+        for i_dist, dist in enumerate(DIST_NAME):
+            freq[f"{dist} Lower"] = lower[:, i_dist]
+            freq[f"{dist} Upper"] = upper[:, i_dist]
+
+    return freq
+
+
+def calc_goodness_fit(
+    dataframe: pd.DataFrame,
+    alpha: float,
+    src_ks: str,
+    src_chisquare: str,
+    src_normal: str,
+    src_lognormal: str,
+    src_gumbel: str,
+    src_logpearson3: str,
+) -> tuple[dict, dict]:
+    """
+    Calculate the Kolmogorov-Smirnov and Chi-Square tables for all distributions.
+
+    The results are cached by the content of the cleaned series and the options,
+    so the goodness of fit figures and reports share a single calculation.
+
+    Args:
+        dataframe (pd.DataFrame): The input dataframe (first column is used).
+        alpha (float): The significance level.
+        src_ks (str): The source of the Kolmogorov-Smirnov critical value.
+        src_chisquare (str): The source of the Chi-Square critical value.
+        src_normal (str): The source of the normal distribution.
+        src_lognormal (str): The source of the log normal distribution.
+        src_gumbel (str): The source of the gumbel distribution.
+        src_logpearson3 (str): The source of the log pearson III distribution.
+
+    Returns:
+        tuple: Two dictionaries (KS, Chi-Square) of DataFrames keyed by
+            the lowercase distribution name. The DataFrames are shared and
+            must not be modified.
+    """
+
+    series = dataframe.iloc[:, 0].replace(0, np.nan).dropna()
+    sources = [src_normal, src_lognormal, src_gumbel, src_logpearson3]
+
+    key = pycache.make_key(
+        pycache.hash_series(series), alpha, src_ks, src_chisquare, *sources
     )
+    cached = _FIT_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    dataframe = series.to_frame()
+
+    ks_result = {
+        dist: kolmogorov_smirnov.kolmogorov_smirnov_test(
+            dataframe,
+            distribution=dist,
+            distribution_source=source,
+            significance_level=alpha,
+            critical_value_source=src_ks,
+            display_stat=False,
+            report_type="full",
+        )
+        for dist, source in zip(DIST_NAME_LOWER, sources)
+    }
+
+    chi_result = {
+        dist: chi_square.chi_square_test(
+            dataframe,
+            distribution=dist,
+            distribution_source=source,
+            significance_level=alpha,
+            critical_value_source=src_chisquare,
+            display_stat=False,
+        ).rename({"batas_kelas": "classes"}, axis=1)
+        for dist, source in zip(DIST_NAME_LOWER, sources)
+    }
+
+    result = (ks_result, chi_result)
+    _FIT_CACHE.set(key, result)
 
-    df_logpearson3 = logpearson3.freq_logpearson3(
+    return result
+
+
+def calc_fit_summary(
+    dataframe: pd.DataFrame,
+    alpha: float,
+    src_ks: str,
+    src_chisquare: str,
+    src_normal: str,
+    src_lognormal: str,
+    src_gumbel: str,
+    src_logpearson3: str,
+) -> dict:
+    """
+    Summarize the goodness of fit tests as critical and calculated values.
+
+    Args:
+        dataframe (pd.DataFrame): The input dataframe, only the first column is used.
+        alpha (float): The significance level.
+        src_ks (str): The source of the Kolmogorov-Smirnov critical value.
+        src_chisquare (str): The source of the Chi-Square critical value.
+        src_normal (str): The source of the normal distribution.
+        src_lognormal (str): The source of the log normal distribution.
+        src_gumbel (str): The source of the gumbel distribution.
+        src_logpearson3 (str): The source of the log pearson III distribution.
+
+    Returns:
+        dict: The summary with keys `N`, `DELTA_CRITICAL`, `DELTA`, `X2_CRITICAL`
+            and `X2`. `DELTA` and `X2` map each distribution (lowercase) to
+            its calculated value.
+    """
+    ks_result, chi_result = calc_goodness_fit(
         dataframe,
-        return_periods=return_periods,
-        source=src_logpearson3,
-        out_index_name="Return Period",
+        alpha,
+        src_ks,
+        src_chisquare,
+        src_normal,
+        src_lognormal,
+        src_gumbel,
+        src_logpearson3,
     )
 
-    result = pd.concat([df_normal, df_lognormal, df_gumbel, df_logpearson3], axis=1)
+    series = dataframe.iloc[:, 0].replace(0, np.nan).dropna()
+    n_class = chi_square._calc_k(series.size)  # pylint: disable=protected-access
 
-    return result
+    x2calcs = {}
+    for _dist in DIST_NAME_LOWER:
+        _chi = chi_result[_dist]
+        x2calcs[_dist] = np.sum(np.power(2, (_chi.fe - _chi.ft)) / _chi.ft)
+
+    return {
+        "N": series.size,
+        "DELTA_CRITICAL": kolmogorov_smirnov.calc_delta_critical(
+            alpha, series.size, source=src_ks
+        ),
+        "DELTA": {_dist: ks_result[_dist].d.max() for _dist in DIST_NAME_LOWER},
+        "X2_CRITICAL": chi_square.calc_chi_square_critical(
+            alpha,
+            chi_square._calc_dk(n_class, 2),  # pylint: disable=protected-access
+            source=src_chisquare,
+        ),
+        "X2": x2calcs,
+    }
 
 
 def generate_report_fit(
@@ -260,125 +1548,230 @@ def generate_report_fit(
 ) -> pd.DataFrame:
     """Generate a goodness of fit report based on the given dataframe."""
 
-    dist_name = "Normal,Log Normal,Gumbel,Log Pearson III".split(",")
-    dist_name_lower = "normal,lognormal,gumbel,logpearson3".split(",")
+    ks_result, chi_result = calc_goodness_fit(
+        dataframe,
+        alpha,
+        src_ks,
+        src_chisquare,
+        src_normal,
+        src_lognormal,
+        src_gumbel,
+        src_logpearson3,
+    )
 
     # KS
 
-    ks_normal = kolmogorov_smirnov.kolmogorov_smirnov_test(
-        dataframe,
-        distribution="normal",
-        distribution_source=src_normal,
-        significance_level=alpha,
-        critical_value_source=src_ks,
-        display_stat=False,
-        report_type="full",
-    )
-    ks_lognormal = kolmogorov_smirnov.kolmogorov_smirnov_test(
-        dataframe,
-        distribution="lognormal",
-        distribution_source=src_lognormal,
-        significance_level=alpha,
-        critical_value_source=src_ks,
-        display_stat=False,
-        report_type="full",
-    )
-    ks_gumbel = kolmogorov_smirnov.kolmogorov_smirnov_test(
+    ks_col = [ks_result[dist] for dist in DIST_NAME_LOWER]
+    ks_frame = pd.concat(ks_col, keys=DIST_NAME, axis=1)
+
+    # CHI
+
+    chi_col = [chi_result[dist] for dist in DIST_NAME_LOWER]
+    chi_frame = pd.concat(chi_col, keys=DIST_NAME, axis=1)
+
+    # REPORT
+    fit_summary = calc_fit_summary(
         dataframe,
-        distribution="gumbel",
-        distribution_source=src_gumbel,
-        significance_level=alpha,
-        critical_value_source=src_ks,
-        display_stat=False,
-        report_type="full",
+        alpha,
+        src_ks,
+        src_chisquare,
+        src_normal,
+        src_lognormal,
+        src_gumbel,
+        src_logpearson3,
     )
-    ks_logpearson3 = kolmogorov_smirnov.kolmogorov_smirnov_test(
-        dataframe,
-        distribution="logpearson3",
-        distribution_source=src_logpearson3,
-        significance_level=alpha,
-        critical_value_source=src_ks,
-        display_stat=False,
-        report_type="full",
+    delta, x2calcs = fit_summary["DELTA"], fit_summary["X2"]
+
+    report_fit = (
+        "[GOODNESS OF FIT]\n"
+        f"N = {fit_summary['N']}\n\n"
+        "[KOLMOGOROV-SMIRNOV]\n"
+        f"DELTA_CRITICAL = {fit_summary['DELTA_CRITICAL']}\n"
+        f"DELTA_NORMAL = {delta['normal']}\n"
+        f"DELTA_LOGNORMAL = {delta['lognormal']}\n"
+        f"DELTA_GUMBEL = {delta['gumbel']}\n"
+        f"DELTA_LOGPEARSON3 = {delta['logpearson3']}\n\n"
+        "[CHI SQUARE]\n"
+        f"X2_CRITICAL = {fit_summary['X2_CRITICAL']}\n"
+        f"X2_NORMAL = {x2calcs['normal']}\n"
+        f"X2_LOGNORMAL = {x2calcs['lognormal']}\n"
+        f"X2_GUMBEL = {x2calcs['gumbel']}\n"
+        f"X2_LOGPEARSON3 = {x2calcs['logpearson3']}\n"
     )
 
-    ks_col = [ks_normal, ks_lognormal, ks_gumbel, ks_logpearson3]
-    ks_frame = pd.concat(ks_col, keys=dist_name, axis=1)
+    return (ks_frame, chi_frame, report_fit)
 
-    chi_normal = chi_square.chi_square_test(
-        dataframe,
-        distribution="normal",
-        distribution_source=src_normal,
-        significance_level=alpha,
-        critical_value_source=src_chisquare,
-        display_stat=False,
-    ).rename({"batas_kelas": "classes"}, axis=1)
-    chi_lognormal = chi_square.chi_square_test(
-        dataframe,
-        distribution="lognormal",
-        distribution_source=src_lognormal,
-        significance_level=alpha,
-        critical_value_source=src_chisquare,
-        display_stat=False,
-    ).rename({"batas_kelas": "classes"}, axis=1)
-    chi_gumbel = chi_square.chi_square_test(
-        dataframe,
-        distribution="gumbel",
-        distribution_source=src_gumbel,
-        significance_level=alpha,
-        critical_value_source=src_chisquare,
-        display_stat=False,
-    ).rename({"batas_kelas": "classes"}, axis=1)
-    chi_logpearson3 = chi_square.chi_square_test(
-        dataframe,
-        distribution="logpearson3",
-        distribution_source=src_logpearson3,
-        significance_level=alpha,
-        critical_value_source=src_chisquare,
-        display_stat=False,
-    ).rename({"batas_kelas": "classes"}, axis=1)
 
-    chi_col = [chi_normal, chi_lognormal, chi_gumbel, chi_logpearson3]
-    chi_frame = pd.concat(chi_col, keys=dist_name, axis=1)
+def calc_station_summary(
+    series: pd.Series,
+    return_periods: list[int],
+    alpha: float,
+    src_ks: str,
+    src_chisquare: str,
+    src_normal: str,
+    src_lognormal: str,
+    src_gumbel: str,
+    src_logpearson3: str,
+) -> pd.Series:
+    """
+    Calculate the statistics, frequency analysis and goodness of fit of a station.
 
-    # REPORT
-    series = dataframe.iloc[:, 0]
+    Args:
+        series (pd.Series): The series of the station.
+        return_periods (list): The return periods.
+        alpha (float): The significance level.
+        src_ks (str): The source of the Kolmogorov-Smirnov critical value.
+        src_chisquare (str): The source of the Chi-Square critical value.
+        src_normal (str): The source of the normal distribution.
+        src_lognormal (str): The source of the log normal distribution.
+        src_gumbel (str): The source of the gumbel distribution.
+        src_logpearson3 (str): The source of the log pearson III distribution.
 
-    # CHI REPORT
-    n_class = chi_square._calc_k(series.size)  # pylint: disable=protected-access
-    xcr = chi_square.calc_chi_square_critical(
+    Returns:
+        pd.Series: The summary with (section, item) multiindex.
+    """
+
+    series = series.replace(0, np.nan).dropna()
+
+    summary = {}
+
+    # STATISTICS
+    moments = calc_moments(series)
+    statistics = {
+        "COUNT": moments.count,
+        "MEAN": moments.mean,
+        "STD": moments.std,
+        "Cv": moments.cv,
+        "Cs": moments.cs,
+        "Ck": moments.ck,
+        "MEAN_LOG": moments.mean_log,
+        "STD_LOG": moments.std_log,
+    }
+    summary.update({("STATISTICS", key): val for key, val in statistics.items()})
+
+    # FREQUENCY
+    freq_matrix = calc_freq_matrix(
+        series, return_periods, src_normal, src_lognormal, src_gumbel, src_logpearson3
+    )
+    for dist, design_values in zip(DIST_NAME, freq_matrix.T):
+        summary.update(
+            {(dist, f"{period}"): val for period, val in zip(return_periods, design_values)}
+        )
+
+    # GOODNESS OF FIT
+    fit_summary = calc_fit_summary(
+        series.to_frame(),
         alpha,
-        chi_square._calc_dk(n_class, 2),  # pylint: disable=protected-access
-        source=src_chisquare,
+        src_ks,
+        src_chisquare,
+        src_normal,
+        src_lognormal,
+        src_gumbel,
+        src_logpearson3,
+    )
+    summary[("KOLMOGOROV-SMIRNOV", "DELTA_CRITICAL")] = fit_summary["DELTA_CRITICAL"]
+    summary.update(
+        {
+            ("KOLMOGOROV-SMIRNOV", dist): fit_summary["DELTA"][dist_lower]
+            for dist, dist_lower in zip(DIST_NAME, DIST_NAME_LOWER)
+        }
+    )
+    summary[("CHI SQUARE", "X2_CRITICAL")] = fit_summary["X2_CRITICAL"]
+    summary.update(
+        {
+            ("CHI SQUARE", dist): fit_summary["X2"][dist_lower]
+            for dist, dist_lower in zip(DIST_NAME, DIST_NAME_LOWER)
+        }
     )
 
-    x2calc = []
-    for _dist in chi_frame.columns.levels[0]:
-        _chi = chi_frame[_dist]
-        _x2 = np.sum(np.power(2, (_chi.fe - _chi.ft)) / _chi.ft)
-        x2calc.append(_x2)
+    return pd.Series(summary, dtype=float, name=series.name)
 
-    x2calcs = pd.Series(x2calc, index=dist_name_lower)
 
-    ks_critical = kolmogorov_smirnov.calc_delta_critical(
-        alpha, series.size, source=src_ks
-    )
+def _calc_station_summary_safe(args: tuple) -> pd.Series:
+    series, *options = args
+    try:
+        return calc_station_summary(series, *options)
+    except (ValueError, ZeroDivisionError, IndexError) as e:
+        print(f"{series.name}: {e}")
+        return pd.Series(dtype=float, name=series.name)
 
-    report_fit = (
-        "[GOODNESS OF FIT]\n"
-        f"N = {series.size}\n\n"
-        "[KOLMOGOROV-SMIRNOV]\n"
-        f"DELTA_CRITICAL = {ks_critical}\n"
-        f"DELTA_NORMAL = {ks_normal.d.max()}\n"
-        f"DELTA_LOGNORMAL = {ks_lognormal.d.max()}\n"
-        f"DELTA_GUMBEL = {ks_gumbel.d.max()}\n"
-        f"DELTA_LOGPEARSON3 = {ks_logpearson3.d.max()}\n\n"
-        "[CHI SQUARE]\n"
-        f"X2_CRITICAL = {xcr}\n"
-        f"X2_NORMAL = {x2calcs.normal}\n"
-        f"X2_LOGNORMAL = {x2calcs.lognormal}\n"
-        f"X2_GUMBEL = {x2calcs.gumbel}\n"
-        f"X2_LOGPEARSON3 = {x2calcs.logpearson3}\n"
+
+def _collect_summaries(results, total: int, progress=None) -> list:
+    summaries = []
+    for summary in results:
+        summaries.append(summary)
+        if progress is not None:
+            progress(len(summaries), total)
+    return summaries
+
+
+def generate_batch_result(
+    dataframe: pd.DataFrame,
+    return_periods: list[int],
+    alpha: float,
+    src_ks: str,
+    src_chisquare: str,
+    src_normal: str,
+    src_lognormal: str,
+    src_gumbel: str,
+    src_logpearson3: str,
+    max_workers: int = None,
+    progress=None,
+) -> pd.DataFrame:
+    """
+    Calculate the summary (`calc_station_summary`) of every column (station).
+
+    The stations are calculated in parallel using a process pool.
+
+    Args:
+        dataframe (pd.DataFrame): The input dataframe, one column per station.
+        return_periods (list): The return periods.
+        alpha (float): The significance level.
+        src_ks (str): The source of the Kolmogorov-Smirnov critical value.
+        src_chisquare (str): The source of the Chi-Square critical value.
+        src_normal (str): The source of the normal distribution.
+        src_lognormal (str): The source of the log normal distribution.
+        src_gumbel (str): The source of the gumbel distribution.
+        src_logpearson3 (str): The source of the log pearson III distribution.
+        max_workers (int, optional): The number of worker processes.
+            Defaults to BATCH.MAX_WORKERS of app config (or the number of CPUs).
+        progress (callable, optional): Called with (completed, total) stations
+            after each station. Defaults to None.
+
+    Returns:
+        pd.DataFrame: The summary of all stations, indexed by station with
+            (section, item) multiindex columns. Stations that can not be
+            calculated are filled with NaN.
+    """
+
+    max_workers = max_workers or appConfig.BATCH.MAX_WORKERS or os.cpu_count()
+    options = (
+        return_periods,
+        alpha,
+        src_ks,
+        src_chisquare,
+        src_normal,
+        src_lognormal,
+        src_gumbel,
+        src_logpearson3,
     )
+    tasks = [(dataframe[column], *options) for column in dataframe.columns]
 
-    return (ks_frame, chi_frame, report_fit)
+    if max_workers == 1 or len(tasks) == 1:
+        summaries = _collect_summaries(
+            map(_calc_station_summary_safe, tasks), len(tasks), progress
+        )
+    else:
+        chunksize = max(1, len(tasks) // (max_workers * 4))
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            summaries = _collect_summaries(
+                executor.map(_calc_station_summary_safe, tasks, chunksize=chunksize),
+                len(tasks),
+                progress,
+            )
+
+    result = pd.DataFrame(summaries, index=pd.Index(dataframe.columns, name="STATION"))
+    if not result.columns.empty:
+        result.columns = pd.MultiIndex.from_tuples(result.columns)
+
+    return result
@@ -0,0 +1,92 @@
+"""This module contains the background job manager for long-running callbacks."""
+
+import contextlib
+import os
+import time
+from pathlib import Path
+import diskcache
+from dash import DiskcacheManager
+from pyconfig import appConfig
+from pystore import private_directory
+
+try:
+    import fcntl
+except ImportError:  # Windows, the concurrency limit is not available
+    fcntl = None
+
+# the results of the jobs are unpickled, so the default directory is private to the user
+JOBS_DIRECTORY = Path(appConfig.JOBS.DIRECTORY or private_directory("anfrek-jobs"))
+
+BACKGROUND_CALLBACK_MANAGER = DiskcacheManager(
+    diskcache.Cache(JOBS_DIRECTORY / "cache"), expire=appConfig.JOBS.EXPIRE
+)
+
+
+def _is_same_file(file, path: Path) -> bool:
+    try:
+        return os.path.samestat(os.fstat(file.fileno()), path.stat())
+    except FileNotFoundError:
+        return False
+
+
+@contextlib.contextmanager
+def job_slot(
+    set_progress=None,
+    max_jobs: int = None,
+    poll_interval: float = 0.5,
+    owner: int = None,
+):
+    """
+    Limit the number of background jobs running at the same time per worker.
+
+    A job runs in a child process of the web worker, so the slots are lock files
+    of the parent process. The locks are released by the operating system when
+    a job finishes or is cancelled (terminated), the lock file is removed when
+    the job finishes.
+
+    Args:
+        set_progress (callable, optional): The progress function of the
+            background callback, called with (0, "WAITING...") while all
+            slots are in use. Defaults to None.
+        max_jobs (int, optional): The number of slots.
+            Defaults to JOBS.MAX_CONCURRENT of app config.
+        poll_interval (float, optional): The waiting time between attempts
+            in seconds. Defaults to 0.5.
+        owner (int, optional): The process id of the web worker owning the
+            slots. Defaults to None (the parent process of a background job).
+    """
+    max_jobs = max_jobs or appConfig.JOBS.MAX_CONCURRENT
+    if fcntl is None or not max_jobs:
+        yield
+        return
+
+    JOBS_DIRECTORY.mkdir(parents=True, exist_ok=True)
+    owner = owner or os.getppid()
+
+    waiting = False
+    while True:
+        for slot in range(max_jobs):
+            path = JOBS_DIRECTORY / f"slot-{owner}-{slot}.lock"
+            # pylint: disable-next=consider-using-with
+            lock_file = open(path, "w")
+            try:
+                fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                lock_file.close()
+                continue
+            if not _is_same_file(lock_file, path):  # removed by the previous job
+                lock_file.close()
+                continue
+
+            try:
+                yield
+            finally:
+                path.unlink(missing_ok=True)
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+                lock_file.close()
+            return
+
+        if not waiting and set_progress is not None:
+            set_progress((0, "WAITING..."))
+            waiting = True
+        time.sleep(poll_interval)
@@ -1,5 +1,6 @@
 """Layout for Dash App"""
 
+import calendar
 import plotly.io as pio
 import dash_bootstrap_components as dbc
 from dash import html, dcc
@@ -29,7 +30,7 @@ HTML_ROW_TITLE = html.Div(
 HTML_ROW_BUTTON_UPLOAD = html.Div(
     dcc.Upload(
         dbc.Button(
-            "Upload File (.csv)",
+            "Upload File (.csv / .parquet / .xlsx)",
             color="primary",
             id="button-upload",
             class_name="m-2",
@@ -42,6 +43,84 @@ HTML_ROW_BUTTON_UPLOAD = html.Div(
     className="text-center",
 )
 
+HTML_ROW_UPLOAD_LARGE = html.Div(
+    [
+        dbc.Button(
+            "Upload Large File (resumable)",
+            color="primary",
+            id="button-upload-large",
+            class_name="m-2",
+            size="sm",
+            outline=True,
+        ),
+        dbc.Progress(
+            id="progress-upload",
+            value=0,
+            className="mx-2 mb-2",
+            style={"height": "1rem"},
+        ),
+    ],
+    className="text-center",
+)
+
+HTML_ROW_UPLOAD_OPTIONS = html.Div(
+    [
+        dbc.Switch(
+            id="switch-upload-annual-max",
+            label="Raw Series (Annual Maximum)",
+            value=False,
+            className="d-inline-block",
+        ),
+        dbc.InputGroup(
+            [
+                dbc.InputGroupText("Hydrological Year"),
+                dbc.Select(
+                    id="select-upload-hydro-month",
+                    options=[
+                        dict(label=calendar.month_name[month], value=month)
+                        for month in range(1, 13)
+                    ],
+                    value=1,
+                ),
+            ],
+            size="sm",
+        ),
+        dbc.FormText(
+            "Daily/hourly series are reduced to annual maximum series",
+            className="text-muted",
+        ),
+        dbc.InputGroup(
+            [
+                dbc.InputGroupText("Excel Sheet"),
+                dbc.Input(
+                    id="input-upload-sheet",
+                    placeholder="first sheet",
+                    debounce=True,
+                ),
+                dbc.InputGroupText("Date Column"),
+                dbc.Input(
+                    id="input-upload-date-column",
+                    placeholder="first column",
+                    debounce=True,
+                ),
+                dbc.InputGroupText("Value Columns"),
+                dbc.Input(
+                    id="input-upload-value-columns",
+                    placeholder="all columns",
+                    debounce=True,
+                ),
+            ],
+            size="sm",
+            className="mt-2",
+        ),
+        dbc.FormText(
+            "Column headers of the worksheet, value columns are separated by comma",
+            className="text-muted",
+        ),
+    ],
+    className="mx-2 mb-2 text-start",
+)
+
 HTML_ROW_BUTTON_DOWNLOAD_TABLE = html.Div(
     [
         dbc.Button(
@@ -53,6 +132,24 @@ HTML_ROW_BUTTON_DOWNLOAD_TABLE = html.Div(
             disabled=True,
         ),
         dcc.Download(id="download-table"),
+        dbc.Button(
+            "Download Table (.parquet)",
+            color="success",
+            id="button-download-table-parquet",
+            class_name="m-2",
+            size="sm",
+            disabled=True,
+        ),
+        dcc.Download(id="download-table-parquet"),
+        dbc.Button(
+            "Download All Results (.zip)",
+            color="success",
+            id="button-download-all",
+            class_name="m-2",
+            size="sm",
+            external_link=True,
+            disabled=True,
+        ),
     ]
 )
 
@@ -130,21 +227,37 @@ TAB_DATA = dbc.Row(
             className="my-2",
         ),
         dbc.Col(
-            dbc.Card(
-                dbc.CardBody(
-                    [
-                        html.H3("VISUALIZATION", className="fw-bold text-center"),
-                        dcc.Loading(
-                            pylayoutfunc.graph_as_staticplot(
-                                pyfigure.generate_empty_figure(
-                                    height=700, margin_all=50
-                                )
+            [
+                dbc.Card(
+                    dbc.CardBody(
+                        [
+                            html.H3("VISUALIZATION", className="fw-bold text-center"),
+                            dcc.Loading(
+                                pylayoutfunc.graph_as_staticplot(
+                                    pyfigure.generate_empty_figure(
+                                        height=700, margin_all=50
+                                    )
+                                ),
+                                id="row-table-viz",
                             ),
-                            id="row-table-viz",
-                        ),
-                    ],
+                        ],
+                    ),
                 ),
-            ),
+                dbc.Card(
+                    dbc.CardBody(
+                        [
+                            html.H3("SUMMARY", className="fw-bold text-center"),
+                            html.Div(id="row-table-summary"),
+                            dbc.FormText(
+                                "Updated on every edit using the options of "
+                                "Frequency Analysis and Goodness of Fit",
+                                className="text-muted",
+                            ),
+                        ],
+                    ),
+                    className="my-4",
+                ),
+            ],
             md=8,
             className="my-2",
         ),
@@ -275,6 +388,41 @@ TAB_FREQ = dbc.Row(
                                 ],
                                 value="scipy",
                             ),
+                            html.H4(
+                                "CONFIDENCE INTERVAL",
+                                className="fw-bold text-center mt-3",
+                            ),
+                            dbc.Label("Bootstrap", className="fw-bold mt-2"),
+                            dbc.Select(
+                                id="select-freq-bootstrap",
+                                options=[
+                                    dict(label="NONE", value="none"),
+                                    dict(label="NON-PARAMETRIC", value="nonparametric"),
+                                    dict(label="PARAMETRIC", value="parametric"),
+                                ],
+                                value="none",
+                            ),
+                            dbc.Label("Replicates", className="fw-bold mt-2"),
+                            dbc.Input(
+                                value=appConfig.BOOTSTRAP.REPLICATES,
+                                type="number",
+                                id="input-freq-replicates",
+                                min=100,
+                                max=appConfig.BOOTSTRAP.MAX_REPLICATES,
+                                step=100,
+                            ),
+                            dbc.Label("Confidence Level", className="fw-bold mt-2"),
+                            dbc.Input(
+                                value=appConfig.BOOTSTRAP.CONFIDENCE,
+                                type="number",
+                                id="input-freq-confidence",
+                                min=0.5,
+                                max=0.99,
+                                step=0.01,
+                            ),
+                            dbc.FormText(
+                                "Input as Decimal, 0.90 for 90%", className="text-muted"
+                            ),
                             html.Div(
                                 [
                                     dbc.Button(
@@ -294,6 +442,16 @@ TAB_FREQ = dbc.Row(
                                         disabled=True,
                                     ),
                                     dcc.Download(id="download-freq"),
+                                    dbc.Button(
+                                        "DOWNLOAD FREQUENCY.PARQUET",
+                                        id="button-freq-download-parquet",
+                                        color="success",
+                                        size="md",
+                                        className="me-3 my-2",
+                                        outline=True,
+                                        disabled=True,
+                                    ),
+                                    dcc.Download(id="download-freq-parquet"),
                                 ],
                                 className="my-3 text-center",
                             ),
@@ -389,12 +547,27 @@ TAB_FIT = dbc.Row(
                                         outline=True,
                                         disabled=True,
                                     ),
+                                    dbc.Button(
+                                        "CANCEL",
+                                        id="button-fit-cancel",
+                                        color="danger",
+                                        size="md",
+                                        className="me-3 my-2",
+                                        outline=True,
+                                        disabled=True,
+                                    ),
                                     dcc.Download(id="download-fit-ks"),
                                     dcc.Download(id="download-fit-chisquare"),
                                     dcc.Download(id="download-fit"),
                                 ],
                                 className="my-3 text-center",
                             ),
+                            dbc.Progress(
+                                id="progress-fit",
+                                value=0,
+                                striped=True,
+                                animated=True,
+                            ),
                         ]
                     ),
                 ),
@@ -447,6 +620,85 @@ TAB_FIT = dbc.Row(
     class_name="mt-3",
 )
 
+TAB_BATCH = dbc.Row(
+    dbc.Col(
+        [
+            html.Div(
+                [
+                    dbc.Button(
+                        "CALCULATE ALL STATIONS",
+                        id="button-batch-calc",
+                        color="warning",
+                        size="lg",
+                        className="me-3",
+                    ),
+                    dbc.Button(
+                        "DOWNLOAD BATCH.CSV",
+                        id="button-batch-download",
+                        color="success",
+                        size="lg",
+                        className="me-3",
+                        outline=True,
+                        disabled=True,
+                    ),
+                    dbc.Button(
+                        "DOWNLOAD ALL STATIONS (ZIP)",
+                        id="button-batch-download-all",
+                        color="success",
+                        size="lg",
+                        className="me-3",
+                        outline=True,
+                        external_link=True,
+                        disabled=True,
+                    ),
+                    dbc.Button(
+                        "CANCEL",
+                        id="button-batch-cancel",
+                        color="danger",
+                        size="lg",
+                        className="me-3",
+                        outline=True,
+                        disabled=True,
+                    ),
+                    dcc.Download(id="download-batch"),
+                    html.Div(
+                        dbc.FormText(
+                            "Every column is calculated as a station using the options "
+                            "of Frequency Analysis and Goodness of Fit",
+                            className="text-muted",
+                        )
+                    ),
+                    dbc.Progress(
+                        id="progress-batch",
+                        value=0,
+                        striped=True,
+                        animated=True,
+                        className="mt-3",
+                    ),
+                ],
+                className="mx-3 mb-3 text-center",
+            ),
+            dbc.Card(
+                dbc.CardBody(
+                    [
+                        html.H3("SUMMARY", className="fw-bold text-center"),
+                        dcc.Loading(
+                            pylayoutfunc.graph_as_staticplot(
+                                pyfigure.generate_empty_figure(
+                                    height=350, margin_all=50
+                                )
+                            ),
+                            id="row-batch-result",
+                        ),
+                    ]
+                ),
+                className="my-4",
+            ),
+        ],
+    ),
+    class_name="mt-3",
+)
+
 HTML_CARDS = dbc.Tabs(
     [
         dbc.Tab(
@@ -477,10 +729,32 @@ HTML_CARDS = dbc.Tabs(
             id="card-goodness",
             disabled=True,
         ),
+        dbc.Tab(
+            TAB_BATCH,
+            label="BATCH (ALL STATIONS)",
+            tab_id="tabid-card-batch",
+            id="card-batch",
+            disabled=True,
+        ),
     ],
+    id="tabs-cards",
     active_tab="tabid-card-table",
 )
 
+# STORES
+
+HTML_STORES = html.Div(
+    [
+        dcc.Store(id="store-dataset-key"),
+        dcc.Store(id="store-upload"),
+        dcc.Store(id="store-table-edit"),
+        dcc.Store(id="store-visible-stat"),
+        dcc.Store(id="store-visible-freq"),
+        dcc.Store(id="store-freq-options"),
+        dcc.Store(id="store-visible-fit"),
+    ]
+)
+
 # TEMPORARY
 
 _HTML_TROUBLESHOOTER = html.Div(
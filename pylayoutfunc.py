@@ -1,6 +1,7 @@
 """Functions to create layout components for Dash apps."""
 
 from collections.abc import Iterable
+import numpy as np
 from dash import dcc, dash_table
 import plotly.graph_objects as go
 from pytemplate import fktemplate
@@ -29,10 +30,15 @@ def create_table_layout(
     editable: list | bool = False,
     deletable=True,
     renamable=False,
+    page_size: int = 20,
 ):
     """
     Create a table layout using Dash DataTable.
 
+    The table is paged, sorted and filtered on the server (custom actions),
+    only the first page is sent with the layout. The other pages are served
+    by a callback using `create_table_records`.
+
     Args:
         dataframe (pandas.DataFrame): The input dataframe to be displayed in the table.
         idtable (str): The ID of the DataTable component.
@@ -45,6 +51,7 @@ def create_table_layout(
             as the number of columns in the dataframe. Defaults to False.
         deletable (bool, optional): Specifies whether rows can be deleted. Defaults to True.
         renamable (bool, optional): Specifies whether columns can be renamed. Defaults to False.
+        page_size (int, optional): The number of rows of a page. Defaults to 20.
 
     Returns:
         dash_table.DataTable: The created DataTable component.
@@ -52,13 +59,10 @@ def create_table_layout(
     """
     _, _ = filename, filedate
 
-    new_dataframe = dataframe.rename_axis("DATE").reset_index()
-    new_dataframe.DATE = new_dataframe.DATE.dt.date
+    column_names = ["DATE"] + list(dataframe.columns)
 
     editable = (
-        editable
-        if isinstance(editable, Iterable)
-        else [editable] * len(new_dataframe.columns)
+        editable if isinstance(editable, Iterable) else [editable] * len(column_names)
     )
 
     table = dash_table.DataTable(
@@ -71,15 +75,144 @@ def create_table_layout(
                 "renamable": renamable,
                 "editable": edit_col,
             }
-            for i, edit_col in zip(new_dataframe.columns, editable)
+            for i, edit_col in zip(column_names, editable)
         ],
-        data=new_dataframe.to_dict("records"),
-        page_size=20,
+        data=create_table_records(
+            dataframe, np.arange(min(page_size, len(dataframe)))
+        ),
+        page_action="custom",
+        page_current=0,
+        page_size=page_size,
+        page_count=max(1, -(-len(dataframe) // page_size)),
         cell_selectable=True,
-        filter_action="native",
-        sort_action="native",
+        filter_action="custom",
+        sort_action="custom",
+        sort_mode="single",
         style_table={"overflowX": "auto"},
         style_cell={"font-family": fktemplate.layout.font.family},
         style_header={"font-size": 20, "textAlign": "center", "font-weight": "bold"},
     )
     return table
+
+
+def create_table_records(dataframe, positions) -> list[dict]:
+    """
+    Convert rows of a dataframe into DataTable records.
+
+    Args:
+        dataframe (pandas.DataFrame): The dataframe with DATE as index.
+        positions (array-like): The row positions to be converted.
+
+    Returns:
+        list: The records with the row position as `id`, so edits of a page
+            can be applied to the stored dataframe.
+    """
+    new_dataframe = dataframe.iloc[positions].rename_axis("DATE").reset_index()
+    new_dataframe.DATE = new_dataframe.DATE.dt.date
+    new_dataframe.insert(0, "id", np.asarray(positions, dtype=int))
+    return new_dataframe.to_dict("records")
+
+
+def create_summary_table_layout(dataframe, idtable, float_precision: int = 4):
+    """
+    Create a table layout of a summary dataframe with multiindex columns.
+
+    Args:
+        dataframe (pandas.DataFrame): The summary dataframe with
+            (section, item) multiindex columns.
+        idtable (str): The ID of the DataTable component.
+        float_precision (int, optional): The number of decimals displayed.
+            Defaults to 4.
+
+    Returns:
+        dash_table.DataTable: The created DataTable component.
+    """
+
+    new_dataframe = dataframe.round(float_precision).reset_index()
+    index_name = new_dataframe.columns[0]
+
+    columns = [
+        {
+            "name": [index_name[0], index_name[0]],
+            "id": str(index_name[0]),
+        }
+    ] + [
+        {"name": list(column), "id": " | ".join(column), "type": "numeric"}
+        for column in new_dataframe.columns[1:]
+    ]
+    data = [
+        dict(zip([col["id"] for col in columns], row))
+        for row in new_dataframe.itertuples(index=False)
+    ]
+
+    table = dash_table.DataTable(
+        id=idtable,
+        columns=columns,
+        data=data,
+        page_size=20,
+        merge_duplicate_headers=True,
+        sort_action="native",
+        fixed_columns={"headers": True, "data": 1},
+        style_table={"overflowX": "auto", "minWidth": "100%"},
+        style_cell={"font-family": fktemplate.layout.font.family},
+        style_header={"textAlign": "center", "font-weight": "bold"},
+    )
+    return table
+
+
+def create_freq_table_layout(dataframe, idtable, float_precision: int = 4):
+    """
+    Create a table layout of the design values, a row per distribution.
+
+    Args:
+        dataframe (pandas.DataFrame): The design values with return periods as
+            index and distributions as columns.
+        idtable (str): The ID of the DataTable component.
+        float_precision (int, optional): The number of decimals displayed.
+            Defaults to 4.
+
+    Returns:
+        dash_table.DataTable: The created DataTable component, the rows are in
+            the order of the columns of the dataframe.
+    """
+
+    columns = [{"name": ["DISTRIBUTION", "DISTRIBUTION"], "id": "DISTRIBUTION"}] + [
+        {"name": ["RETURN PERIOD", f"{period}"], "id": f"{period}", "type": "numeric"}
+        for period in dataframe.index
+    ]
+    data = [
+        create_freq_table_record(dataframe[column], float_precision)
+        for column in dataframe.columns
+    ]
+
+    table = dash_table.DataTable(
+        id=idtable,
+        columns=columns,
+        data=data,
+        merge_duplicate_headers=True,
+        fixed_columns={"headers": True, "data": 1},
+        style_table={"overflowX": "auto", "minWidth": "100%"},
+        style_cell={"font-family": fktemplate.layout.font.family},
+        style_header={"textAlign": "center", "font-weight": "bold"},
+    )
+    return table
+
+
+def create_freq_table_record(series, float_precision: int = 4) -> dict:
+    """
+    Convert the design values of a distribution into a record of the table.
+
+    Args:
+        series (pandas.Series): The design values of a distribution (named)
+            with return periods as index.
+        float_precision (int, optional): The number of decimals displayed.
+            Defaults to 4.
+
+    Returns:
+        dict: The record of `create_freq_table_layout`.
+    """
+    record = {"DISTRIBUTION": series.name}
+    record.update(
+        {f"{period}": value for period, value in series.round(float_precision).items()}
+    )
+    return record
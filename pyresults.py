@@ -0,0 +1,207 @@
+"""This module contains the storage of computed results shared between processes."""
+
+import json
+import os
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+import diskcache
+import plotly.io as pio
+from pyconfig import appConfig
+import pycache
+from pystore import private_directory
+
+try:
+    import fcntl
+except ImportError:  # Windows, computations are coalesced within a process only
+    fcntl = None
+
+# the results are unpickled, so the default directory is private to the user
+RESULTS_DIRECTORY = Path(
+    appConfig.RESULTS.DIRECTORY or private_directory("anfrek-results")
+)
+
+# disk cache, so results are shared between web workers and background jobs
+RESULTS = diskcache.Cache(RESULTS_DIRECTORY, size_limit=appConfig.RESULTS.SIZE_LIMIT)
+
+# deserialized figures of this process, bounded by the size of their JSON
+FIGURES = pycache.LRUCache(
+    maxsize=appConfig.RESULTS.FIGURE_MAXSIZE,
+    maxbytes=appConfig.RESULTS.FIGURE_MEMORY,
+    sizeof=lambda entry: entry[0],
+)
+
+# lock files of the computations in progress, shared between processes
+LOCK_DIRECTORY = RESULTS_DIRECTORY / "locks"
+
+# (lock, number of waiting threads) of the computations in progress of this process
+_FLIGHTS = {}
+_FLIGHTS_LOCK = threading.Lock()
+
+
+def _reset_flights():
+    # a forked process (background job) does not own the locks of its parent
+    global _FLIGHTS, _FLIGHTS_LOCK  # pylint: disable=global-statement
+    _FLIGHTS, _FLIGHTS_LOCK = {}, threading.Lock()
+
+
+os.register_at_fork(after_in_child=_reset_flights)
+
+
+def make_result_key(name: str, dataset_key: str, *options) -> str:
+    """
+    Generate the key of a result from the dataset key and the options.
+
+    Args:
+        name (str): The name of the result (e.g. "figure-freq").
+        dataset_key (str): The key of the stored dataset (content hash).
+        *options: The filter query and parameters of the calculation.
+
+    Returns:
+        str: The deterministic key of the result.
+    """
+    return f"{name}-{dataset_key}-{pycache.make_key(*options)}"
+
+
+@contextmanager
+def single_flight(key: str):
+    """
+    Run the body for one caller of `key` at a time (single flight).
+
+    The threads of a process wait on a lock per key, the processes wait on a
+    lock file (fcntl) per key. A caller should check again for a stored result
+    after entering, it is computed by the caller before it.
+
+    Args:
+        key (str): The key of the computation (result key).
+    """
+    with _FLIGHTS_LOCK:
+        lock, waiting = _FLIGHTS.get(key, (threading.Lock(), 0))
+        _FLIGHTS[key] = (lock, waiting + 1)
+    try:
+        with lock, _lock_file(key):
+            yield
+    finally:
+        with _FLIGHTS_LOCK:
+            lock, waiting = _FLIGHTS[key]
+            if waiting == 1:
+                del _FLIGHTS[key]
+            else:
+                _FLIGHTS[key] = (lock, waiting - 1)
+
+
+@contextmanager
+def _lock_file(key: str):
+    if fcntl is None:
+        yield
+        return
+
+    LOCK_DIRECTORY.mkdir(parents=True, exist_ok=True)
+    # the key contains the dataset key sent by the browser, it is not a file name
+    path = LOCK_DIRECTORY / f"{pycache.make_key(key)}.lock"
+    while True:
+        with open(path, "a", encoding="utf-8") as file:
+            fcntl.flock(file, fcntl.LOCK_EX)
+            try:
+                # the file is removed by the previous owner, lock the new file
+                if os.fstat(file.fileno()).st_ino != os.stat(path).st_ino:
+                    continue
+            except FileNotFoundError:
+                continue
+            try:
+                yield
+                return
+            finally:
+                path.unlink(missing_ok=True)
+                fcntl.flock(file, fcntl.LOCK_UN)
+
+
+def _get_or_store(key: str, compute, is_stored_value=lambda value: value is not None):
+    value = RESULTS.get(key)
+    if is_stored_value(value):
+        return value
+
+    with single_flight(key):
+        # stored by another thread or process while waiting
+        value = RESULTS.get(key)
+        if not is_stored_value(value):
+            value = compute()
+            RESULTS.set(key, value, expire=appConfig.RESULTS.EXPIRE)
+
+    return value
+
+
+def get_or_compute(name: str, compute, dataset_key: str, *options):
+    """
+    Return a stored result, or compute and store it.
+
+    Concurrent requests of the same result (threads and processes) wait for
+    a single computation.
+
+    Args:
+        name (str): The name of the result.
+        compute (callable): The function (without arguments) computing the result.
+        dataset_key (str): The key of the stored dataset.
+        *options: The filter query and parameters of the calculation.
+
+    Returns:
+        The stored or computed result.
+    """
+    return _get_or_store(make_result_key(name, dataset_key, *options), compute)
+
+
+def get_or_compute_figure(name: str, compute, dataset_key: str, *options) -> dict:
+    """
+    Return a stored figure as its JSON structure, or compute and store it.
+
+    The figure is stored as JSON on disk (shared between processes) and kept
+    as a dictionary in memory (FIGURES). A callback returns the dictionary,
+    so the figure is not built, validated and serialized again by Dash.
+    Concurrent requests of the same figure wait for a single computation.
+
+    Args:
+        name (str): The name of the figure.
+        compute (callable): The function (without arguments) returning a `go.Figure`.
+        dataset_key (str): The key of the stored dataset.
+        *options: The filter query and parameters of the figure.
+
+    Returns:
+        dict: The figure as dictionary, shared and must not be modified.
+    """
+    key = make_result_key(name, dataset_key, *options)
+    cached = FIGURES.get(key)
+    if cached is not None:
+        return cached[1]
+
+    data = _get_or_store(
+        key,
+        lambda: pio.to_json(compute(), validate=False).encode("utf-8"),
+        # figures stored by previous versions are not serialized
+        lambda value: isinstance(value, bytes),
+    )
+
+    figure = json.loads(data)
+    FIGURES.set(key, (len(data), figure))
+    return figure
+
+
+def claim(name: str, dataset_key: str, *options) -> bool:
+    """
+    Claim a task shared between processes, only the first claim succeeds.
+
+    The claim expires with the results (RESULTS.EXPIRE), so the task is done
+    again when its results may be expired or the claiming process has died.
+
+    Args:
+        name (str): The name of the task (e.g. "warm-example").
+        dataset_key (str): The key of the stored dataset.
+        *options: The parameters of the task.
+
+    Returns:
+        bool: True if the task is claimed by this call.
+    """
+    return RESULTS.add(
+        make_result_key(name, dataset_key, *options),
+        os.getpid(),
+        expire=appConfig.RESULTS.EXPIRE,
+    )
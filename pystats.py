@@ -0,0 +1,421 @@
+"""This module contains the incremental statistics of the edited table."""
+
+import itertools
+import threading
+import numpy as np
+import pandas as pd
+from sortedcontainers import SortedList
+from hidrokit.contrib.taruma import gumbel, lognormal, normal, logpearson3
+from hidrokit.contrib.taruma import kolmogorov_smirnov
+from pyconfig import appConfig
+import pycache
+import pyfunc
+import pystore
+
+# pylint: disable=too-many-arguments
+
+# largest ratio of the accumulated to the central sum of 4th powers (about 6 of
+# 16 digits lost by cancellation) before the power sums are rebuilt
+REBUILD_RATIO = 1e6
+
+
+class PowerSums:
+    """
+    Sums of powers (1 to 4) of the values minus a fixed shift.
+
+    The shift is the mean of the initial values, so the sums stay small and
+    the central moments do not lose precision by cancellation. A removed
+    value far from the others (e.g. a reverted typo) leaves the rounding error
+    of its powers in the sums, see `is_accurate`.
+
+    Args:
+        values (array-like): The initial values.
+    """
+
+    def __init__(self, values):
+        values = np.asarray(values, dtype=float)
+        self.count = values.size
+        self.shift = values.mean() if values.size else 0.0
+        deviation = values - self.shift
+        self.sums = [float(np.sum(deviation**power)) for power in range(1, 5)]
+        # the largest sum of 4th powers, the rounding error is relative to it
+        self.peak = self.sums[3]
+
+    def add(self, value: float):
+        """Add a value in O(1)."""
+        deviation = value - self.shift
+        for power in range(1, 5):
+            self.sums[power - 1] += deviation**power
+        self.count += 1
+        self.peak = max(self.peak, self.sums[3])
+
+    def remove(self, value: float):
+        """Remove a value in O(1)."""
+        deviation = value - self.shift
+        for power in range(1, 5):
+            self.sums[power - 1] -= deviation**power
+        self.count -= 1
+
+    def central_sums(self) -> tuple[float, float, float, float]:
+        """
+        Return the mean and the sums of the 2nd, 3rd and 4th power of deviations.
+
+        Returns:
+            tuple: (mean, sum (x - mean)^2, sum (x - mean)^3, sum (x - mean)^4).
+        """
+        count = self.count
+        sum1, sum2, sum3, sum4 = self.sums
+        delta = sum1 / count
+        central2 = sum2 - count * delta**2
+        central3 = sum3 - 3 * delta * sum2 + 2 * count * delta**3
+        central4 = (
+            sum4 - 4 * delta * sum3 + 6 * delta**2 * sum2 - 3 * count * delta**4
+        )
+        return self.shift + delta, central2, central3, central4
+
+    def is_accurate(self) -> bool:
+        """
+        Return True if the central sums have not lost precision by cancellation.
+
+        The sums are accurate while the largest accumulated sum of 4th powers
+        is within REBUILD_RATIO of the central sum of 4th powers.
+        """
+        if self.count < 2:
+            return True
+        return self.peak <= self.central_sums()[3] * REBUILD_RATIO
+
+    def mean_std_skew(self) -> tuple[float, float, float]:
+        """Return the mean, standard deviation (ddof=1) and skewness (bias=False)."""
+        count = self.count
+        mean, central2, central3, _ = self.central_sums()
+        std = np.sqrt(central2 / (count - 1))
+        skew = (
+            (central3 / count)
+            / (central2 / count) ** 1.5
+            * np.sqrt(count * (count - 1))
+            / (count - 2)
+        )
+        return mean, std, skew
+
+
+class IncrementalStats:
+    """
+    Statistics of a series that are updated per edited value.
+
+    The values are kept in sorted order (ranks and quantiles) and as power sums
+    of all values, of the nonzero values (frequency analysis) and of the
+    logarithm of the positive values. An update costs O(log n). Until the first
+    update, the results are calculated from the series, so they are equal to
+    the full calculation. The sums are rebuilt from the sorted values in O(n)
+    if an update leaves a large rounding error (`PowerSums.is_accurate`).
+
+    Args:
+        series (pd.Series): The initial series, missing values are ignored.
+    """
+
+    def __init__(self, series: pd.Series):
+        values = np.asarray(series, dtype=float)
+        values = values[~np.isnan(values)]
+
+        self._series = series
+        self._lock = threading.Lock()
+        self.sorted_values = SortedList(values)
+        self._set_sums(values)
+
+    def _set_sums(self, values: np.ndarray):
+        self.values = PowerSums(values)
+        self.nonzero = PowerSums(values[values != 0])
+        self.log = PowerSums(np.log10(values[values > 0]))
+
+    @property
+    def count(self) -> int:
+        """The number of values."""
+        return self.values.count
+
+    def update(self, old_value: float, new_value: float):
+        """
+        Replace `old_value` by `new_value`, missing values (NaN) are skipped.
+
+        Args:
+            old_value (float): The previous value of the edited cell.
+            new_value (float): The new value of the edited cell.
+        """
+        with self._lock:
+            self._series = None
+            if not np.isnan(old_value):
+                self.sorted_values.remove(old_value)
+                self.values.remove(old_value)
+                if old_value != 0:
+                    self.nonzero.remove(old_value)
+                if old_value > 0:
+                    self.log.remove(np.log10(old_value))
+            if not np.isnan(new_value):
+                self.sorted_values.add(new_value)
+                self.values.add(new_value)
+                if new_value != 0:
+                    self.nonzero.add(new_value)
+                if new_value > 0:
+                    self.log.add(np.log10(new_value))
+
+            sums = (self.values, self.nonzero, self.log)
+            if not all(power_sums.is_accurate() for power_sums in sums):
+                self._set_sums(np.fromiter(self.sorted_values, dtype=float))
+
+    def rank(self, value: float) -> int:
+        """Return the rank (1 = smallest) of `value` in O(log n)."""
+        return self.sorted_values.bisect_left(value) + 1
+
+    def empirical_probability(self, value: float) -> float:
+        """Return the empirical (Weibull) probability of `value`, rank / (n + 1)."""
+        return self.rank(value) / (self.count + 1)
+
+    def _sorted_value(self, position: int, nonzero: bool = False) -> float:
+        # position in the sorted values, without the zeros if `nonzero`
+        if nonzero and position >= self.sorted_values.bisect_left(0):
+            position += self.sorted_values.count(0)
+        return self.sorted_values[position]
+
+    def quantile(self, q: float, nonzero: bool = False) -> float:
+        """Return the quantile (linear interpolation, as pandas) in O(log n)."""
+        count = self.nonzero.count if nonzero else self.count
+        position = (count - 1) * q
+        lower = int(np.floor(position))
+        upper = min(lower + 1, count - 1)
+        value_lower = self._sorted_value(lower, nonzero)
+        return value_lower + (position - lower) * (
+            self._sorted_value(upper, nonzero) - value_lower
+        )
+
+    def moments(self, nonzero: bool = False) -> pyfunc.Moments:
+        """
+        Return the statistics of the values (same as `pyfunc.calc_moments`).
+
+        Args:
+            nonzero (bool, optional): Exclude the zeros, as the frequency analysis
+                and `pyfunc.calc_station_summary`. Defaults to False.
+        """
+        with self._lock:
+            if self._series is not None:
+                series = self._series.replace(0, np.nan) if nonzero else self._series
+                return pyfunc.calc_moments(series)
+
+            sums = self.nonzero if nonzero else self.values
+            count = sums.count
+            mean, central2, central3, central4 = sums.central_sums()
+            std = np.sqrt(central2 / (count - 1))
+            mean_log, std_log, _ = self.log.mean_std_skew()
+
+            return pyfunc.Moments(
+                count=count,
+                mean=mean,
+                std=std,
+                std0=np.sqrt(central2 / count),
+                cv=std / mean,
+                cs=count**2
+                / ((count - 1) * (count - 2))
+                * (central3 / count)
+                / std**3,
+                ck=count**3
+                / ((count - 1) * (count - 2) * (count - 3))
+                * (central4 / count)
+                / std**4,
+                min=self._sorted_value(0, nonzero),
+                p25=self.quantile(0.25, nonzero),
+                p50=self.quantile(0.5, nonzero),
+                p75=self.quantile(0.75, nonzero),
+                max=self._sorted_value(count - 1, nonzero),
+                count_log=self.log.count,
+                mean_log=mean_log,
+                std_log=std_log,
+            )
+
+    def design_values(
+        self,
+        return_periods,
+        src_normal: str,
+        src_lognormal: str,
+        src_gumbel: str,
+        src_logpearson3: str,
+    ) -> np.ndarray:
+        """
+        Return the design values of the nonzero values (as `pyfunc.calc_freq_matrix`).
+
+        Returns:
+            np.ndarray: The design values with shape (return periods, 4) in the
+                order of normal, log normal, gumbel and log pearson III.
+        """
+        sources = (src_normal, src_lognormal, src_gumbel, src_logpearson3)
+        with self._lock:
+            if self._series is not None:
+                series = self._series.replace(0, np.nan).dropna()
+                return pyfunc.calc_freq_matrix(series, return_periods, *sources)
+
+            mean, std, _ = self.nonzero.mean_std_skew()
+            mean_log, std_log, skew_log = self.log.mean_std_skew()
+            return pyfunc.calc_design_values(
+                self.nonzero.count,
+                mean,
+                std,
+                mean_log,
+                std_log,
+                skew_log,
+                return_periods,
+                *sources,
+            )
+
+    def ks_deltas(
+        self,
+        src_normal: str,
+        src_lognormal: str,
+        src_gumbel: str,
+        src_logpearson3: str,
+    ) -> dict:
+        """
+        Return the Kolmogorov-Smirnov delta (max) of every distribution.
+
+        The calculation is the same as `kolmogorov_smirnov.kolmogorov_smirnov_test`
+        from hidrokit, using the sorted nonzero values without sorting.
+
+        Returns:
+            dict: The delta keyed by the lowercase distribution name.
+        """
+        with self._lock:
+            values = np.fromiter(
+                itertools.chain(
+                    self.sorted_values.islice(0, self.sorted_values.bisect_left(0)),
+                    self.sorted_values.islice(self.sorted_values.bisect_right(0)),
+                ),
+                dtype=float,
+            )
+            mean, std, _ = self.nonzero.mean_std_skew()
+            mean_log, std_log, skew_log = self.log.mean_std_skew()
+
+        count = values.size
+        prob_weibull = np.arange(1, count + 1) / (count + 1)
+        k_value = (values - mean) / std
+        k_log = (np.log10(values) - mean_log) / std_log
+
+        prob_dist = {
+            "normal": normal.calc_prob(k_value, source=src_normal),
+            "lognormal": lognormal.calc_prob(k_log, source=src_lognormal),
+            "gumbel": gumbel.calc_prob(k_value, count, source=src_gumbel),
+            "logpearson3": logpearson3.calc_prob(
+                k_log, skew_log, source=src_logpearson3
+            ),
+        }
+
+        return {
+            dist: np.max(np.abs(prob_weibull - prob))
+            for dist, prob in prob_dist.items()
+        }
+
+    def summary(
+        self,
+        return_periods: list[int],
+        alpha: float,
+        src_ks: str,
+        src_normal: str,
+        src_lognormal: str,
+        src_gumbel: str,
+        src_logpearson3: str,
+    ) -> pd.Series:
+        """
+        Return the statistics, design values and Kolmogorov-Smirnov test.
+
+        The keys and values are the same as `pyfunc.calc_station_summary`
+        (without Chi-Square), the zeros are excluded.
+
+        Returns:
+            pd.Series: The summary with (section, item) multiindex.
+        """
+        sources = (src_normal, src_lognormal, src_gumbel, src_logpearson3)
+        moments = self.moments(nonzero=True)
+
+        summary = {
+            ("STATISTICS", "COUNT"): moments.count,
+            ("STATISTICS", "MEAN"): moments.mean,
+            ("STATISTICS", "STD"): moments.std,
+            ("STATISTICS", "Cv"): moments.cv,
+            ("STATISTICS", "Cs"): moments.cs,
+            ("STATISTICS", "Ck"): moments.ck,
+            ("STATISTICS", "MEAN_LOG"): moments.mean_log,
+            ("STATISTICS", "STD_LOG"): moments.std_log,
+        }
+
+        design_values = self.design_values(return_periods, *sources)
+        for dist, values in zip(pyfunc.DIST_NAME, design_values.T):
+            summary.update(
+                {(dist, f"{period}"): val for period, val in zip(return_periods, values)}
+            )
+
+        summary[("KOLMOGOROV-SMIRNOV", "DELTA_CRITICAL")] = (
+            kolmogorov_smirnov.calc_delta_critical(
+                alpha, self.nonzero.count, source=src_ks
+            )
+        )
+        deltas = self.ks_deltas(*sources)
+        summary.update(
+            {
+                ("KOLMOGOROV-SMIRNOV", dist): deltas[dist_lower]
+                for dist, dist_lower in zip(pyfunc.DIST_NAME, pyfunc.DIST_NAME_LOWER)
+            }
+        )
+
+        return pd.Series(summary, dtype=float)
+
+
+_STATES = pycache.LRUCache(maxsize=appConfig.CACHE.STATS_MAXSIZE)
+
+
+def get_stats(dataset_key: str, series: pd.Series) -> IncrementalStats:
+    """
+    Return the incremental statistics of a column of a stored dataset.
+
+    Args:
+        dataset_key (str): The key of the stored dataset.
+        series (pd.Series): The column of the stored dataset (unfiltered).
+
+    Returns:
+        IncrementalStats: The statistics, created if not available.
+    """
+    key = (dataset_key, series.name)
+    state = _STATES.get(key)
+    if state is None:
+        state = IncrementalStats(series)
+        _STATES.set(key, state)
+    return state
+
+
+def apply_edits(
+    dataset_key: str, new_key: str, dataframe: pd.DataFrame, edits: list[dict]
+):
+    """
+    Move the statistics of a dataset to its edited version and apply the edits.
+
+    Args:
+        dataset_key (str): The key of the dataset before the edits.
+        new_key (str): The key of the edited dataset.
+        dataframe (pd.DataFrame): The dataset before the edits.
+        edits (list): The edited cells as dictionaries with keys
+            `row` (position), `column` (name) and `value`, edits of unknown
+            columns or rows are skipped.
+    """
+    if new_key == dataset_key:
+        return
+
+    for column in dataframe.columns:
+        state = _STATES.pop((dataset_key, column))
+        if state is None:
+            continue
+
+        values = dataframe[column]
+        current = {}
+        for edit in pystore.valid_edits(dataframe, edits):
+            if edit["column"] != column:
+                continue
+            row = edit["row"]
+            new_value = float(pd.to_numeric(edit["value"], errors="coerce"))
+            state.update(current.get(row, values.iat[row]), new_value)
+            current[row] = new_value
+
+        _STATES.set((new_key, column), state)
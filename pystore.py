@@ -0,0 +1,305 @@
+"""This module contains the server-side storage of uploaded datasets."""
+
+import os
+import re
+import stat
+import tempfile
+from pathlib import Path
+import numpy as np
+import pandas as pd
+from pyconfig import appConfig
+import pycache
+
+# the content hash (sha1) of a dataset, the key is sent by the browser
+DATASET_KEY = re.compile(r"[0-9a-f]{40}")
+
+
+def is_dataset_key(key) -> bool:
+    """Return True if `key` is a valid dataset key (not a path)."""
+    return isinstance(key, str) and DATASET_KEY.fullmatch(key) is not None
+
+
+def valid_edits(dataframe: pd.DataFrame, edits: list[dict]) -> list[dict]:
+    """
+    Return the edits of existing cells of a dataframe.
+
+    The edits are sent by the browser, an edit of an unknown column or of a
+    row position outside the dataframe is skipped.
+
+    Args:
+        dataframe (pd.DataFrame): The edited dataframe.
+        edits (list): The edited cells as dictionaries with keys
+            `row` (position), `column` (name) and `value`.
+
+    Returns:
+        list: The valid edits.
+    """
+    return [
+        edit
+        for edit in edits or []
+        if edit.get("column") in dataframe.columns
+        and isinstance(edit.get("row"), int)
+        and not isinstance(edit["row"], bool)
+        and 0 <= edit["row"] < len(dataframe)
+    ]
+
+
+def private_directory(name: str) -> Path:
+    """
+    Return a directory in the temporary directory accessible only by this user.
+
+    The directory is created with mode 0700. Its files are unpickled by the
+    server, so an existing directory that is not owned by this user or is
+    accessible by others is rejected.
+
+    Args:
+        name (str): The name of the directory, the user id is appended.
+
+    Returns:
+        Path: The path of the directory.
+
+    Raises:
+        PermissionError: If the existing directory is not private.
+    """
+    if not hasattr(os, "getuid"):  # Windows, the temporary directory is per user
+        return Path(tempfile.gettempdir()) / name
+
+    path = Path(tempfile.gettempdir()) / f"{name}-{os.getuid()}"
+    path.mkdir(mode=0o700, exist_ok=True)
+    status = path.lstat()
+    if (
+        not stat.S_ISDIR(status.st_mode)
+        or status.st_uid != os.getuid()
+        or status.st_mode & 0o077
+    ):
+        raise PermissionError(f"Directory {path} is not private (0700).")
+    return path
+
+
+class DatasetStore:
+    """
+    Content-addressed storage of DataFrames with a memory and a disk tier.
+
+    The datasets are stored under the hash of their content, so the browser
+    only needs to hold the key. Recently used datasets are kept in memory,
+    every dataset is also written to disk so it can be shared between workers.
+    An edited dataset is stored as a delta (the edited cells) on top of its
+    uploaded dataset, keyed by the hash of the delta. The sorted order of a
+    column is calculated once per dataset and kept in memory for sorting the
+    table pages.
+
+    Args:
+        directory (str or Path): The directory of the disk tier.
+        memory_items (int, optional): The number of datasets kept in memory.
+            Defaults to 16.
+        disk_items (int, optional): The number of datasets kept on disk.
+            Defaults to 256.
+    """
+
+    def __init__(self, directory, memory_items: int = 16, disk_items: int = 256):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.disk_items = disk_items
+        self._memory = pycache.LRUCache(maxsize=memory_items)
+        self._sorted = pycache.LRUCache(maxsize=memory_items * 4)
+        self._deltas = pycache.LRUCache(maxsize=memory_items * 4)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.pkl"
+
+    def _delta_path(self, key: str) -> Path:
+        return self.directory / f"{key}.delta.pkl"
+
+    def _write(self, path: Path, data):
+        # write to a temporary file first, other workers may read the same key
+        temp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        pd.to_pickle(data, temp_path)
+        os.replace(temp_path, path)
+        self._evict_disk()
+
+    def _read_delta(self, key: str) -> tuple[str, dict] | None:
+        """Return the delta (base key, {(row, column): value}) of an edited key."""
+        delta = self._deltas.get(key)
+        if delta is None:
+            path = self._delta_path(key)
+            try:
+                delta = pd.read_pickle(path)
+            except (FileNotFoundError, EOFError):
+                return None
+            os.utime(path)
+            self._deltas.set(key, delta)
+        return delta
+
+    def put(self, dataframe: pd.DataFrame, key: str = None) -> str:
+        """
+        Store a dataframe and return its content key.
+
+        Args:
+            dataframe (pd.DataFrame): The dataframe to be stored.
+            key (str, optional): The content key of the dataframe, if it is
+                already known (stored before). Defaults to None (hashed).
+
+        Returns:
+            str: The key of the stored dataframe.
+        """
+        key = key or pycache.hash_dataframe(dataframe)
+        self._memory.set(key, dataframe)
+
+        path = self._path(key)
+        if path.exists():
+            os.utime(path)
+        else:
+            self._write(path, dataframe)
+
+        return key
+
+    def get(self, key: str) -> pd.DataFrame | None:
+        """
+        Return the dataframe stored under `key`, or None if it is not available.
+
+        The returned dataframe is shared and must not be modified. An invalid
+        key (e.g. a path) is not available.
+        """
+        if not is_dataset_key(key):
+            return None
+
+        dataframe = self._memory.get(key)
+        if dataframe is not None:
+            return dataframe
+
+        delta = self._read_delta(key)
+        if delta is not None:
+            base_key, cells = delta
+            dataframe = self.get(base_key)
+            if dataframe is None:
+                return None
+            dataframe = _apply_cells(dataframe, cells)
+            self._memory.set(key, dataframe)
+            return dataframe
+
+        path = self._path(key)
+        try:
+            dataframe = pd.read_pickle(path)
+        except (FileNotFoundError, EOFError):
+            return None
+        os.utime(path)
+        self._memory.set(key, dataframe)
+
+        return dataframe
+
+    def apply_edits(self, key: str, edits: list[dict]) -> str | None:
+        """
+        Apply cell edits to a stored dataframe and store the result.
+
+        Only the edited cells are hashed and written to disk, as a delta on top
+        of the uploaded dataset. Edits of unknown columns or rows are skipped
+        (`valid_edits`).
+
+        Args:
+            key (str): The key of the stored dataframe.
+            edits (list): The edited cells as dictionaries with keys
+                `row` (position), `column` (name) and `value`.
+
+        Returns:
+            str or None: The key of the edited dataframe,
+                or None if the dataframe is not available.
+        """
+        dataframe = self.get(key)
+        if dataframe is None:
+            return None
+
+        new_cells = {
+            (edit["row"], edit["column"]): float(
+                pd.to_numeric(edit["value"], errors="coerce")
+            )
+            for edit in valid_edits(dataframe, edits)
+        }
+        if not new_cells:
+            return key
+
+        dataframe = _apply_cells(dataframe, new_cells)
+        base_key, cells = self._read_delta(key) or (key, {})
+        base = self.get(base_key)
+        if base is None:  # the uploaded dataset is evicted, store the whole dataset
+            return self.put(dataframe)
+
+        cells = {**cells, **new_cells}
+        new_key = pycache.make_key(base_key, sorted(cells.items()))
+        self._memory.set(new_key, dataframe)
+        self._deltas.set(new_key, (base_key, cells))
+        # the delta is only usable by other workers with its base on disk
+        self.put(base, key=base_key)
+        if not self._delta_path(new_key).exists():
+            self._write(self._delta_path(new_key), (base_key, cells))
+
+        return new_key
+
+    def sorted_index(
+        self, key: str, column: str, ascending: bool = True
+    ) -> np.ndarray | None:
+        """
+        Return the row positions of a stored dataframe sorted by a column.
+
+        Missing values are placed last in both directions, as DataTable does.
+
+        Args:
+            key (str): The key of the stored dataframe.
+            column (str): The column name, "DATE" sorts by the index.
+            ascending (bool, optional): The sort direction. Defaults to True.
+
+        Returns:
+            np.ndarray or None: The sorted row positions,
+                or None if the dataframe or column is not available.
+        """
+        if not is_dataset_key(key):
+            return None
+
+        cache_key = (key, column)
+        cached = self._sorted.get(cache_key)
+
+        if cached is None:
+            dataframe = self.get(key)
+            if dataframe is None:
+                return None
+            if column == "DATE":
+                values = dataframe.index.to_numpy()
+            elif column in dataframe.columns:
+                values = dataframe[column].to_numpy(dtype=float, na_value=np.nan)
+            else:
+                return None
+            # numpy sorts NaN (and NaT) last
+            order = np.argsort(values, kind="stable")
+            cached = (order, int(pd.notna(values).sum()))
+            self._sorted.set(cache_key, cached)
+
+        order, count = cached
+        if ascending:
+            return order
+        return np.concatenate([order[:count][::-1], order[count:]])
+
+    def _evict_disk(self):
+        paths = sorted(self.directory.glob("*.pkl"), key=_modified_time, reverse=True)
+        for path in paths[self.disk_items :]:
+            path.unlink(missing_ok=True)
+
+
+def _apply_cells(dataframe: pd.DataFrame, cells: dict) -> pd.DataFrame:
+    """Return a copy of the dataframe with the cells {(row, column): value}."""
+    dataframe = dataframe.copy()
+    for (row, column), value in cells.items():
+        dataframe.iloc[row, dataframe.columns.get_loc(column)] = value
+    return dataframe
+
+
+def _modified_time(path: Path) -> float:
+    try:
+        return path.stat().st_mtime
+    except FileNotFoundError:
+        return 0.0
+
+
+DATASET_STORE = DatasetStore(
+    appConfig.STORE.DIRECTORY or private_directory("anfrek-store"),
+    memory_items=appConfig.STORE.MEMORY_ITEMS,
+    disk_items=appConfig.STORE.DISK_ITEMS,
+)
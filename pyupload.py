@@ -0,0 +1,129 @@
+"""Chunked (resumable) upload of large files (Flask blueprint)."""
+
+import os
+import re
+import time
+from pathlib import Path
+from flask import Blueprint, jsonify, request
+from pyconfig import appConfig
+from pystore import private_directory
+
+upload = Blueprint("upload", __name__, url_prefix="/upload")
+
+# the uploads of all users, so the default directory is private to the server user
+UPLOAD_DIRECTORY = Path(
+    appConfig.UPLOAD.DIRECTORY or private_directory("anfrek-uploads")
+)
+
+# a planted symbolic link is not followed when writing a chunk (not on Windows)
+_OPEN_FLAGS = os.O_RDWR | os.O_CREAT | getattr(os, "O_NOFOLLOW", 0)
+
+# generated by the browser from a random token and the name, size and date of the file
+UPLOAD_ID = re.compile(r"[A-Za-z0-9_-]{16,128}")
+
+
+class UploadError(ValueError):
+    """Invalid upload request, returned as JSON with the current offset."""
+
+    def __init__(self, message: str, offset: int = 0, status: int = 400):
+        super().__init__(message)
+        self.offset = offset
+        self.status = status
+
+
+@upload.errorhandler(UploadError)
+def handle_upload_error(error):
+    """Return the error message and the offset to resume from as JSON."""
+    return jsonify({"error": str(error), "offset": error.offset}), error.status
+
+
+def upload_path(upload_id: str) -> Path:
+    """
+    Return the path of the (partial) file of an upload.
+
+    Args:
+        upload_id (str): The id of the upload.
+
+    Returns:
+        Path: The path of the file in the upload directory.
+
+    Raises:
+        UploadError: If the id is not valid.
+    """
+    if not UPLOAD_ID.fullmatch(upload_id or ""):
+        raise UploadError("Invalid upload id.")
+    return UPLOAD_DIRECTORY / f"{upload_id}.part"
+
+
+def upload_size(upload_id: str) -> int:
+    """Return the number of received bytes of an upload (0 if not started)."""
+    path = upload_path(upload_id)
+    return path.stat().st_size if path.exists() else 0
+
+
+def remove_upload(upload_id: str):
+    """Remove the file of an upload (parsed), ignored if it cannot be removed."""
+    try:
+        upload_path(upload_id).unlink(missing_ok=True)
+    except OSError:  # e.g. still mapped on Windows, removed when expired
+        pass
+
+
+def remove_expired():
+    """Remove the uploads that are not modified within UPLOAD.EXPIRE seconds."""
+    limit = time.time() - appConfig.UPLOAD.EXPIRE
+    for path in UPLOAD_DIRECTORY.glob("*.part"):
+        try:
+            if path.stat().st_mtime < limit:
+                path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+@upload.route("/<upload_id>", methods=["GET"])
+def upload_status(upload_id):
+    """Return the offset to resume the upload from and the size of the chunks."""
+    offset = upload_size(upload_id)
+    remove_expired()
+    return jsonify(
+        {
+            "offset": offset,
+            "chunk_size": appConfig.UPLOAD.CHUNK_SIZE,
+            "max_size": appConfig.UPLOAD.MAX_SIZE,
+        }
+    )
+
+
+@upload.route("/<upload_id>", methods=["PUT"])
+def upload_chunk(upload_id):
+    """
+    Write a chunk (request body) at `offset` (query string) of the upload.
+
+    The chunk is streamed to the file, the upload is never held in memory.
+    An offset before the end overwrites the received bytes (a retried or
+    restarted transfer), an offset after the end is rejected with 409 and
+    the offset to resume from.
+    """
+    path = upload_path(upload_id)
+    received = upload_size(upload_id)
+    offset = request.args.get("offset", type=int)
+    length = request.content_length
+
+    if offset is None or offset < 0:
+        raise UploadError("Invalid offset.", received)
+    if offset > received:
+        raise UploadError("Offset after the received bytes.", received, status=409)
+    if length is None or length > appConfig.UPLOAD.CHUNK_SIZE:
+        raise UploadError("Invalid chunk size.", received, status=413)
+    if offset + length > appConfig.UPLOAD.MAX_SIZE:
+        raise UploadError("File is too large.", received, status=413)
+
+    UPLOAD_DIRECTORY.mkdir(mode=0o700, parents=True, exist_ok=True)
+    with os.fdopen(os.open(path, _OPEN_FLAGS, 0o600), "r+b") as file:
+        file.seek(offset)
+        while chunk := request.stream.read(1024 * 1024):
+            file.write(chunk)
+        file.truncate()
+        offset = file.tell()
+
+    return jsonify({"offset": offset})
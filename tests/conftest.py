@@ -0,0 +1,39 @@
+"""Shared fixtures of the tests, the modules of the app are imported from the root."""
+
+import sys
+from pathlib import Path
+import numpy as np
+import pandas as pd
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+SOURCES = ("scipy", "scipy", "gumbel", "scipy")
+
+
+@pytest.fixture
+def example_dataframe() -> pd.DataFrame:
+    """The bundled example dataset (annual maxima of a station)."""
+    return pd.read_csv(ROOT / "example_data.csv", index_col=0, parse_dates=True)
+
+
+@pytest.fixture
+def station_dataframe() -> pd.DataFrame:
+    """A positive annual series of 60 years in a single column."""
+    values = np.random.default_rng(42).gamma(4, 25, 60)
+    index = pd.date_range("1960", periods=60, freq="YS", name="DATE")
+    return pd.DataFrame({"STATION": values}, index=index)
+
+
+@pytest.fixture(scope="session")
+def dash_app():
+    """The app module, imported from the root without the warm start."""
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.chdir(ROOT)
+        from pyconfig import appConfig  # pylint: disable=import-outside-toplevel
+
+        monkeypatch.setattr(appConfig.RESULTS, "WARM_START", False)
+        import app  # pylint: disable=import-outside-toplevel
+
+        yield app
@@ -0,0 +1,62 @@
+"""Tests of the annual maximum extraction of raw (daily/hourly) series."""
+
+import io
+import numpy as np
+import pandas as pd
+import pytest
+import pyfunc
+
+
+@pytest.fixture
+def daily_dataframe() -> pd.DataFrame:
+    index = pd.date_range("1990-01-01", "1999-12-31", freq="D", name="DATE")
+    rng = np.random.default_rng(7)
+    dataframe = pd.DataFrame(
+        {"A": rng.gamma(0.5, 10, index.size), "B": rng.gamma(0.5, 20, index.size)},
+        index=index,
+    )
+    dataframe.iloc[100:400, 1] = np.nan
+    return dataframe
+
+
+def _expected_maximum(dataframe, start_month):
+    years = dataframe.index.year - (dataframe.index.month < start_month)
+    return dataframe.groupby(years).max().dropna(how="all")
+
+
+@pytest.mark.parametrize("start_month", [1, 10])
+@pytest.mark.parametrize("chunksize", [97, 100000])
+def test_annual_maximum_equals_groupby(daily_dataframe, start_month, chunksize):
+    text = daily_dataframe.to_csv()
+    result = pyfunc.read_annual_maximum(
+        io.StringIO(text), start_month=start_month, chunksize=chunksize
+    )
+    expected = _expected_maximum(
+        pd.read_csv(io.StringIO(text), index_col=0, parse_dates=True), start_month
+    )
+
+    np.testing.assert_array_equal(result.to_numpy(), expected.to_numpy())
+    assert result.index[0] == pd.Timestamp(
+        year=expected.index[0], month=start_month, day=1
+    )
+
+
+def test_single_column_is_indexed_by_date_of_maximum(daily_dataframe):
+    series = daily_dataframe["A"]
+    result = pyfunc.calc_annual_maximum([series.to_frame()])
+    expected = series.groupby(series.index.year).idxmax()
+    assert result.index.tolist() == expected.tolist()
+    assert result["A"].tolist() == series[expected].tolist()
+
+
+def test_invalid_dates_are_skipped():
+    chunk = pd.DataFrame(
+        {"A": [1.0, 5.0, 3.0]}, index=["2000-01-01", "x", "2000-02-01"]
+    )
+    result = pyfunc.calc_annual_maximum([chunk])
+    assert result["A"].tolist() == [3.0]
+
+
+def test_no_valid_dates_raises():
+    with pytest.raises(pd.errors.ParserError):
+        pyfunc.calc_annual_maximum([pd.DataFrame({"A": [1.0]}, index=["x"])])
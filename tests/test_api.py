@@ -0,0 +1,88 @@
+"""Tests of the JSON API."""
+
+import flask
+import numpy as np
+import pytest
+import pyapi
+import pyfunc
+from conftest import SOURCES
+
+
+@pytest.fixture
+def client():
+    server = flask.Flask(__name__)
+    server.register_blueprint(pyapi.api)
+    return server.test_client()
+
+
+@pytest.fixture
+def values(station_dataframe) -> list[float]:
+    return station_dataframe.iloc[:, 0].tolist()
+
+
+def _sources() -> dict:
+    return {
+        f"src_{dist}": source for dist, source in zip(pyfunc.DIST_NAME_LOWER, SOURCES)
+    }
+
+
+def test_frequency_of_json_series(client, values, station_dataframe):
+    response = client.post(
+        "/api/v1/frequency",
+        json={"series": {"STA": values}, "return_periods": [2, 10], **_sources()},
+    )
+    assert response.status_code == 200
+    expected = pyfunc.calc_freq_matrix(station_dataframe.iloc[:, 0], [2, 10], *SOURCES)
+    result = response.get_json()["results"]["STA"]
+    np.testing.assert_allclose([result[dist] for dist in pyfunc.DIST_NAME], expected.T)
+
+
+def test_goodness_of_fit_of_csv_body(client, station_dataframe):
+    response = client.post(
+        "/api/v1/goodness-of-fit?alpha=0.1",
+        data=station_dataframe.to_csv(),
+        content_type="text/csv",
+    )
+    assert response.status_code == 200
+    assert response.get_json()["alpha"] == 0.1
+    assert response.get_json()["results"]["STATION"]["N"] == 60
+
+
+@pytest.mark.filterwarnings("ignore::RuntimeWarning")
+def test_error_of_a_series_is_reported_in_its_result(client, values):
+    body = {"series": {"A": values, "B": [1]}}
+    response = client.post("/api/v1/statistics", json=body)
+    results = response.get_json()["results"]
+    assert response.status_code == 200
+    assert "DESCRIPTIVE" in results["A"]
+    assert "error" in results["B"]
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        [1, 2, 3],
+        {"series": [1, 2, 3]},
+        {"series": {}},
+        {"series": {"a": "1 2 3"}},
+        {"series": {"a": [[1], [2]]}},
+        {"series": {"a": [{"value": 1}]}},
+        {"series": {"a": {"values": [1, 2, 3], "dates": 5}}},
+        {"series": {"a": {"values": [1, 2], "dates": ["2000"]}}},
+        {"series": {"a": {"values": [1, 2], "dates": ["x", "2001"]}}},
+        {"series": {"a": [1, 2]}, "dates": [[2000], [2001]]},
+        {"series": {"a": [1, 2]}, "alpha": 2},
+        {"series": {"a": [1, 2]}, "src_gumbel": "unknown"},
+    ],
+)
+@pytest.mark.filterwarnings("ignore::UserWarning")
+def test_malformed_requests_return_400(client, body):
+    response = client.post("/api/v1/frequency", json=body)
+    assert response.status_code == 400
+    assert "error" in response.get_json()
+
+
+def test_too_many_series_return_400(client, monkeypatch):
+    monkeypatch.setattr(pyapi.appConfig.API, "MAX_SERIES", 1)
+    response = client.post("/api/v1/statistics", json={"series": {"a": [1], "b": [2]}})
+    assert response.status_code == 400
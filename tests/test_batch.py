@@ -0,0 +1,54 @@
+"""Tests of the multi-station batch mode."""
+
+import numpy as np
+import pandas as pd
+import pytest
+import pyfunc
+from conftest import SOURCES
+
+RETURN_PERIODS = [2, 10, 100]
+
+# the empty station is calculated with warnings before it fails
+pytestmark = pytest.mark.filterwarnings("ignore::RuntimeWarning")
+
+
+@pytest.fixture
+def stations() -> pd.DataFrame:
+    rng = np.random.default_rng(3)
+    index = pd.date_range("1970", periods=40, freq="YS", name="DATE")
+    return pd.DataFrame(
+        {f"STA{i}": rng.gamma(3, 20 * (i + 1), index.size) for i in range(3)}
+        | {"EMPTY": np.nan},
+        index=index,
+    )
+
+
+def _batch(stations, **kwargs):
+    return pyfunc.generate_batch_result(
+        stations, RETURN_PERIODS, 0.05, "scipy", "scipy", *SOURCES, **kwargs
+    )
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_batch_equals_station_summaries(stations, max_workers):
+    result = _batch(stations, max_workers=max_workers)
+    assert result.index.tolist() == stations.columns.tolist()
+    for column in stations.columns[:3]:
+        expected = pyfunc.calc_station_summary(
+            stations[column], RETURN_PERIODS, 0.05, "scipy", "scipy", *SOURCES
+        )
+        pd.testing.assert_series_equal(
+            result.loc[column], expected, check_names=False, check_index_type=False
+        )
+
+
+def test_failed_station_is_filled_with_nan(stations):
+    result = _batch(stations, max_workers=1)
+    assert result.loc["EMPTY"].isna().all()
+    assert result.loc["STA0"].notna().all()
+
+
+def test_progress_counts_every_station(stations):
+    calls = []
+    _batch(stations, max_workers=1, progress=lambda *args: calls.append(args))
+    assert calls == [(1, 4), (2, 4), (3, 4), (4, 4)]
@@ -0,0 +1,58 @@
+"""Tests of the bootstrap confidence intervals."""
+
+import numpy as np
+import pytest
+import pyfunc
+from conftest import SOURCES
+
+RETURN_PERIODS = [2, 10, 100]
+
+
+@pytest.fixture(autouse=True)
+def small_chunks(monkeypatch):
+    monkeypatch.setattr(pyfunc.appConfig.BOOTSTRAP, "CHUNK_SIZE", 40)
+
+
+def _bootstrap(series, **kwargs):
+    # the cache key does not include the workers
+    pyfunc._BOOTSTRAP_CACHE.clear()  # pylint: disable=protected-access
+    options = {"n_replicates": 100, "confidence": 0.9, "seed": 1, **kwargs}
+    return pyfunc.calc_freq_bootstrap(series, RETURN_PERIODS, *SOURCES, **options)
+
+
+@pytest.mark.parametrize("method", pyfunc.BOOTSTRAP_METHODS)
+def test_result_does_not_depend_on_workers(station_dataframe, method):
+    series = station_dataframe.iloc[:, 0]
+    serial = _bootstrap(series, method=method, max_workers=1)
+    parallel = _bootstrap(series, method=method, max_workers=2)
+    np.testing.assert_array_equal(serial, parallel)
+    assert serial.shape == (2, len(RETURN_PERIODS), 4)
+
+
+def test_result_depends_on_seed(station_dataframe):
+    series = station_dataframe.iloc[:, 0]
+    first = _bootstrap(series, max_workers=1)
+    assert np.array_equal(first, _bootstrap(series, max_workers=1))
+    assert not np.array_equal(first, _bootstrap(series, seed=2, max_workers=1))
+
+
+def test_interval_contains_design_values(station_dataframe):
+    series = station_dataframe.iloc[:, 0]
+    lower, upper = _bootstrap(series, n_replicates=400, max_workers=1)
+    design_values = pyfunc.calc_freq_matrix(series, RETURN_PERIODS, *SOURCES)
+    assert (lower <= upper).all()
+    assert ((lower <= design_values) & (design_values <= upper)).all()
+
+
+def test_samples_of_each_method():
+    rng = np.random.default_rng(0)
+    values = rng.gamma(4, 25, 30)
+    (samples,) = pyfunc.generate_bootstrap_samples(rng, values, 5, "nonparametric")
+    assert samples.shape == (5, 30)
+    assert np.isin(samples, values).all()
+
+    samples = pyfunc.generate_bootstrap_samples(rng, values, 5, "parametric")
+    assert [sample.shape for sample in samples] == [(5, 30)] * 4
+
+    with pytest.raises(ValueError):
+        pyfunc.generate_bootstrap_samples(rng, values, 5, "jackknife")
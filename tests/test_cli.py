@@ -0,0 +1,55 @@
+"""Tests of the command-line interface."""
+
+import pandas as pd
+import pytest
+import pycli
+import pyfunc
+from conftest import SOURCES
+
+
+@pytest.fixture
+def input_directory(tmp_path, station_dataframe):
+    directory = tmp_path / "data"
+    (directory / "north").mkdir(parents=True)
+    station_dataframe.to_csv(directory / "STA1.csv")
+    (station_dataframe * 2).to_csv(directory / "north" / "STA2.csv")
+    (directory / "BROKEN.csv").write_text("DATE,A\n")
+    return directory
+
+
+def test_find_input_files(input_directory):
+    files = pycli.find_input_files([str(input_directory)])
+    assert [path.name for _, path in files] == ["BROKEN.csv", "STA1.csv"]
+
+    files = pycli.find_input_files([str(input_directory)], recursive=True)
+    assert [path.name for _, path in files] == ["BROKEN.csv", "STA1.csv", "STA2.csv"]
+
+
+def test_main_writes_the_web_reports(input_directory, tmp_path):
+    output = tmp_path / "output"
+    argv = [str(input_directory), "-r", "-w", "1", "-o", str(output)]
+    assert pycli.main(argv) == 1  # BROKEN.csv has no data
+
+    station = output / "STA1"
+    assert sorted(path.name for path in station.iterdir()) == [
+        "CHI.csv",
+        "FIT.TXT",
+        "FREQUENCY.csv",
+        "KS.csv",
+        "STATOUT.TXT",
+    ]
+    assert (output / "north" / "STA2" / "FIT.TXT").exists()
+
+    dataframe = pycli.read_station_file(input_directory / "STA1.csv")
+    assert (station / "STATOUT.TXT").read_text() == pyfunc.generate_report_statout(
+        dataframe
+    )
+    frequency = pd.read_csv(station / "FREQUENCY.csv", index_col=0)
+    expected = pyfunc.generate_dataframe_freq(
+        dataframe, [2, 5, 10, 25, 50, 100], *SOURCES
+    )
+    pd.testing.assert_frame_equal(frequency, expected, check_names=False)
+
+
+def test_main_without_input_files(tmp_path):
+    assert pycli.main([str(tmp_path / "missing")]) == 1
@@ -0,0 +1,76 @@
+"""Tests of the Parquet and Arrow IPC upload and export."""
+
+import base64
+import io
+import numpy as np
+import pandas as pd
+import pytest
+import pyfunc
+from pyconfig import appConfig
+
+pytest.importorskip("pyarrow")
+
+
+@pytest.fixture
+def daily_dataframe():
+    """Three years of daily values of two stations."""
+    index = pd.date_range("2001-01-01", "2003-12-31", freq="D", name="DATE")
+    rng = np.random.default_rng(11)
+    return pd.DataFrame(
+        {"A": rng.gamma(2, 10, index.size), "B": rng.gamma(3, 5, index.size)},
+        index=index,
+    )
+
+
+@pytest.mark.parametrize("filename", ["data.parquet", "data.feather", "data.arrow"])
+def test_read_columnar_equals_dataframe(daily_dataframe, filename):
+    buffer = io.BytesIO()
+    if filename.endswith(".parquet"):
+        daily_dataframe.to_parquet(buffer)
+    else:
+        daily_dataframe.to_feather(buffer)
+
+    result = pyfunc.read_columnar(buffer.getvalue(), filename)
+    if filename.endswith(".parquet"):
+        pd.testing.assert_frame_equal(result, daily_dataframe, check_freq=False)
+    else:  # feather does not store the index, the date is the first column
+        pd.testing.assert_frame_equal(
+            result, daily_dataframe, check_freq=False, check_names=False
+        )
+
+
+def test_columnar_annual_maximum(daily_dataframe, monkeypatch):
+    monkeypatch.setattr(appConfig.INGEST, "CHUNKSIZE", 100)
+    buffer = io.BytesIO()
+    daily_dataframe.to_parquet(buffer)
+
+    result = pyfunc.read_columnar(buffer.getvalue(), "data.parquet", True, 4)
+    expected = pyfunc.calc_annual_maximum([daily_dataframe], start_month=4)
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_upload_file_is_memory_mapped(daily_dataframe, tmp_path):
+    path = tmp_path / "upload.part"
+    daily_dataframe.to_parquet(path)
+
+    message, dataframe = pyfunc.parse_upload_file(path, "GAUGES.PARQUET")
+    assert message is None
+    pd.testing.assert_frame_equal(dataframe, daily_dataframe, check_freq=False)
+
+
+def test_invalid_columnar_file(tmp_path):
+    path = tmp_path / "upload.part"
+    path.write_bytes(b"not a parquet file")
+
+    message, dataframe = pyfunc.parse_upload_file(path, "data.parquet")
+    assert dataframe is None
+    assert "not a valid Parquet/Arrow file" in str(message)
+
+
+def test_table_parquet_download(dash_app, station_dataframe):
+    dataset_key = dash_app.DATASET_STORE.put(station_dataframe)
+    download = dash_app.callback_download_table_parquet(1, dataset_key, "{STATION} > 0")
+
+    assert download["filename"] == "TABLE.parquet"
+    result = pd.read_parquet(io.BytesIO(base64.b64decode(download["content"])))
+    pd.testing.assert_frame_equal(result, station_dataframe, check_freq=False)
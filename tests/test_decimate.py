@@ -0,0 +1,76 @@
+"""Tests of the decimation of large series for the figures."""
+
+import numpy as np
+import pandas as pd
+import pytest
+import pydecimate
+
+
+@pytest.fixture
+def long_series():
+    """A daily series of 100 000 values with a flood and a drought."""
+    rng = np.random.default_rng(7)
+    index = pd.date_range("1900-01-01", periods=100_000, freq="D", name="DATE")
+    values = rng.gamma(2.0, 10.0, index.size)
+    values[12_345], values[54_321] = 5000.0, -5.0
+    return pd.Series(values, index=index, name="STATION")
+
+
+def test_minmax_keeps_extremes(long_series):
+    values = long_series.to_numpy()
+    positions = pydecimate.decimate_minmax(values, 1000)
+
+    assert positions.size <= 1000
+    assert np.all(np.diff(positions) > 0)
+    assert {12_345, 54_321} <= set(positions.tolist())
+
+
+def test_minmax_short_series_is_unchanged():
+    assert pydecimate.decimate_minmax(np.arange(5.0), 10).tolist() == [0, 1, 2, 3, 4]
+
+
+def test_lttb_keeps_endpoints(long_series):
+    x = long_series.index.to_numpy().astype("int64")
+    positions = pydecimate.decimate_lttb(x, long_series.to_numpy(), 500)
+
+    assert positions.size == 500
+    assert (positions[0], positions[-1]) == (0, long_series.size - 1)
+    assert np.all(np.diff(positions) > 0)
+
+
+def test_pyramid_view_within_budget(long_series):
+    pyramid = pydecimate.ResolutionPyramid(long_series, budget=1000, factor=4)
+    assert pyramid.levels[-1].size <= 1000
+
+    overview = pyramid.select()
+    assert overview.size <= 1000
+    assert overview.index.is_monotonic_increasing
+    assert overview.max() == long_series.max()
+
+    zoom = pyramid.select("1950-01-01", "1950-06-30")
+    pd.testing.assert_series_equal(zoom, long_series["1949-12-31":"1950-07-01"])
+
+
+def test_large_data_threshold(long_series, station_dataframe):
+    assert pydecimate.is_large(long_series.to_frame())
+    assert not pydecimate.is_large(station_dataframe)
+
+
+@pytest.mark.parametrize(
+    "relayout_data, axes, expected",
+    [
+        (None, None, None),
+        ({"xaxis.range[0]": "2000", "xaxis.range[1]": "2001"}, None, ("2000", "2001")),
+        ({"xaxis2.range": ["2000", "2001"]}, None, ("2000", "2001")),
+        ({"xaxis2.range": ["2000", "2001"]}, ("xaxis",), None),
+        ({"xaxis.autorange": True}, ("xaxis",), (None, None)),
+        ({"yaxis.range[0]": 0, "yaxis.range[1]": 1}, None, None),
+    ],
+)
+def test_parse_relayout_range(relayout_data, axes, expected):
+    assert pydecimate.parse_relayout_range(relayout_data, axes) == expected
+
+
+def test_pyramid_is_cached(long_series):
+    pyramid = pydecimate.get_pyramid("test-decimate", long_series)
+    assert pydecimate.get_pyramid("test-decimate", long_series) is pyramid
@@ -0,0 +1,105 @@
+"""Tests of the streamed Excel ingest."""
+
+import io
+from datetime import datetime
+import numpy as np
+import pandas as pd
+import pytest
+import pyfunc
+
+openpyxl = pytest.importorskip("openpyxl")
+
+ROWS = [
+    ("DATE", "R24", "NOTE", "R48"),
+    (datetime(2001, 1, 1), 10.5, "ok", 20),
+    (None, None, None, None),
+    (datetime(2001, 1, 2), "-", "missing", 25),
+    (datetime(2001, 1, 3), 0, None, 30.25),
+]
+
+
+@pytest.fixture
+def workbook() -> bytes:
+    """A workbook with the data on the second worksheet."""
+    book = openpyxl.Workbook()
+    book.active.title = "INFO"
+    book.active.append(["Station data of the field office."])
+    sheet = book.create_sheet("DATA")
+    for row in ROWS:
+        sheet.append(row)
+    buffer = io.BytesIO()
+    book.save(buffer)
+    return buffer.getvalue()
+
+
+def _expected(columns) -> pd.DataFrame:
+    index = pd.DatetimeIndex(["2001-01-01", "2001-01-02", "2001-01-03"], name="DATE")
+    data = {"R24": [10.5, np.nan, 0.0], "NOTE": [np.nan] * 3, "R48": [20, 25, 30.25]}
+    return pd.DataFrame({column: data[column] for column in columns}, index=index)
+
+
+@pytest.mark.parametrize("chunksize", [1, 2, 100])
+def test_read_selected_columns(workbook, chunksize):
+    result = pyfunc.read_excel(
+        workbook,
+        "data.xlsx",
+        sheet="DATA",
+        value_columns=["R48", "R24"],
+        chunksize=chunksize,
+    )
+    pd.testing.assert_frame_equal(result, _expected(["R48", "R24"]))
+
+
+def test_read_all_columns(workbook):
+    result = pyfunc.read_excel(workbook, "data.xlsx", sheet="DATA")
+    pd.testing.assert_frame_equal(result, _expected(["R24", "NOTE", "R48"]))
+
+
+@pytest.mark.parametrize(
+    "options, message",
+    [
+        ({"sheet": "MISSING"}, "Sheet 'MISSING' not found"),
+        ({"sheet": "DATA", "value_columns": ["R72"]}, "Column 'R72' not found"),
+        ({"sheet": "DATA", "date_column": "TANGGAL"}, "Column 'TANGGAL' not found"),
+        ({}, "no value columns"),
+    ],
+)
+def test_invalid_selection(workbook, options, message):
+    with pytest.raises(ValueError, match=message):
+        pyfunc.read_excel(workbook, "data.xlsx", **options)
+
+
+def test_invalid_workbook():
+    with pytest.raises(ValueError):
+        pyfunc.read_excel(b"not a workbook", "data.xlsx")
+
+
+def test_upload_with_options(workbook, tmp_path):
+    path = tmp_path / "upload.part"
+    path.write_bytes(workbook)
+
+    message, dataframe = pyfunc.parse_upload_file(
+        path, "DATA.XLSX", sheet="DATA", value_columns=["R24"]
+    )
+    assert message is None
+    pd.testing.assert_frame_equal(dataframe, _expected(["R24"]))
+
+
+def test_read_xls():
+    xlwt = pytest.importorskip("xlwt")
+    pytest.importorskip("xlrd")
+
+    book = xlwt.Workbook()
+    sheet = book.add_sheet("DATA")
+    date_style = xlwt.easyxf(num_format_str="YYYY-MM-DD")
+    for position, row in enumerate(ROWS):
+        for column, value in enumerate(row):
+            if isinstance(value, datetime):
+                sheet.write(position, column, value, date_style)
+            elif value is not None:
+                sheet.write(position, column, value)
+    buffer = io.BytesIO()
+    book.save(buffer)
+
+    result = pyfunc.read_excel(buffer.getvalue(), "data.xls", value_columns=["R24"])
+    pd.testing.assert_frame_equal(result, _expected(["R24"]))
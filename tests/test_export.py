@@ -0,0 +1,104 @@
+"""Tests of the streamed ZIP archive of the reports."""
+
+import io
+import json
+import zipfile
+import diskcache
+import pytest
+import pyexport
+import pyjobs
+import pyresults
+from conftest import SOURCES
+
+
+def _read_zip(chunks) -> zipfile.ZipFile:
+    return zipfile.ZipFile(io.BytesIO(b"".join(chunks)))
+
+
+def test_stream_zip_writes_entries_in_order():
+    def fail():
+        raise ValueError("no data")
+
+    entries = [
+        ("a.txt", "text"),
+        ("b.bin", b"\x00\x01"),
+        ("c.csv", lambda: "x,y"),
+        ("d.csv", fail),
+    ]
+    chunks = list(pyexport.stream_zip(entries))
+    archive = _read_zip(chunks)
+
+    assert len(chunks) == 5
+    assert archive.namelist() == ["a.txt", "b.bin", "c.csv", "d.csv.ERROR.TXT"]
+    assert archive.read("b.bin") == b"\x00\x01"
+    assert archive.read("c.csv") == b"x,y"
+    assert archive.read("d.csv.ERROR.TXT") == b"ValueError: no data"
+
+
+def test_stream_zip_raises_unexpected_errors():
+    def fail():
+        raise RuntimeError("bug")
+
+    with pytest.raises(RuntimeError):
+        list(pyexport.stream_zip([("a.txt", fail)]))
+
+
+def test_station_directories_are_unique():
+    directories = pyexport.station_directories(
+        ["A/B", "a_b", " .hidden. ", "..", "TABLE.csv", "A_B_2"],
+        reserved=("manifest.json", "TABLE.csv"),
+    )
+    assert directories == ["A_B", "a_b_2", "hidden", "_", "TABLE.csv_2", "A_B_2_2"]
+
+
+def test_station_entries(station_dataframe):
+    entries = dict(
+        pyexport.generate_station_entries(
+            station_dataframe.STATION,
+            [2, 10],
+            0.05,
+            "scipy",
+            "scipy",
+            *SOURCES,
+            directory="S1",
+        )
+    )
+    assert list(entries) == [
+        f"S1/{name}"
+        for name in ("STATOUT.TXT", "FREQUENCY.csv", "KS.csv", "CHI.csv", "FIT.TXT")
+    ]
+    assert entries["S1/FREQUENCY.csv"]().startswith("Return Period")
+
+
+@pytest.fixture
+def client(dash_app, tmp_path, monkeypatch):
+    """A test client of the server, the results and jobs are in tmp_path."""
+    cache = diskcache.Cache(tmp_path / "results")
+    monkeypatch.setattr(pyresults, "RESULTS", cache)
+    monkeypatch.setattr(pyresults, "LOCK_DIRECTORY", tmp_path / "locks")
+    monkeypatch.setattr(pyjobs, "JOBS_DIRECTORY", tmp_path / "jobs")
+    yield dash_app.server.test_client()
+    cache.close()
+
+
+def test_batch_archive_layout(dash_app, client, station_dataframe):
+    dataframe = station_dataframe.assign(**{"s/1": station_dataframe.STATION * 2})
+    dataframe = dataframe.rename(columns={"STATION": "S_1"})
+    dataset_key = dash_app.DATASET_STORE.put(dataframe)
+
+    response = client.get(f"/download/{dataset_key}.zip?mode=batch")
+    archive = _read_zip([response.data])
+    names = archive.namelist()
+
+    assert response.status_code == 200
+    assert names[:2] == ["manifest.json", "TABLE.csv"]
+    assert names[-1] == "BATCH.csv"
+    assert {name.split("/")[0] for name in names[2:-1]} == {"S_1", "s_1_2"}
+    assert not any(name.endswith(".ERROR.TXT") for name in names)
+
+    manifest = json.loads(archive.read("manifest.json"))
+    assert (manifest["mode"], manifest["stations"]) == ("batch", ["S_1", "s/1"])
+
+
+def test_archive_of_missing_dataset(client):
+    assert client.get(f"/download/{'0' * 32}.zip").status_code == 404
@@ -0,0 +1,82 @@
+"""Tests of the figure cache (JSON in memory and on disk)."""
+
+import diskcache
+import plotly.graph_objects as go
+import pytest
+import pycache
+import pyresults
+
+
+@pytest.fixture(autouse=True)
+def results(tmp_path, monkeypatch):
+    """Empty figure storages in tmp_path and memory."""
+    cache = diskcache.Cache(tmp_path / "results")
+    monkeypatch.setattr(pyresults, "RESULTS", cache)
+    monkeypatch.setattr(
+        pyresults,
+        "FIGURES",
+        pycache.LRUCache(maxsize=4, maxbytes=10_000, sizeof=lambda entry: entry[0]),
+    )
+    monkeypatch.setattr(pyresults, "LOCK_DIRECTORY", tmp_path / "locks")
+    yield cache
+    cache.close()
+
+
+def _counting_figure(calls, points=3):
+    def compute():
+        calls.append(1)
+        return go.Figure(go.Scatter(x=list(range(points)), y=list(range(points))))
+
+    return compute
+
+
+def test_figure_is_built_once():
+    calls = []
+    compute = _counting_figure(calls)
+
+    first = pyresults.get_or_compute_figure("figure", compute, "dataset", None)
+    assert pyresults.get_or_compute_figure("figure", compute, "dataset", None) is first
+
+    # another worker: the JSON is read from disk, the figure is not built
+    pyresults.FIGURES.clear()
+    assert pyresults.get_or_compute_figure("figure", compute, "dataset", None) == first
+
+    assert len(calls) == 1
+    assert first["data"][0]["x"] == [0, 1, 2]
+
+
+def test_figure_key_depends_on_options():
+    calls = []
+    compute = _counting_figure(calls)
+
+    pyresults.get_or_compute_figure("figure", compute, "dataset", None, 0.05)
+    pyresults.get_or_compute_figure("figure", compute, "dataset", None, 0.1)
+    pyresults.get_or_compute_figure("figure", compute, "other", None, 0.05)
+
+    assert len(calls) == 3
+
+
+def test_memory_is_bounded_by_json_size():
+    small = pyresults.get_or_compute_figure("small", _counting_figure([]), "dataset")
+    pyresults.get_or_compute_figure("large", _counting_figure([], 2000), "dataset")
+
+    assert len(pyresults.FIGURES) == 1
+    assert pyresults.FIGURES.nbytes <= 10_000
+    # the large figure is kept on disk only
+    calls = []
+    pyresults.get_or_compute_figure("large", _counting_figure(calls, 2000), "dataset")
+    assert not calls
+    assert small["data"]
+
+
+def test_figure_of_previous_version_is_built_again(results):
+    key = pyresults.make_result_key("figure", "dataset")
+    results.set(key, go.Figure())
+
+    calls = []
+    compute = _counting_figure(calls)
+    figure = pyresults.get_or_compute_figure("figure", compute, "dataset")
+
+    assert len(calls) == 1
+    assert isinstance(results.get(key), bytes)
+    assert figure["data"]
@@ -0,0 +1,72 @@
+"""Tests of the goodness of fit figures of long series."""
+
+import numpy as np
+import pandas as pd
+import pytest
+import pyfigure
+import pyfunc
+from pyconfig import appConfig
+from conftest import SOURCES
+
+BUDGET = 50
+
+
+@pytest.fixture
+def small_budget(monkeypatch):
+    """A point budget smaller than the long series."""
+    monkeypatch.setattr(appConfig.VIZ, "POINT_BUDGET", BUDGET)
+    monkeypatch.setattr(appConfig.VIZ, "RANK_LABEL_THRESHOLD", 100)
+
+
+@pytest.fixture
+def long_dataframe():
+    """300 yearly values."""
+    rng = np.random.default_rng(3)
+    index = pd.date_range("1700-01-01", periods=300, freq="YS", name="DATE")
+    return pd.DataFrame({"STATION": rng.gamma(2.0, 30.0, index.size)}, index=index)
+
+
+def _figure(generate, dataframe):
+    return generate(dataframe, 0.05, "scipy", "scipy", *SOURCES)
+
+
+@pytest.mark.usefixtures("small_budget")
+@pytest.mark.parametrize(
+    "generate",
+    [pyfigure.generate_goodness_fit_viz, pyfigure.generate_goodness_fit_critical],
+)
+def test_traces_within_point_budget(generate, long_dataframe):
+    fig = _figure(generate, long_dataframe)
+    for trace in fig.data:
+        points = trace.y if trace.x is None else trace.x
+        assert len(points) <= BUDGET, trace.name
+
+
+@pytest.mark.usefixtures("small_budget")
+def test_rank_bar_is_grouped(long_dataframe):
+    fig = _figure(pyfigure.generate_goodness_fit_viz, long_dataframe)
+    bar = fig.data[0]
+
+    assert bar.customdata[0].tolist() == [1, 6]
+    assert bar.customdata[-1].tolist() == [295, 300]
+    assert max(bar.x) == long_dataframe.STATION.max()
+    assert not any(str(text).startswith("$") for text in fig.layout.yaxis.ticktext)
+
+
+@pytest.mark.usefixtures("small_budget")
+def test_thinned_ks_keeps_delta_max(long_dataframe):
+    ks_result, _ = pyfunc.calc_goodness_fit(
+        long_dataframe, 0.05, "scipy", "scipy", *SOURCES
+    )
+    for ksdf in ks_result.values():
+        thinned = pyfigure._thin_ks(ksdf)
+        assert len(thinned) <= BUDGET
+        assert thinned.d.max() == ksdf.d.max()
+
+
+def test_short_series_keeps_latex_labels(station_dataframe):
+    fig = _figure(pyfigure.generate_goodness_fit_viz, station_dataframe)
+    bar = fig.data[0]
+
+    assert len(bar.y) == len(station_dataframe)
+    assert bar.y[-1] == "$R_{1}$"
@@ -0,0 +1,70 @@
+"""Tests of the vectorized frequency analysis against hidrokit."""
+
+import itertools
+import numpy as np
+import pytest
+from hidrokit.contrib.taruma import gumbel, lognormal, logpearson3, normal
+import pyfunc
+from pyapi import SOURCE_CHOICES
+from conftest import SOURCES
+
+RETURN_PERIODS = [2, 5, 10, 20, 25, 50, 100, 200, 1000]
+
+HIDROKIT_FREQ = (
+    normal.freq_normal,
+    lognormal.freq_lognormal,
+    gumbel.freq_gumbel,
+    logpearson3.freq_logpearson3,
+)
+
+
+def _hidrokit_matrix(dataframe, sources):
+    return np.column_stack(
+        [
+            freq(dataframe, return_periods=RETURN_PERIODS, source=source).iloc[:, 0]
+            for freq, source in zip(HIDROKIT_FREQ, sources)
+        ]
+    )
+
+
+@pytest.mark.parametrize(
+    "sources",
+    list(
+        itertools.product(
+            *[SOURCE_CHOICES[f"src_{dist}"] for dist in pyfunc.DIST_NAME_LOWER]
+        )
+    ),
+)
+def test_freq_matrix_equals_hidrokit(station_dataframe, sources):
+    series = station_dataframe.iloc[:, 0]
+    try:
+        expected = _hidrokit_matrix(station_dataframe, sources)
+    except ValueError:  # a source that hidrokit does not support (yet)
+        with pytest.raises(ValueError):
+            pyfunc.calc_freq_matrix(series, RETURN_PERIODS, *sources)
+        return
+
+    result = pyfunc.calc_freq_matrix(series, RETURN_PERIODS, *sources)
+    np.testing.assert_allclose(result, expected, rtol=1e-10)
+
+
+def test_freq_matrices_equal_freq_matrix_per_row(station_dataframe):
+    values = station_dataframe.iloc[:, 0].to_numpy()
+    samples = np.stack([values, values[::-1] * 2, np.sqrt(values)])
+    result = pyfunc.calc_freq_matrices(samples, RETURN_PERIODS, *SOURCES)
+    for row, sample in zip(result, samples):
+        np.testing.assert_allclose(
+            row, pyfunc.calc_freq_matrix(sample, RETURN_PERIODS, *SOURCES)
+        )
+
+
+def test_dataframe_freq_ignores_zero_and_missing(station_dataframe):
+    dataframe = station_dataframe.copy()
+    dataframe.iloc[[3, 7], 0] = [0, np.nan]
+    freq = pyfunc.generate_dataframe_freq(dataframe, RETURN_PERIODS, *SOURCES)
+    expected = pyfunc.calc_freq_matrix(
+        dataframe.iloc[:, 0].drop(dataframe.index[[3, 7]]), RETURN_PERIODS, *SOURCES
+    )
+    assert freq.columns.tolist() == pyfunc.DIST_NAME
+    assert freq.index.tolist() == RETURN_PERIODS
+    np.testing.assert_allclose(freq.to_numpy(), expected)
@@ -0,0 +1,55 @@
+"""Tests of the shared goodness of fit calculation (KS and Chi-Square)."""
+
+import numpy as np
+import pandas as pd
+from hidrokit.contrib.taruma import chi_square, kolmogorov_smirnov
+import pyfunc
+from conftest import SOURCES
+
+
+def _goodness_fit(dataframe, alpha=0.05):
+    return pyfunc.calc_goodness_fit(dataframe, alpha, "scipy", "scipy", *SOURCES)
+
+
+def test_goodness_fit_is_calculated_once(station_dataframe):
+    first = _goodness_fit(station_dataframe)
+    assert _goodness_fit(station_dataframe.copy()) is first
+
+
+def test_goodness_fit_depends_on_options(station_dataframe):
+    assert _goodness_fit(station_dataframe, 0.1) is not _goodness_fit(station_dataframe)
+
+
+def test_goodness_fit_equals_hidrokit(station_dataframe):
+    ks_result, chi_result = _goodness_fit(station_dataframe)
+    for dist, source in zip(pyfunc.DIST_NAME_LOWER, SOURCES):
+        expected_ks = kolmogorov_smirnov.kolmogorov_smirnov_test(
+            station_dataframe,
+            distribution=dist,
+            distribution_source=source,
+            significance_level=0.05,
+            critical_value_source="scipy",
+            display_stat=False,
+            report_type="full",
+        )
+        pd.testing.assert_frame_equal(ks_result[dist], expected_ks)
+
+        expected_chi = chi_square.chi_square_test(
+            station_dataframe,
+            distribution=dist,
+            distribution_source=source,
+            significance_level=0.05,
+            critical_value_source="scipy",
+            display_stat=False,
+        )
+        np.testing.assert_array_equal(chi_result[dist].fe, expected_chi.fe)
+
+
+def test_report_fit_shares_the_calculation(station_dataframe):
+    ks_frame, chi_frame, report = pyfunc.generate_report_fit(
+        station_dataframe, 0.05, "scipy", "scipy", *SOURCES
+    )
+    ks_result, _ = _goodness_fit(station_dataframe)
+    assert ks_frame["Normal"].equals(ks_result["normal"])
+    assert chi_frame.columns.get_level_values(0).unique().tolist() == pyfunc.DIST_NAME
+    assert f"DELTA_NORMAL = {ks_result['normal'].d.max()}" in report
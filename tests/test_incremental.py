@@ -0,0 +1,98 @@
+"""Tests of the incremental statistics and the stored edits."""
+
+import numpy as np
+import pandas as pd
+import pytest
+import pyfunc
+import pystats
+import pystore
+from conftest import SOURCES
+
+RETURN_PERIODS = [2, 10, 100]
+
+
+@pytest.fixture
+def edited(station_dataframe):
+    """The statistics of the station after edits, and the edited series."""
+    series = station_dataframe.iloc[:, 0].copy()
+    stats = pystats.IncrementalStats(series)
+    for row, value in [(3, 0.0), (10, np.nan), (20, 1.5), (3, 250.0), (30, 2.0)]:
+        stats.update(series.iat[row], value)
+        series.iat[row] = value
+    return stats, series
+
+
+def test_moments_equal_full_calculation(edited):
+    stats, series = edited
+    expected = pyfunc.calc_moments(series)
+    np.testing.assert_allclose(stats.moments(), expected, rtol=1e-9)
+
+    expected = pyfunc.calc_moments(series.replace(0, np.nan))
+    np.testing.assert_allclose(stats.moments(nonzero=True), expected, rtol=1e-9)
+
+
+def test_summary_equals_station_summary(edited):
+    stats, series = edited
+    summary = stats.summary(RETURN_PERIODS, 0.05, "scipy", *SOURCES)
+    expected = pyfunc.calc_station_summary(
+        series, RETURN_PERIODS, 0.05, "scipy", "scipy", *SOURCES
+    )
+    pd.testing.assert_series_equal(
+        summary, expected[summary.index], check_names=False, rtol=1e-9
+    )
+
+
+def test_rank_and_probability(station_dataframe):
+    stats = pystats.IncrementalStats(station_dataframe.iloc[:, 0])
+    largest = station_dataframe.iloc[:, 0].max()
+    assert stats.rank(largest) == 60
+    assert stats.empirical_probability(largest) == 60 / 61
+
+
+def test_reverted_typo_rebuilds_the_sums(station_dataframe):
+    series = station_dataframe.iloc[:, 0]
+    stats = pystats.IncrementalStats(series)
+    stats.update(series.iat[0], 1e7)
+    stats.update(1e7, series.iat[0])
+
+    assert stats.values.is_accurate()
+    assert stats.moments().ck == pytest.approx(pyfunc.calc_moments(series).ck)
+
+
+def test_power_sums_detect_cancellation():
+    sums = pystats.PowerSums([1.0, 2.0, 3.0, 4.0])
+    sums.add(1e7)
+    assert sums.is_accurate()
+    sums.remove(1e7)
+    assert not sums.is_accurate()
+
+
+def test_apply_edits_moves_the_statistics(tmp_path, station_dataframe):
+    store = pystore.DatasetStore(tmp_path)
+    key = store.put(station_dataframe)
+    stats = pystats.get_stats(key, station_dataframe.iloc[:, 0])
+
+    edits = [{"row": 0, "column": "STATION", "value": "5"}]
+    new_key = store.apply_edits(key, edits)
+    pystats.apply_edits(key, new_key, station_dataframe, edits)
+
+    edited = store.get(new_key)
+    assert edited.iat[0, 0] == 5.0
+    assert pystats.get_stats(new_key, edited.iloc[:, 0]) is stats
+    assert stats.moments().mean == pytest.approx(edited.iloc[:, 0].mean())
+
+
+def test_edits_are_stored_as_delta(tmp_path, station_dataframe):
+    store = pystore.DatasetStore(tmp_path)
+    key = store.put(station_dataframe)
+    first = store.apply_edits(key, [{"row": 1, "column": "STATION", "value": "7"}])
+    second = store.apply_edits(first, [{"row": 2, "column": "STATION", "value": "x"}])
+
+    assert pystore.is_dataset_key(second)
+    assert store.apply_edits(second, [{"row": 99, "column": "STATION"}]) == second
+    assert len(list(tmp_path.glob("*.delta.pkl"))) == 2
+
+    expected = station_dataframe.copy()
+    expected.iloc[[1, 2], 0] = [7.0, np.nan]
+    pd.testing.assert_frame_equal(pystore.DatasetStore(tmp_path).get(second), expected)
+    pd.testing.assert_frame_equal(store.get(key), station_dataframe)
@@ -0,0 +1,63 @@
+"""Tests of the concurrency limit of the background jobs."""
+
+import threading
+import time
+import pytest
+import pyjobs
+
+pytestmark = pytest.mark.skipif(pyjobs.fcntl is None, reason="requires fcntl")
+
+
+@pytest.fixture(autouse=True)
+def jobs_directory(tmp_path, monkeypatch):
+    monkeypatch.setattr(pyjobs, "JOBS_DIRECTORY", tmp_path)
+    return tmp_path
+
+
+def test_job_slots_limit_concurrent_jobs(jobs_directory):
+    running, peak = [0], [0]
+    lock = threading.Lock()
+
+    def job():
+        for _ in range(10):
+            with pyjobs.job_slot(max_jobs=2, poll_interval=0.001, owner=1):
+                with lock:
+                    running[0] += 1
+                    peak[0] = max(peak[0], running[0])
+                time.sleep(0.002)
+                with lock:
+                    running[0] -= 1
+
+    threads = [threading.Thread(target=job) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert peak[0] == 2
+    assert not list(jobs_directory.glob("slot-*.lock"))
+
+
+def test_waiting_job_reports_progress_once():
+    progress = []
+    release = threading.Event()
+
+    def holder():
+        with pyjobs.job_slot(max_jobs=1, owner=1):
+            release.wait()
+
+    thread = threading.Thread(target=holder)
+    thread.start()
+    time.sleep(0.05)
+    threading.Timer(0.05, release.set).start()
+    with pyjobs.job_slot(progress.append, max_jobs=1, poll_interval=0.01, owner=1):
+        pass
+    thread.join()
+
+    assert progress == [(0, "WAITING...")]
+
+
+def test_slots_are_per_owner():
+    with pyjobs.job_slot(max_jobs=1, owner=1):
+        with pyjobs.job_slot(max_jobs=1, poll_interval=60, owner=2):
+            pass
@@ -0,0 +1,61 @@
+"""Tests of the single-pass moments kernel."""
+
+import numpy as np
+import pandas as pd
+import pytest
+from hidrokit.contrib.taruma import outlier_hydrology, statistical_coefficients
+import pyfunc
+
+DESCRIBE = {
+    "mean": "mean",
+    "std": "std",
+    "min": "min",
+    "p25": "25%",
+    "p50": "50%",
+    "p75": "75%",
+    "max": "max",
+}
+
+
+def test_moments_equal_pandas_and_hidrokit(station_dataframe):
+    series = station_dataframe.iloc[:, 0]
+    moments = pyfunc.calc_moments(series)
+    describe = series.describe()
+
+    assert moments.count == describe["count"]
+    for name, key in DESCRIBE.items():
+        assert getattr(moments, name) == pytest.approx(describe[key], rel=1e-12)
+    assert moments.std0 == pytest.approx(series.std(ddof=0), rel=1e-12)
+    np.testing.assert_allclose(
+        [moments.cv, moments.cs, moments.ck],
+        statistical_coefficients.calc_coef(series),
+        rtol=1e-12,
+    )
+    np.testing.assert_allclose(
+        pyfunc.calc_outlier_boundary(moments),
+        outlier_hydrology.calc_boundary(station_dataframe),
+        rtol=1e-12,
+    )
+
+
+def test_missing_values_are_ignored(station_dataframe):
+    series = station_dataframe.iloc[:, 0]
+    with_missing = pd.concat([series, pd.Series([np.nan, np.nan])])
+    assert pyfunc.calc_moments(with_missing) == pyfunc.calc_moments(series)
+
+
+def test_log_statistics_use_positive_values():
+    moments = pyfunc.calc_moments(pd.Series([0.0, -1.0, 10.0, 100.0, 1000.0]))
+    assert moments.count == 5
+    assert moments.count_log == 3
+    assert moments.mean_log == pytest.approx(2.0)
+    assert moments.std_log == pytest.approx(1.0)
+
+
+def test_statout_notes_missing_and_excluded_values(station_dataframe):
+    assert "NOTE" not in pyfunc.calc_statout(station_dataframe)
+
+    dataframe = station_dataframe.copy()
+    dataframe.iloc[[1, 2], 0] = [np.nan, 0.0]
+    note = pyfunc.calc_statout(dataframe)["NOTE"]
+    assert note == {"MISSING_IGNORED": 1, "NOT_POSITIVE_EXCLUDED_FROM_LOG": 1}
@@ -0,0 +1,94 @@
+"""Tests of the partial updates of the frequency analysis."""
+
+import copy
+import diskcache
+import numpy as np
+import pytest
+import pyfunc
+import pylayoutfunc
+import pyresults
+
+FREQ_OPTIONS = ["2 5 10 25 50 100", "scipy", "scipy", "gumbel", "scipy", "none", 0, 0]
+
+
+@pytest.fixture
+def dataset_key(dash_app, station_dataframe, tmp_path, monkeypatch):
+    """The station stored in the app, the results are in tmp_path."""
+    cache = diskcache.Cache(tmp_path / "results")
+    monkeypatch.setattr(pyresults, "RESULTS", cache)
+    monkeypatch.setattr(pyresults, "LOCK_DIRECTORY", tmp_path / "locks")
+    yield dash_app.DATASET_STORE.put(station_dataframe)
+    cache.close()
+
+
+def _options(dataset_key, **sources):
+    options = [dataset_key, None, *FREQ_OPTIONS]
+    for position, dist in enumerate(pyfunc.DIST_NAME_LOWER, start=3):
+        options[position] = sources.get(dist, options[position])
+    return options
+
+
+def _apply_patch(data, patch):
+    """Apply the assignments of a Patch to the (JSON) data."""
+    for operation in patch.to_plotly_json()["operations"]:
+        assert operation["operation"] == "Assign"
+        *location, last = operation["location"]
+        target = data
+        for key in location:
+            target = target[key]
+        target[last] = operation["params"]["value"]
+    return data
+
+
+@pytest.mark.parametrize(
+    "previous, changed",
+    [
+        (None, None),
+        ({}, [3]),
+        ({"normal": "soewarno", "logpearson3": "limantara"}, [0, 3]),
+    ],
+)
+def test_changed_sources(dash_app, previous, changed):
+    options = _options("key", logpearson3="soetopo")
+    if previous is not None:
+        previous = _options("key", **previous)
+    assert dash_app._changed_sources(previous, options) == changed
+
+
+def test_other_options_are_not_patched(dash_app):
+    options = _options("key")
+    assert dash_app._changed_sources(options, options) == []
+    for position in (0, 1, 2, 8):
+        previous = list(options)
+        previous[position] = "changed"
+        assert dash_app._changed_sources(previous, options) is None
+
+
+def _children(dash_app, options):
+    # the stored figure is shared, the patch is applied to a copy
+    figure = copy.deepcopy(dash_app._figure_freq(*options))
+    result = dash_app._result_freq(*options)
+    table = pylayoutfunc.create_freq_table_layout(result[pyfunc.DIST_NAME], "table")
+    return [{"props": {"figure": figure}}, {"props": {"data": table.data}}]
+
+
+def test_patch_equals_new_figure(dash_app, dataset_key):
+    previous = _options(dataset_key)
+    options = _options(dataset_key, gumbel="powell", logpearson3="soetopo")
+    changed = dash_app._changed_sources(previous, options)
+
+    children = _children(dash_app, previous)
+    assert children[1] != _children(dash_app, options)[1]
+    patch = dash_app._patch_freq(dash_app._result_freq(*options), changed)
+    patched = _apply_patch(children, patch)
+    expected = _children(dash_app, options)
+
+    assert len(patch.to_plotly_json()["operations"]) == 3 * len(changed)
+    assert patched[1]["props"]["data"] == expected[1]["props"]["data"]
+    for trace, expected_trace in zip(
+        patched[0]["props"]["figure"]["data"], expected[0]["props"]["figure"]["data"]
+    ):
+        np.testing.assert_allclose(
+            np.asarray(trace["y"], dtype=float),
+            np.asarray(expected_trace["y"], dtype=float),
+        )
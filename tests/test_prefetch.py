@@ -0,0 +1,67 @@
+"""Tests of the prefetching of the next tab."""
+
+import logging
+import threading
+import pytest
+from dash.exceptions import PreventUpdate
+import pyjobs
+
+
+@pytest.fixture
+def prefetch_slot(dash_app, monkeypatch, tmp_path):
+    """A single free prefetch slot of the app, the job slots are in tmp_path."""
+    monkeypatch.setattr(pyjobs, "JOBS_DIRECTORY", tmp_path)
+    slot = threading.BoundedSemaphore(1)
+    monkeypatch.setattr(dash_app, "_PREFETCH_SLOTS", slot)
+    return slot
+
+
+def test_compute_all_stops_at_error(dash_app, caplog):
+    calls = []
+
+    def fail():
+        calls.append("fail")
+        raise ValueError("bad data")
+
+    with caplog.at_level(logging.ERROR, logger=dash_app.app.logger.name):
+        dash_app._compute_all([lambda: calls.append("first"), fail, calls.clear])
+
+    assert calls == ["first", "fail"]
+    assert "Prefetching is stopped." in caplog.text
+
+
+def test_compute_all_stops_when_dataset_is_removed(dash_app, caplog):
+    def removed():
+        raise PreventUpdate
+
+    calls = []
+    dash_app._compute_all([removed, lambda: calls.append("next")])
+
+    assert not calls
+    assert not caplog.records
+
+
+def test_compute_all_raises_unexpected_errors(dash_app):
+    def fail():
+        raise KeyError("bug")
+
+    with pytest.raises(KeyError):
+        dash_app._compute_all([fail])
+
+
+@pytest.mark.skipif(pyjobs.fcntl is None, reason="requires fcntl")
+def test_prefetch_runs_in_executor(dash_app, prefetch_slot):
+    done = threading.Event()
+    dash_app._prefetch([done.set])
+
+    assert done.wait(5)
+    assert prefetch_slot.acquire(timeout=5)  # released after the computes
+
+
+def test_prefetch_is_skipped_when_slots_are_busy(dash_app, prefetch_slot):
+    calls = []
+    prefetch_slot.acquire()
+    dash_app._prefetch([lambda: calls.append("computed")])
+    dash_app.PREFETCH_EXECUTOR.submit(lambda: None).result()
+
+    assert not calls
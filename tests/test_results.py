@@ -0,0 +1,59 @@
+"""Tests of the stored results reused by the downloads."""
+
+import diskcache
+import pytest
+from dash.exceptions import PreventUpdate
+import pyfunc
+import pyresults
+
+
+@pytest.fixture(autouse=True)
+def results(tmp_path, monkeypatch):
+    """An empty results storage in tmp_path."""
+    cache = diskcache.Cache(tmp_path / "results")
+    monkeypatch.setattr(pyresults, "RESULTS", cache)
+    monkeypatch.setattr(pyresults, "LOCK_DIRECTORY", tmp_path / "locks")
+    yield cache
+    cache.close()
+
+
+def test_result_is_computed_once():
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return {"value": len(calls)}
+
+    first = pyresults.get_or_compute("result", compute, "dataset", None, 0.05)
+    second = pyresults.get_or_compute("result", compute, "dataset", None, 0.05)
+
+    assert first == second == {"value": 1}
+    assert len(calls) == 1
+
+
+def test_result_key_depends_on_dataset_and_options():
+    key = pyresults.make_result_key("result", "dataset", None, 0.05)
+
+    assert key == pyresults.make_result_key("result", "dataset", None, 0.05)
+    assert key != pyresults.make_result_key("result", "dataset", None, 0.1)
+    assert key != pyresults.make_result_key("result", "other", None, 0.05)
+    assert key != pyresults.make_result_key("report", "dataset", None, 0.05)
+
+
+def test_download_reuses_stored_report(dash_app, monkeypatch, station_dataframe):
+    dataset_key = dash_app.DATASET_STORE.put(station_dataframe)
+    report = dash_app._report_statout(dataset_key, None)
+
+    def recompute(*_):
+        raise AssertionError("the report is computed again")
+
+    monkeypatch.setattr(pyfunc, "generate_report_statout", recompute)
+    download = dash_app.callback_download_stat(1, dataset_key, None)
+
+    assert download["filename"] == "STATOUT.TXT"
+    assert download["content"] == report
+
+
+def test_download_of_missing_dataset_is_prevented(dash_app):
+    with pytest.raises(PreventUpdate):
+        dash_app.callback_download_stat(1, "0" * 32, None)
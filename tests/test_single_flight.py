@@ -0,0 +1,102 @@
+"""Tests of the single flight of identical concurrent computations."""
+
+import multiprocessing
+import threading
+import time
+import diskcache
+import pytest
+import pyresults
+
+
+@pytest.fixture(autouse=True)
+def results(tmp_path, monkeypatch):
+    """An empty results storage in tmp_path."""
+    cache = diskcache.Cache(tmp_path / "results")
+    monkeypatch.setattr(pyresults, "RESULTS", cache)
+    monkeypatch.setattr(pyresults, "LOCK_DIRECTORY", tmp_path / "locks")
+    yield cache
+    cache.close()
+
+
+def _run_threads(target, count=8):
+    threads = [threading.Thread(target=target) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def test_concurrent_threads_compute_once():
+    calls, values = [], []
+
+    def compute():
+        calls.append(1)
+        time.sleep(0.05)
+        return "result"
+
+    _run_threads(
+        lambda: values.append(
+            pyresults.get_or_compute("result", compute, "dataset", None)
+        )
+    )
+
+    assert len(calls) == 1
+    assert values == ["result"] * 8
+    assert not pyresults._FLIGHTS
+    assert not list(pyresults.LOCK_DIRECTORY.glob("*.lock"))
+
+
+def test_different_keys_run_concurrently():
+    barrier = threading.Barrier(2, timeout=5)
+
+    def run(key):
+        with pyresults.single_flight(key):
+            barrier.wait()  # broken if the second key waits for the first
+
+    threads = [threading.Thread(target=run, args=(key,)) for key in "ab"]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not barrier.broken
+
+
+def test_error_releases_the_flight():
+    def fail():
+        raise ValueError("bad data")
+
+    with pytest.raises(ValueError):
+        pyresults.get_or_compute("result", fail, "dataset", None)
+
+    assert pyresults.get_or_compute("result", lambda: 1, "dataset", None) == 1
+    assert not pyresults._FLIGHTS
+
+
+def _compute_in_process(path):
+    def compute():
+        with open(path, "a", encoding="utf-8") as file:
+            file.write("computed\n")
+        time.sleep(0.2)
+        return "result"
+
+    assert pyresults.get_or_compute("result", compute, "dataset", None) == "result"
+
+
+@pytest.mark.skipif(pyresults.fcntl is None, reason="requires fcntl")
+@pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(), reason="requires fork"
+)
+def test_concurrent_processes_compute_once(tmp_path):
+    path = tmp_path / "calls.txt"
+    context = multiprocessing.get_context("fork")
+    processes = [
+        context.Process(target=_compute_in_process, args=(path,)) for _ in range(4)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join(10)
+
+    assert [process.exitcode for process in processes] == [0] * 4
+    assert path.read_text(encoding="utf-8") == "computed\n"
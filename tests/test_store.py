@@ -0,0 +1,79 @@
+"""Tests of the server-side dataset store."""
+
+import numpy as np
+import pandas as pd
+import pytest
+import pystore
+
+
+@pytest.fixture
+def store(tmp_path):
+    return pystore.DatasetStore(tmp_path, memory_items=2, disk_items=4)
+
+
+def test_put_returns_content_key(store, station_dataframe):
+    key = store.put(station_dataframe)
+    assert pystore.is_dataset_key(key)
+    assert store.get(key) is station_dataframe
+    assert store.put(station_dataframe.copy()) == key
+
+
+def test_get_reads_other_workers_datasets(store, tmp_path, station_dataframe):
+    key = store.put(station_dataframe)
+    other = pystore.DatasetStore(tmp_path)
+    pd.testing.assert_frame_equal(other.get(key), station_dataframe)
+
+
+@pytest.mark.parametrize("key", ["../planted", "0" * 39, None, ["0" * 40], "A" * 40])
+def test_invalid_keys_are_not_available(store, key):
+    assert store.get(key) is None
+    assert store.sorted_index(key, "STATION") is None
+    assert store.apply_edits(key, []) is None
+
+
+def test_disk_tier_is_bounded(store):
+    for value in range(6):
+        store.put(pd.DataFrame({"A": [float(value)]}))
+    assert len(list(store.directory.glob("*.pkl"))) == 4
+
+
+def test_sorted_index_places_missing_last(store):
+    dataframe = pd.DataFrame({"A": [3.0, np.nan, 1.0, 2.0]})
+    key = store.put(dataframe)
+    assert store.sorted_index(key, "A").tolist() == [2, 3, 0, 1]
+    assert store.sorted_index(key, "A", ascending=False).tolist() == [0, 3, 2, 1]
+    assert store.sorted_index(key, "UNKNOWN") is None
+
+
+def test_valid_edits_skip_unknown_cells(station_dataframe):
+    edits = [
+        {"row": 1, "column": "STATION", "value": "1"},
+        {"row": 60, "column": "STATION", "value": "1"},
+        {"row": -1, "column": "STATION", "value": "1"},
+        {"row": True, "column": "STATION", "value": "1"},
+        {"row": "1", "column": "STATION", "value": "1"},
+        {"row": 1, "column": "OTHER", "value": "1"},
+    ]
+    assert pystore.valid_edits(station_dataframe, edits) == edits[:1]
+
+
+def test_private_directory_rejects_shared_directory(tmp_path, monkeypatch):
+    if not hasattr(pystore.os, "getuid"):
+        pytest.skip("the directory is per user on Windows")
+    monkeypatch.setattr(pystore.tempfile, "gettempdir", lambda: str(tmp_path))
+    path = pystore.private_directory("anfrek-test")
+    assert path.stat().st_mode & 0o777 == 0o700
+
+    path.chmod(0o777)
+    with pytest.raises(PermissionError):
+        pystore.private_directory("anfrek-test")
+
+
+def test_summary_skips_edits_of_unknown_rows(dash_app):
+    _, key, _ = dash_app._parse_example()  # pylint: disable=protected-access
+    column = dash_app.DATASET_STORE.get(key).columns[0]
+    edits = [{"row": 10**6, "column": column, "value": "1"}]
+    table = dash_app.callback_table_summary(
+        key, None, edits, "2 5", "0.05", "scipy", "scipy", "scipy", "gumbel", "scipy"
+    )
+    assert all("EDIT" not in column["id"] for column in table.columns)
@@ -0,0 +1,84 @@
+"""Tests of the server-side paging, sorting and filtering of the table."""
+
+import numpy as np
+import pandas as pd
+import pytest
+import pyfunc
+import pylayoutfunc
+
+
+@pytest.fixture
+def dataframe():
+    """A small dataframe with a missing value."""
+    index = pd.date_range("2000-01-01", periods=6, freq="D", name="DATE")
+    return pd.DataFrame({"R24": [5.0, np.nan, 120.0, 30.0, 101.5, 0.0]}, index=index)
+
+
+@pytest.mark.parametrize(
+    "filter_query, rows",
+    [
+        ("{R24} > 100", [2, 4]),
+        ("{R24} >= 30 && {R24} < 120", [3, 4]),
+        ("{R24} = 0", [5]),
+        ("{R24} != 5", [1, 2, 3, 4, 5]),
+        ("{R24} contains 1", [2, 4]),
+        ("{DATE} datestartswith 2000-01-0", [0, 1, 2, 3, 4, 5]),
+        ("{DATE} > 2000-01-04", [4, 5]),
+        ("{UNKNOWN} > 1", [0, 1, 2, 3, 4, 5]),
+        (None, [0, 1, 2, 3, 4, 5]),
+    ],
+)
+def test_filter_mask(dataframe, filter_query, rows):
+    mask = pyfunc.calc_filter_mask(dataframe, filter_query)
+    assert np.flatnonzero(mask).tolist() == rows
+
+
+def test_split_filter_part_unquotes_value():
+    assert pyfunc.split_filter_part('{DATE} contains "2000"') == (
+        "DATE",
+        "contains",
+        "2000",
+    )
+    assert pyfunc.split_filter_part("no operator") == (None, None, None)
+
+
+def test_page_is_limited_to_last_page(dataframe):
+    positions, page, count = pyfunc.calc_table_page(dataframe, 10, 4)
+    assert (positions.tolist(), page, count) == ([4, 5], 1, 2)
+
+    positions, page, count = pyfunc.calc_table_page(dataframe, None, 4)
+    assert (positions.tolist(), page, count) == ([0, 1, 2, 3], 0, 2)
+
+
+def test_page_keeps_sorted_order_after_filter(dataframe):
+    order = np.array([5, 0, 3, 4, 2, 1])
+    positions, page, count = pyfunc.calc_table_page(
+        dataframe, 0, 2, order, "{R24} >= 5"
+    )
+    assert (positions.tolist(), page, count) == ([0, 3], 0, 2)
+
+
+def test_empty_filter_result_has_one_page(dataframe):
+    positions, page, count = pyfunc.calc_table_page(
+        dataframe, 3, 2, None, "{R24} > 1e9"
+    )
+    assert (positions.size, page, count) == (0, 0, 1)
+
+
+def test_layout_sends_only_first_page(station_dataframe):
+    table = pylayoutfunc.create_table_layout(station_dataframe, "table", page_size=20)
+    assert len(table.data) == 20
+    assert table.page_count == 3
+    assert table.data[0]["id"] == 0
+    assert (table.page_action, table.sort_action, table.filter_action) == (
+        "custom",
+        "custom",
+        "custom",
+    )
+
+
+def test_records_keep_row_position(station_dataframe):
+    records = pylayoutfunc.create_table_records(station_dataframe, [59, 3])
+    assert [record["id"] for record in records] == [59, 3]
+    assert records[0]["STATION"] == station_dataframe.iat[59, 0]
+    assert str(records[1]["DATE"]) == "1963-01-01"
@@ -0,0 +1,117 @@
+"""Tests of the chunked (resumable) upload."""
+
+import os
+import stat
+import time
+import flask
+import pytest
+import pyupload
+from pyconfig import appConfig
+
+UPLOAD_ID = "a1B2c3D4e5F6g7H8-file_csv"
+URL = f"/upload/{UPLOAD_ID}"
+
+
+@pytest.fixture
+def upload_directory(tmp_path, monkeypatch):
+    """The upload directory in tmp_path with chunks of 4 bytes."""
+    directory = tmp_path / "uploads"
+    monkeypatch.setattr(pyupload, "UPLOAD_DIRECTORY", directory)
+    monkeypatch.setattr(appConfig.UPLOAD, "CHUNK_SIZE", 4)
+    monkeypatch.setattr(appConfig.UPLOAD, "MAX_SIZE", 10)
+    return directory
+
+
+@pytest.fixture
+def client(upload_directory):  # pylint: disable=unused-argument
+    """A test client of a server with the upload blueprint."""
+    server = flask.Flask(__name__)
+    server.register_blueprint(pyupload.upload)
+    return server.test_client()
+
+
+def _put(client, offset, data):
+    return client.put(f"{URL}?offset={offset}", data=data)
+
+
+def test_upload_resumes_from_offset(client, upload_directory):
+    assert client.get(URL).get_json()["offset"] == 0
+    assert _put(client, 0, b"date").get_json() == {"offset": 4}
+    assert _put(client, 4, b",R24").get_json() == {"offset": 8}
+
+    status = client.get(URL).get_json()
+    assert status == {"offset": 8, "chunk_size": 4, "max_size": 10}
+    assert _put(client, 8, b"\n1").get_json() == {"offset": 10}
+    assert (upload_directory / f"{UPLOAD_ID}.part").read_bytes() == b"date,R24\n1"
+
+
+def test_retried_chunk_overwrites(client):
+    _put(client, 0, b"abcd")
+    _put(client, 4, b"efgh")
+    assert _put(client, 4, b"EF").get_json() == {"offset": 6}
+    assert pyupload.upload_path(UPLOAD_ID).read_bytes() == b"abcdEF"
+
+
+@pytest.mark.parametrize(
+    "offset, data, status",
+    [
+        (8, b"ab", 409),
+        (0, b"abcde", 413),
+        (-1, b"ab", 400),
+        ("x", b"ab", 400),
+    ],
+)
+def test_invalid_chunk(client, offset, data, status):
+    _put(client, 0, b"abcd")
+    response = _put(client, offset, data)
+
+    assert response.status_code == status
+    assert response.get_json()["offset"] == 4
+
+
+def test_upload_too_large(client):
+    for offset in range(0, 8, 4):
+        _put(client, offset, b"abcd")
+    response = _put(client, 8, b"abc")
+
+    assert response.status_code == 413
+    assert response.get_json() == {"error": "File is too large.", "offset": 8}
+
+
+@pytest.mark.parametrize(
+    "upload_id", ["short", "../../etc/passwd-1234567890", "a" * 129]
+)
+def test_invalid_upload_id(client, upload_id):
+    response = client.put(f"/upload/{upload_id}?offset=0", data=b"ab")
+    assert response.status_code in (400, 404)
+    with pytest.raises(pyupload.UploadError):
+        pyupload.upload_path(upload_id)
+
+
+@pytest.mark.skipif(os.name != "posix", reason="POSIX permissions")
+def test_upload_is_private(client, upload_directory):
+    _put(client, 0, b"abcd")
+
+    assert stat.S_IMODE(upload_directory.stat().st_mode) == 0o700
+    assert stat.S_IMODE(pyupload.upload_path(UPLOAD_ID).stat().st_mode) == 0o600
+
+
+def test_remove_upload(client):
+    _put(client, 0, b"abcd")
+    pyupload.remove_upload(UPLOAD_ID)
+    pyupload.remove_upload(UPLOAD_ID)
+
+    assert client.get(URL).get_json()["offset"] == 0
+
+
+def test_expired_uploads_are_removed(client, upload_directory, monkeypatch):
+    monkeypatch.setattr(appConfig.UPLOAD, "EXPIRE", 60)
+    _put(client, 0, b"abcd")
+    old = upload_directory / "b1B2c3D4e5F6g7H8-old.part"
+    old.write_bytes(b"old")
+    os.utime(old, (time.time() - 120, time.time() - 120))
+
+    client.get(URL)
+
+    assert not old.exists()
+    assert pyupload.upload_path(UPLOAD_ID).exists()
@@ -0,0 +1,96 @@
+"""Tests of the parse cache of the uploads (by content hash)."""
+
+import pytest
+import pycache
+import pystore
+
+
+@pytest.fixture
+def app_cache(dash_app, tmp_path, monkeypatch):
+    """The app with an empty upload cache and dataset store."""
+    monkeypatch.setattr(dash_app, "DATASET_STORE", pystore.DatasetStore(tmp_path))
+    dash_app.UPLOAD_CACHE.clear()
+    yield dash_app
+    dash_app.UPLOAD_CACHE.clear()
+
+
+def _counting_parse(dataframe, calls):
+    def parse():
+        calls.append(1)
+        return None, dataframe
+
+    return parse
+
+
+def test_same_content_is_parsed_once(app_cache, station_dataframe):
+    calls = []
+    parse = _counting_parse(station_dataframe, calls)
+
+    first = app_cache._parse_upload("content", "a.csv", {}, parse)
+    second = app_cache._parse_upload("content", "B.CSV", {}, parse)
+
+    assert len(calls) == 1
+    assert first[0] is None and first[1] == second[1]
+    assert second[2] is first[2]
+    assert app_cache.DATASET_STORE.get(first[1]) is not None
+
+
+@pytest.mark.parametrize(
+    "content_key, filename, options",
+    [
+        ("other", "a.csv", {}),
+        ("content", "a.parquet", {}),
+        ("content", "a.csv", {"annual_maximum": True}),
+    ],
+)
+def test_key_depends_on_content_extension_and_options(
+    app_cache, station_dataframe, content_key, filename, options
+):
+    calls = []
+    parse = _counting_parse(station_dataframe, calls)
+
+    app_cache._parse_upload("content", "a.csv", {}, parse)
+    app_cache._parse_upload(content_key, filename, options, parse)
+
+    assert len(calls) == 2
+
+
+def test_invalid_upload_is_not_cached(app_cache):
+    calls = []
+
+    def parse():
+        calls.append(1)
+        return "There was an error processing this file.", None
+
+    for _ in range(2):
+        assert app_cache._parse_upload("bad", "a.csv", {}, parse) == (
+            "There was an error processing this file.",
+            None,
+            None,
+        )
+    assert len(calls) == 2
+
+
+def test_evicted_dataset_is_stored_again(
+    app_cache, station_dataframe, tmp_path, monkeypatch
+):
+    parse = _counting_parse(station_dataframe, [])
+    _, dataset_key, _ = app_cache._parse_upload("content", "a.csv", {}, parse)
+
+    store = pystore.DatasetStore(tmp_path / "other")
+    monkeypatch.setattr(app_cache, "DATASET_STORE", store)
+    assert store.get(dataset_key) is None
+
+    assert app_cache._parse_upload("content", "a.csv", {}, parse)[1] == dataset_key
+    assert store.get(dataset_key) is not None
+
+
+def test_example_is_parsed_once(app_cache):
+    first = app_cache._parse_example()
+    assert app_cache._parse_example()[2] is first[2]
+
+
+def test_file_hash_equals_bytes_hash(tmp_path):
+    path = tmp_path / "upload.part"
+    path.write_bytes(b"DATE,R24\n2000-01-01,10\n" * 1000)
+    assert pycache.hash_file(path) == pycache.hash_bytes(path.read_bytes())
@@ -0,0 +1,57 @@
+"""Tests of the warm start of the example dataset."""
+
+import diskcache
+import pytest
+import pycache
+import pyjobs
+import pyresults
+
+
+@pytest.fixture
+def results(dash_app, tmp_path, monkeypatch):
+    """Empty results storages in tmp_path."""
+    cache = diskcache.Cache(tmp_path / "results")
+    monkeypatch.setattr(pyresults, "RESULTS", cache)
+    monkeypatch.setattr(pyresults, "FIGURES", pycache.LRUCache(maxsize=16))
+    monkeypatch.setattr(pyresults, "LOCK_DIRECTORY", tmp_path / "locks")
+    monkeypatch.setattr(pyjobs, "JOBS_DIRECTORY", tmp_path / "jobs")
+    yield cache
+    cache.close()
+
+
+def _default_options(dash_app):
+    freq_options = [dash_app.app.layout[i].value for i in dash_app.FREQ_OPTION_IDS]
+    fit_options = [dash_app.app.layout[i].value for i in dash_app.FIT_OPTION_IDS]
+    return freq_options, fit_options + freq_options[1:5]
+
+
+def test_example_results_are_stored(dash_app, results, monkeypatch):
+    dash_app.warm_example()
+    _, dataset_key, _ = dash_app._parse_example()
+    freq_options, fit_options = _default_options(dash_app)
+
+    def load_dataframe(*_):
+        raise AssertionError("the result is calculated again")
+
+    # served from the disk storage, as in another worker
+    pyresults.FIGURES.clear()
+    monkeypatch.setattr(dash_app, "_load_dataframe", load_dataframe)
+
+    assert dash_app._figure_stat("row-stat-statistics", dataset_key, None)["data"]
+    assert dash_app._figure_stat("row-stat-distribution", dataset_key, None)["data"]
+    assert dash_app._figure_freq(dataset_key, None, *freq_options)["data"]
+    for container in dash_app.FIT_FIGURES:
+        assert dash_app._figure_fit(container, dataset_key, None, *fit_options)["data"]
+    assert dash_app._report_statout(dataset_key, None)
+    assert not dash_app._result_freq(dataset_key, None, *freq_options).empty
+    assert len(dash_app._report_fit(dataset_key, None, *fit_options)) == 3
+
+
+def test_example_is_warmed_by_one_worker(dash_app, results, monkeypatch):
+    dash_app.warm_example()
+
+    calls = []
+    monkeypatch.setattr(dash_app, "_compute_all", calls.append)
+    dash_app.warm_example()
+
+    assert not calls